@@ -1,10 +1,15 @@
 import streamlit as st
-import time
 from common.async_manager import analysis_manager
+from UI.config import env_config
 
 
+@st.fragment(run_every=env_config['ui_refresh_interval'])
 def show_async_progress(category: str):
-    """비동기 분석 진행 상황 표시"""
+    """비동기 분석 진행 상황 표시 (이 영역만 주기적으로 다시 그림)"""
+    # 분석이 끝났으면 결과를 다시 그리도록 페이지 전체 갱신
+    if not analysis_manager.is_running(category):
+        st.rerun(scope="app")
+
     progress_data = analysis_manager.get_progress(category)
 
     if not progress_data:
@@ -40,12 +45,7 @@ def show_async_progress(category: str):
         if st.button("⏹️ 분석 중단", key=f"stop_{category}"):
             analysis_manager.stop_analysis(category)
             st.warning("⚠️ 분석이 중단되었습니다.")
-            st.rerun()
-
-        # 자동 새로고침을 위한 재실행
-        if completed < total:
-            time.sleep(1)
-            st.rerun()
+            st.rerun(scope="app")
 
         return True
 
@@ -70,9 +70,9 @@ def show_async_analysis_controls(dump_path: str, selected_category: str, max_wor
     is_running = analysis_manager.is_running(selected_category)
 
     if is_running:
-        # 진행 상황 표시
-        if show_async_progress(selected_category):
-            return True  # 아직 실행 중
+        # 진행 상황 표시 (갱신은 진행 영역 안에서만 일어남)
+        show_async_progress(selected_category)
+        return True  # 아직 실행 중
     else:
         # 분석 시작 버튼
         if st.button("🚀 비동기 분석 시작", use_container_width=True, type="primary"):
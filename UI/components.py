@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from UI.result_viewer import show_result_table, show_export_controls
+from common.result_transport import make_handle
 
 
 def show_resource_monitoring(analysis_manager, category: str):
@@ -52,9 +53,8 @@ def show_resource_monitoring(analysis_manager, category: str):
             )
 
         # 리소스 사용률 그래프 (선택적)
-        progress_data = analysis_manager.get_progress(category)
-        cpu_history = progress_data.get('cpu_usage', [])
-        memory_history = progress_data.get('memory_usage', [])
+        cpu_history = resource_info.get('cpu_history', [])
+        memory_history = resource_info.get('memory_history', [])
 
         if len(cpu_history) > 1:
             with st.expander("📈 리소스 사용률 그래프", expanded=False):
@@ -110,12 +110,14 @@ def show_analysis_result(result_data, plugin_name: str, label: str, category: st
         st.code(error_msg.replace("[CACHED] ", ""))
         return
 
-    if result_data["status"] != "success" or "result" not in result_data:
+    if result_data["status"] != "success" or ("result" not in result_data and "frame" not in result_data):
         st.error(f"❌ {label} 분석 실패: 데이터가 없습니다.")
         return
 
-    # 결과 데이터 처리
-    result = result_data["result"]
+    # 결과 데이터 처리 (컬럼형 캐시는 DataFrame으로 제공)
+    result = result_data.get("frame")
+    if result is None:
+        result = result_data["result"]
 
     # 성공 메시지 (캐시 상태 포함)
     if from_cache:
@@ -126,23 +128,17 @@ def show_analysis_result(result_data, plugin_name: str, label: str, category: st
 
     # JSON 결과를 DataFrame으로 변환 시도
     try:
-        if isinstance(result, list) and len(result) > 0:
-            df = pd.DataFrame(result)
+        if isinstance(result, pd.DataFrame) or (isinstance(result, list) and len(result) > 0):
+            df = result if isinstance(result, pd.DataFrame) else pd.DataFrame(result)
             st.write(f"📊 **{len(df)}개 항목**")
-            st.dataframe(df, height=400)
+            source = make_handle(result_data)
+            view_key = f"{category or pid or 'result'}_{plugin_name}"
+            show_result_table(df, key=f"view_{view_key}", source=source)
 
-            # CSV 다운로드 버튼
-            csv_data = df.to_csv(index=False)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # 내보내기 (요청 시에만 파일 생성)
             cache_suffix = "_cached" if from_cache else ""
-            filename = f"{plugin_name}_{timestamp}{cache_suffix}.csv"
-
-            st.download_button(
-                label="💾 CSV 다운로드",
-                data=csv_data,
-                file_name=filename,
-                mime="text/csv"
-            )
+            show_export_controls(df, key=f"download_{view_key}", file_stem=f"{plugin_name}{cache_suffix}",
+                                 source=source)
         else:
             st.json(result)
     except Exception as e:
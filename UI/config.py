@@ -1,9 +1,23 @@
 import json
-import streamlit as st
 import os
+import sys
+import psutil
 from pathlib import Path
 
 
+def _report_error(message: str):
+    """설정 로드 오류 표시 (Streamlit 앱 실행 중이면 화면에, 헤드리스 실행이면 표준 오류로)"""
+    try:
+        import streamlit as st
+        from streamlit import runtime
+        if runtime.exists():
+            st.error(message)
+            return
+    except ImportError:
+        pass
+    print(message, file=sys.stderr)
+
+
 def load_plugin_categories():
     """JSON 파일에서 플러그인 카테고리 설정을 로드"""
     try:
@@ -24,13 +38,24 @@ def load_plugin_categories():
             return data
 
     except FileNotFoundError:
-        st.error("❌ resources/plugins.json 파일을 찾을 수 없습니다.")
+        _report_error("❌ resources/plugins.json 파일을 찾을 수 없습니다.")
         return {}
     except json.JSONDecodeError:
-        st.error("❌ plugins.json 파일 형식이 올바르지 않습니다.")
+        _report_error("❌ plugins.json 파일 형식이 올바르지 않습니다.")
         return {}
     except Exception as e:
-        st.error(f"❌ 플러그인 설정 로드 중 오류 발생: {str(e)}")
+        _report_error(f"❌ 플러그인 설정 로드 중 오류 발생: {str(e)}")
+        return {}
+
+
+def load_plugin_category_ids():
+    """카테고리 ID -> 카테고리 제목 (헤드리스 실행에서 카테고리 지정용, 기존 구조는 빈 dict)"""
+    try:
+        with open("resources/plugins.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {category_id: category_data["title"]
+                for category_id, category_data in data.get("categories", {}).items()}
+    except Exception:
         return {}
 
 
@@ -57,13 +82,13 @@ def load_pid_plugin_categories():
             return []
 
     except FileNotFoundError:
-        st.error("❌ resources/pid_plugins.json 파일을 찾을 수 없습니다.")
+        _report_error("❌ resources/pid_plugins.json 파일을 찾을 수 없습니다.")
         return []
     except json.JSONDecodeError:
-        st.error("❌ pid_plugins.json 파일 형식이 올바르지 않습니다.")
+        _report_error("❌ pid_plugins.json 파일 형식이 올바르지 않습니다.")
         return []
     except Exception as e:
-        st.error(f"❌ PID 플러그인 설정 로드 중 오류 발생: {str(e)}")
+        _report_error(f"❌ PID 플러그인 설정 로드 중 오류 발생: {str(e)}")
         return []
 
 
@@ -72,7 +97,29 @@ def get_env_config():
     config = {
         'vol_path': './volatility3/vol.py',
         'default_cores': 1,
-        'output_path': './output'
+        'output_path': './output',
+        # Volatility 실행 백엔드: subprocess (vol.py 실행) / inprocess (프레임워크 직접 호출)
+        # / pool (덤프별로 워밍된 워커 프로세스 풀)
+        'vol_backend': os.environ.get('VOL_BACKEND', 'subprocess'),
+        # 플러그인 실행 제한 시간 (초) - 실행 이력이 부족할 때의 기본값과 적응형 제한 시간의 상한
+        'vol_timeout': float(os.environ.get('VOL_TIMEOUT', 600)),
+        'vol_timeout_max': float(os.environ.get('VOL_TIMEOUT_MAX', 7200)),
+        'pool_idle_timeout': 600,
+        'pool_memory_threshold': 90,
+        # 덤프 적용 시 전체 SHA-256을 백그라운드에서 계산
+        'full_sha256': os.environ.get('FULL_SHA256', '0') == '1',
+        # 컬럼형 캐시 압축 (zstd / lz4 / 빈 값이면 무압축 - 무압축은 메모리 매핑 시 복사 없음)
+        'cache_compression': os.environ.get('CACHE_COMPRESSION', 'zstd') or None,
+        # 캐시 용량 한도 (MB, 기본 0 = 무제한 - 설정하면 초과 시 정리)와 정리 정책 (lru / lfu)
+        'cache_max_mb': float(os.environ.get('CACHE_MAX_MB', 0)),
+        'cache_eviction': os.environ.get('CACHE_EVICTION', 'lru'),
+        # 동시에 실행할 수 있는 Volatility 작업 수 (모든 카테고리 합산)
+        'max_concurrent_jobs': int(os.environ.get('MAX_CONCURRENT_JOBS', 0)) or os.cpu_count() or 1,
+        # 동시에 실행 중인 작업들의 예상 메모리 합계 한도 (MB, 0이면 물리 메모리의 70%)
+        'memory_budget_mb': float(os.environ.get('MEMORY_BUDGET_MB', 0))
+                            or psutil.virtual_memory().total * 0.7 / (1024 * 1024),
+        # 분석 중 진행 상황 영역의 갱신 간격 (초, 해당 영역만 다시 그림)
+        'ui_refresh_interval': float(os.environ.get('UI_REFRESH_INTERVAL', 1))
     }
 
     # 출력 디렉토리 생성
@@ -84,5 +131,6 @@ def get_env_config():
 
 # 전역 설정 로드
 plugin_categories = load_plugin_categories()
+plugin_category_ids = load_plugin_category_ids()
 pid_plugin_categories = load_pid_plugin_categories()
 env_config = get_env_config()
\ No newline at end of file
@@ -1,6 +1,9 @@
+import os
 import streamlit as st
+import pandas as pd
 from UI.config import plugin_categories, pid_plugin_categories
 from UI.components import show_analysis_result, show_analysis_hints
+from UI.result_viewer import show_result_table, show_export_controls
 from common.async_manager import analysis_manager
 
 
@@ -17,9 +20,21 @@ def show_plugin_tabs(dump_path: str, selected_category: str):
 
     if not is_async_running and not st.session_state.get("analysis_running", False):
         # 분석 시작 버튼
-        col1, col2 = st.columns([3, 1])
+        col1, col2, col3 = st.columns([2, 1, 1])
         with col1:
             st.info(f"**{selected_category}** 카테고리의 모든 플러그인을 실행합니다.")
+        with col3:
+            # 모든 카테고리를 중복 없이 한 번에 실행 (결과는 각 카테고리 탭에 표시)
+            if st.button("🧭 전체 분석", use_container_width=True, help="모든 카테고리의 플러그인을 한 번에 실행합니다"):
+                if dump_path:
+                    if analysis_manager.start_full_triage(dump_path):
+                        st.session_state["analysis_running"] = True
+                        st.success("🔄 백그라운드에서 전체 분석을 시작했습니다!")
+                        st.rerun()
+                    else:
+                        st.warning("⚠️ 분석을 시작할 수 없습니다. 시스템 상태를 확인하세요.")
+                else:
+                    st.error("❌ 먼저 메모리 덤프 파일을 설정하세요")
         with col2:
             max_workers = st.session_state.get("max_workers", 1)
             if st.button("🚀 카테고리 분석 시작", type="primary", use_container_width=True):
@@ -40,7 +55,13 @@ def show_plugin_tabs(dump_path: str, selected_category: str):
 
     st.divider()
 
-    # 개별 플러그인 탭 생성
+    # 개별 플러그인 탭 (선택된 탭만 그림 - st.tabs는 모든 탭 내용을 매번 생성)
+    plugin_data = select_plugin_tab(plugins, key=f"active_tab_{selected_category}")
+    show_individual_plugin_tab(dump_path, plugin_data, selected_category)
+
+
+def select_plugin_tab(plugins: list, key: str):
+    """탭 선택 바를 표시하고 선택된 플러그인 데이터 반환"""
     tab_names = []
     for plugin_data in plugins:
         if isinstance(plugin_data, dict):
@@ -49,11 +70,9 @@ def show_plugin_tabs(dump_path: str, selected_category: str):
             emoji, title, _ = plugin_data
             tab_names.append(f"{emoji} {title}")
 
-    tabs = st.tabs(tab_names)
-
-    for i, (plugin_data, tab) in enumerate(zip(plugins, tabs)):
-        with tab:
-            show_individual_plugin_tab(dump_path, plugin_data, selected_category)
+    index = st.radio("플러그인", range(len(plugins)), format_func=lambda i: tab_names[i],
+                     horizontal=True, label_visibility="collapsed", key=key)
+    return plugins[index]
 
 
 def show_individual_plugin_tab(dump_path: str, plugin_data: dict, category: str):
@@ -84,25 +103,27 @@ def show_individual_plugin_tab(dump_path: str, plugin_data: dict, category: str)
                 st.code(error)
         elif df is not None:
             st.success(f"✅ {label} 완료: {len(df)}개 항목")
-            st.dataframe(df, height=400)
-
-            # CSV 다운로드 버튼
-            from datetime import datetime
-            csv_data = df.to_csv(index=False)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{plugin_name}_{timestamp}.csv"
-
-            st.download_button(
-                label="💾 CSV 다운로드",
-                data=csv_data,
-                file_name=filename,
-                mime="text/csv",
-                key=f"download_{category}_{plugin_name}"
-            )
+            source = analysis_manager.get_result_source(category, plugin_name)
+            show_result_table(df, key=f"view_{category}_{plugin_name}", source=source)
+
+            # 내보내기 (요청 시에만 파일 생성)
+            show_export_controls(df, key=f"download_{category}_{plugin_name}", file_stem=plugin_name, source=source)
         else:
             st.info("🔄 분석 결과를 기다리는 중...")
     else:
-        st.info("🔄 카테고리 분석을 시작하여 결과를 확인하세요.")
+        # 실행 중인 플러그인은 지금까지 수신한 행을 먼저 표시
+        partial_df, received_rows, stopped = analysis_manager.get_partial_result(category, plugin_name)
+        if partial_df is not None:
+            if stopped:
+                st.warning(f"⏹️ {label} 중단됨: 중단 전까지 수신한 {received_rows:,}개 항목 (부분 결과)")
+                if received_rows > len(partial_df):
+                    st.caption(f"처음 {len(partial_df):,}개 항목만 미리보기로 표시합니다.")
+                show_result_table(partial_df, key=f"view_partial_{category}_{plugin_name}")
+            else:
+                # 수신 중인 행은 진행 상황 영역의 실시간 미리보기에서 갱신 (페이지 전체를 다시 그리지 않음)
+                st.info(f"⏳ {label} 실행 중: 진행 상황 영역에서 수신 중인 행을 미리 볼 수 있습니다.")
+        else:
+            st.info("🔄 카테고리 분석을 시작하여 결과를 확인하세요.")
 
 
 def show_pid_analysis(dump_path: str):
@@ -113,12 +134,13 @@ def show_pid_analysis(dump_path: str):
     # 분석 실행 상태 확인
     analysis_running = st.session_state.get("analysis_running", False)
 
-    # PID 입력
+    # PID 입력 (여러 개는 쉼표/공백으로 구분) 또는 프로세스 목록에서 선택
     col1, col2 = st.columns([3, 1])
     with col1:
-        pid = st.text_input(
+        pid_input = st.text_input(
             "🎯 분석할 PID 입력",
-            placeholder="예: 1234",
+            placeholder="예: 1234, 5678",
+            help="여러 PID는 쉼표나 공백으로 구분합니다",
             disabled=analysis_running
         )
     with col2:
@@ -130,42 +152,105 @@ def show_pid_analysis(dump_path: str):
             disabled=analysis_running
         )
 
+    process_options = get_process_options(dump_path) if dump_path else {}
+    selected_processes = []
+    if process_options:
+        selected_processes = st.multiselect(
+            "또는 프로세스 목록에서 선택",
+            list(process_options.keys()),
+            disabled=analysis_running
+        )
+
     if analysis_running:
         return
 
-    if not analyze_pid:
+    if analyze_pid:
+        if not dump_path:
+            st.error("❌ 먼저 메모리 덤프 파일을 설정하세요")
+            return
+
+        tokens = pid_input.replace(",", " ").split()
+        if any(not token.isdigit() for token in tokens):
+            st.error("❌ 유효한 PID를 입력하세요")
+            return
+
+        pids = list(dict.fromkeys(tokens + [process_options[name] for name in selected_processes]))
+        if not pids:
+            st.error("❌ 유효한 PID를 입력하세요")
+            return
+
+        # PID 플러그인 설정 확인
+        if not pid_plugin_categories:
+            st.error("❌ PID 플러그인 설정을 로드할 수 없습니다")
+            return
+
+        run_pid_batch_analysis(dump_path, pids)
+
+    pids = st.session_state.get("pid_targets", [])
+    if not pids:
         st.markdown("💡 **사용법:** 먼저 일반 분석에서 프로세스 목록을 확인한 후, 의심스러운 프로세스의 PID를 입력하세요.")
         return
 
-    if not dump_path:
-        st.error("❌ 먼저 메모리 덤프 파일을 설정하세요")
-        return
+    # 결과를 볼 PID 선택
+    pid = st.selectbox("📋 결과를 볼 PID", pids) if len(pids) > 1 else pids[0]
+    st.success(f"🎯 PID {pid}에 대한 상세 분석 결과입니다.")
 
-    if not pid or not pid.isdigit():
-        st.error("❌ 유효한 PID를 입력하세요")
-        return
+    # PID 플러그인 탭들 (선택된 탭만 그림)
+    plugin_data = select_plugin_tab(pid_plugin_categories, key="active_tab_pid")
+    show_pid_plugin_tab(dump_path, plugin_data, pid)
 
-    # PID 플러그인 탭 생성
-    if not pid_plugin_categories:
-        st.error("❌ PID 플러그인 설정을 로드할 수 없습니다")
-        return
 
-    st.success(f"🎯 PID {pid}에 대한 상세 분석을 시작합니다.")
+def get_process_options(dump_path: str) -> dict:
+    """캐시된 프로세스 목록(pslist)에서 선택지 생성 ("PID - 이름" -> PID)"""
+    from common.cache_manager import simple_cache
+
+    # 프레임은 읽지 않고 Arrow 파일 경로만 조회 (매 rerun마다 전체 결과를 올리지 않음)
+    cached = simple_cache.get(dump_path, "windows.pslist", load_frame=False)
+    table_path = cached.get("table_path") if cached else None
+    if not table_path:
+        return {}
+    try:
+        modified = os.path.getmtime(table_path)
+    except OSError:
+        return {}
+    return _load_process_options(table_path, modified)
 
-    # PID 플러그인 탭들
-    tab_names = []
-    for plugin_data in pid_plugin_categories:
-        if isinstance(plugin_data, dict):
-            tab_names.append(f"{plugin_data['emoji']} {plugin_data['label']}")
-        else:
-            emoji, title, _ = plugin_data
-            tab_names.append(f"{emoji} {title}")
 
-    tabs = st.tabs(tab_names)
+@st.cache_data(show_spinner=False, max_entries=16)
+def _load_process_options(table_path: str, modified: float) -> dict:
+    """Arrow 결과에서 PID/ImageFileName 컬럼만 읽어 선택지 생성 (파일 경로 + 수정 시각으로 메모이즈)"""
+    from common.cache_manager import read_table_file
 
-    for plugin_data, tab in zip(pid_plugin_categories, tabs):
-        with tab:
-            show_pid_plugin_tab(dump_path, plugin_data, pid)
+    table = read_table_file(table_path)
+    if "PID" not in table.column_names:
+        return {}
+    name_column = "ImageFileName" if "ImageFileName" in table.column_names else None
+    df = table.select(["PID"] + ([name_column] if name_column else [])).to_pandas()
+
+    pids = pd.to_numeric(df["PID"], errors="coerce")
+    valid = pids.notna()
+    pids = pids[valid].astype("int64").astype(str)
+    labels = pids + " - " + df.loc[valid, name_column].astype(str) if name_column else pids
+    return dict(zip(labels, pids))
+
+
+def run_pid_batch_analysis(dump_path: str, pids: list):
+    """모든 PID 플러그인을 PID 목록 전체로 한 번씩 실행하고 PID별 결과 저장"""
+    from common.scheduler import job_scheduler
+
+    commands = [plugin_data['command'] if isinstance(plugin_data, dict) else plugin_data[2]
+                for plugin_data in pid_plugin_categories]
+
+    with st.spinner(f"PID {len(pids)}개에 대해 {len(commands)}개 플러그인 분석 중..."):
+        batch_results = job_scheduler.run_pid_batch(
+            dump_path, commands, pids, st.session_state.get("max_workers", 1)
+        )
+
+    for command, results in batch_results.items():
+        for pid, result in results.items():
+            st.session_state[f"result_pid_{pid}_{command}"] = result
+
+    st.session_state["pid_targets"] = pids
 
 
 def show_pid_plugin_tab(dump_path: str, plugin_data: dict, pid: str):
@@ -195,21 +280,10 @@ def show_pid_plugin_tab(dump_path: str, plugin_data: dict, pid: str):
             st.code(error)
         elif df is not None:
             st.success(f"✅ PID {pid} {label} 완료: {len(df)}개 항목")
-            st.dataframe(df, height=400)
+            show_result_table(df, key=f"view_pid_{pid}_{plugin_name}")
 
-            # CSV 다운로드 버튼
-            from datetime import datetime
-            csv_data = df.to_csv(index=False)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"PID_{pid}_{plugin_name}_{timestamp}.csv"
-
-            st.download_button(
-                label="💾 CSV 다운로드",
-                data=csv_data,
-                file_name=filename,
-                mime="text/csv",
-                key=f"download_pid_{pid}_{plugin_name}"
-            )
+            # 내보내기 (요청 시에만 파일 생성)
+            show_export_controls(df, key=f"download_pid_{pid}_{plugin_name}", file_stem=f"PID_{pid}_{plugin_name}")
 
 
 def run_pid_analysis(dump_path: str, command: str, label: str, pid: str):
@@ -242,4 +316,8 @@ def show_main_content(dump_path: str, analysis_mode: str, selected_category: str
             st.info("사이드바에서 분석 카테고리를 선택하세요.")
 
     elif analysis_mode == "🎯 PID 분석":
-        show_pid_analysis(dump_path)
\ No newline at end of file
+        show_pid_analysis(dump_path)
+
+    elif analysis_mode == "🧮 SQL 질의":
+        from UI.querySection import show_query_section
+        show_query_section(dump_path)
\ No newline at end of file
@@ -1,6 +1,8 @@
 import streamlit as st
 import os
 from UI.config import plugin_categories, env_config
+from common.async_manager import analysis_manager
+from common.resource_sampler import resource_sampler
 
 
 def setup_sidebar():
@@ -22,6 +24,9 @@ def setup_sidebar():
         if st.button("경로 적용", use_container_width=True, disabled=analysis_running):
             if dump_path_input and os.path.exists(dump_path_input):
                 st.session_state["dump_path"] = dump_path_input
+                if env_config.get('full_sha256'):
+                    from common.cache_manager import simple_cache
+                    simple_cache.fingerprints.request_full_hash(dump_path_input)
                 st.success("✅ 파일 경로가 적용되었습니다!")
                 st.rerun()
             elif dump_path_input:
@@ -29,25 +34,46 @@ def setup_sidebar():
             else:
                 st.warning("⚠️ 파일 경로를 입력하세요")
 
+        # 캐시된 모든 결과에서 검색 (덤프를 지정하지 않아도 사용 가능)
+        st.text_input(
+            "🔎 전체 검색",
+            key="ioc_query",
+            placeholder="IP, 경로, 해시, 뮤텍스 이름...",
+            help="캐시된 모든 덤프의 플러그인 결과에서 검색합니다. 비우면 분석 화면으로 돌아갑니다"
+        )
+
+        # 전체 해시 (백그라운드 계산 완료 시 표시)
+        current_dump = st.session_state.get("dump_path", "")
+        if env_config.get('full_sha256') and current_dump and os.path.exists(current_dump):
+            from common.cache_manager import simple_cache
+            sha256 = simple_cache.fingerprints.get_sha256(current_dump)
+            st.caption(f"🔐 SHA-256: `{sha256}`" if sha256 else "🔐 SHA-256 계산 중...")
+
         st.divider()
 
         # 분석 모드 선택
         st.subheader("🔧 분석 모드")
         analysis_mode = st.selectbox(
             "모드 선택",
-            ["🔍 일반 분석", "🎯 PID 분석"],
+            ["🔍 일반 분석", "🎯 PID 분석", "🧮 SQL 질의"],
             help="원하는 분석 방식을 선택하세요",
             disabled=analysis_running
         )
 
+        # 실행 중인 모든 분석과 백그라운드 작업 중단
+        if analysis_running and st.button("⏹️ 모든 분석 중단", use_container_width=True):
+            analysis_manager.stop_all()
+            st.rerun()
+
         selected_category = None
         # 일반 분석 모드일 때 카테고리 선택
         if analysis_mode == "🔍 일반 분석":
+            # 전체 분석 중에는 카테고리를 바꿔가며 도착한 결과 확인 가능
             selected_category = st.selectbox(
                 "카테고리 선택",
                 list(plugin_categories.keys()),
                 help="분석할 카테고리를 선택하세요",
-                disabled=analysis_running
+                disabled=analysis_running and not analysis_manager.is_triage_running()
             )
 
         st.divider()
@@ -61,7 +87,7 @@ def setup_sidebar():
             st.metric("CPU 코어", os.cpu_count() or "N/A")
         with col2:
             try:
-                cpu_percent = psutil.cpu_percent(interval=0.1)
+                cpu_percent, _ = resource_sampler.latest()
                 st.metric("CPU 사용률", f"{cpu_percent:.1f}%")
             except:
                 st.metric("CPU 사용률", "N/A")
@@ -87,7 +113,30 @@ def setup_sidebar():
             with col2:
                 st.metric("크기", f"{stats['size_mb']:.1f}MB")
 
-            if st.button("🗑️ 정리"):
+            if stats.get('max_mb'):
+                st.progress(min(stats['size_mb'] / stats['max_mb'], 1.0),
+                            text=f"한도 {stats['max_mb'] / 1024:.1f}GB")
+
+            # 덤프/플러그인 단위 선택 정리
+            with st.expander("선택 정리", expanded=False):
+                dumps = simple_cache.manifest.list_dumps()
+                dump_labels = {
+                    f"{name or (fingerprint or '알 수 없음')[:12]} ({count}개, {(size or 0) / (1024 * 1024):.1f}MB)": fingerprint
+                    for fingerprint, name, count, size in dumps
+                }
+                selected_dump = st.selectbox("덤프", ["전체"] + list(dump_labels.keys()), key="purge_dump")
+                dump_fingerprint = dump_labels.get(selected_dump)
+
+                plugins = [plugin for plugin, _, _ in simple_cache.manifest.list_plugins(dump_fingerprint)]
+                selected_plugin = st.selectbox("플러그인", ["전체"] + plugins, key="purge_plugin")
+                plugin = None if selected_plugin == "전체" else selected_plugin
+
+                if st.button("🧹 선택 항목 정리", disabled=dump_fingerprint is None and plugin is None):
+                    purged = simple_cache.purge(dump_fingerprint, plugin)
+                    st.success(f"✅ {purged}개 정리됨")
+                    st.rerun()
+
+            if st.button("🗑️ 전체 정리"):
                 cleared = simple_cache.clear()
                 st.success(f"✅ {cleared}개 정리됨")
                 st.rerun()
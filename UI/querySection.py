@@ -0,0 +1,86 @@
+import streamlit as st
+from common.sql_engine import sql_engine, load_saved_queries, save_query, delete_query
+from UI.result_viewer import show_result_table, show_export_controls
+
+NEW_QUERY = "(새 질의)"
+
+
+def show_query_section(dump_path: str):
+    """플러그인 결과 SQL 질의 (여러 플러그인 결과 조인/집계)"""
+    st.header("🧮 SQL 질의")
+    st.info(f"캐시된 플러그인 결과를 테이블로 불러와 질의합니다. (엔진: {sql_engine.engine_name})")
+
+    try:
+        with st.spinner("플러그인 결과 불러오는 중..."):
+            database = sql_engine.get_database(dump_path)
+        tables = database.list_tables()
+    except Exception as e:
+        st.error(f"❌ 질의 데이터베이스를 열 수 없습니다: {e}")
+        return
+
+    if not tables:
+        st.warning("⚠️ 불러올 결과가 없습니다. 먼저 일반 분석에서 플러그인을 실행하세요.")
+        return
+
+    # 테이블 목록
+    with st.expander(f"📚 테이블 ({len(tables)}개)", expanded=False):
+        for table_name, plugin, row_count, columns in tables:
+            st.markdown(f"**{table_name}** · `{plugin}` · {row_count:,}행")
+            st.caption(", ".join(columns))
+
+    # 저장된 질의 선택
+    saved_queries = {query["name"]: query["sql"] for query in load_saved_queries()}
+    pending = st.session_state.pop("sql_pending_select", None)
+    if pending is not None:
+        # 저장/삭제 직후에는 해당 질의를 선택 상태로 (편집 중인 내용은 유지)
+        st.session_state["sql_saved_query"] = pending
+        st.session_state["sql_loaded_query"] = pending
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        selected = st.selectbox("📁 저장된 질의", [NEW_QUERY] + list(saved_queries), key="sql_saved_query")
+    with col2:
+        st.write("")  # 공간 조정
+        if selected != NEW_QUERY and st.button("🗑️ 삭제", use_container_width=True):
+            delete_query(selected)
+            st.session_state["sql_pending_select"] = NEW_QUERY
+            st.rerun()
+
+    # 저장된 질의를 고르면 편집기 내용 교체
+    if st.session_state.get("sql_loaded_query") != selected:
+        st.session_state["sql_loaded_query"] = selected
+        st.session_state["sql_text"] = saved_queries.get(selected, f"SELECT * FROM {tables[0][0]} LIMIT 100")
+
+    sql = st.text_area("SQL", key="sql_text", height=180)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        run_query = st.button("▶️ 실행", type="primary", use_container_width=True)
+    with col2:
+        query_name = st.text_input("질의 이름", value="" if selected == NEW_QUERY else selected,
+                                   placeholder="저장할 이름", label_visibility="collapsed")
+    with col3:
+        if st.button("💾 저장", use_container_width=True):
+            if query_name.strip():
+                save_query(query_name.strip(), sql)
+                st.session_state["sql_pending_select"] = query_name.strip()
+                st.rerun()
+            else:
+                st.error("❌ 질의 이름을 입력하세요")
+
+    if run_query:
+        try:
+            df, elapsed = database.query(sql)
+            st.session_state["sql_result"] = (df, elapsed, None)
+        except Exception as e:
+            st.session_state["sql_result"] = (None, 0, str(e))
+
+    # 결과 표시
+    if "sql_result" in st.session_state:
+        df, elapsed, error = st.session_state["sql_result"]
+        if error:
+            st.error("❌ 질의 실패")
+            st.code(error)
+        else:
+            st.success(f"✅ {len(df):,}개 행 · {elapsed * 1000:.1f}ms")
+            show_result_table(df, key="view_sql_result")
+            show_export_controls(df, key="download_sql_result", file_stem="query")
@@ -0,0 +1,185 @@
+import math
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+import streamlit as st
+from common.cache_manager import pa, _build_column
+from common.exporter import EXPORT_FORMATS, export_result
+from common.result_transport import attach_table, is_handle
+
+if pa is not None:
+    import pyarrow.compute as pc
+
+# 페이지 크기 선택지와 세션에 유지할 결과 뷰 수
+PAGE_SIZES = [100, 500, 1000, 5000]
+MAX_CACHED_VIEWS = 4
+NO_COLUMN = "(없음)"
+
+
+def _source_table(df: Optional[pd.DataFrame], source: Optional[dict]):
+    """표시할 Arrow 테이블 (핸들이 있으면 결과 파일을 메모리 매핑, 없으면 DataFrame 변환)"""
+    if is_handle(source):
+        try:
+            return attach_table(source)
+        except Exception as e:
+            print(f"Result file attach failed, using frame: {e}")
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # 혼합 타입 객체 컬럼 등 변환할 수 없는 컬럼만 캐시 저장과 같은 규칙으로 변환 (uint64 또는 문자열)
+        arrays = []
+        for name in df.columns:
+            try:
+                arrays.append(pa.Array.from_pandas(df[name]))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                arrays.append(_build_column([None if isinstance(value, float) and math.isnan(value) else value
+                                             for value in df[name].tolist()]))
+        return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def _view_cache() -> OrderedDict:
+    """세션별 결과 뷰 캐시 (최근 사용한 뷰만 유지)"""
+    return st.session_state.setdefault("result_viewer_cache", OrderedDict())
+
+
+def _get_table(key: str, df: Optional[pd.DataFrame], source: Optional[dict]):
+    """결과 테이블 반환 (같은 결과면 다시 변환하지 않음)"""
+    cache = _view_cache()
+    cached = cache.get(key)
+    if cached is None or cached['df'] is not df or cached['source'] != source:
+        cached = {'df': df, 'source': source, 'table': _source_table(df, source), 'params': None, 'view': None}
+        cache[key] = cached
+        while len(cache) > MAX_CACHED_VIEWS:
+            cache.popitem(last=False)
+    cache.move_to_end(key)
+    return cached
+
+
+def _text_mask(column, text: str):
+    """컬럼 값에 text가 포함된 행 마스크 (대소문자 무시, 문자열로 바꿀 수 없는 컬럼은 None)"""
+    try:
+        values = column if pa.types.is_string(column.type) else pc.cast(column, pa.string())
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return None
+    return pc.fill_null(pc.match_substring(values, text, ignore_case=True), False)
+
+
+def _apply_view(table, search: str, filter_column: str, filter_value: str, sort_column: str, descending: bool):
+    """검색/컬럼 필터/정렬을 Arrow 연산으로 적용 (정렬은 인덱스만 계산해 페이지 단위로 take)"""
+    mask = None
+
+    if search:
+        for name in table.column_names:
+            column_mask = _text_mask(table.column(name), search)
+            if column_mask is not None:
+                mask = column_mask if mask is None else pc.or_(mask, column_mask)
+
+    if filter_column != NO_COLUMN and filter_value:
+        column_mask = _text_mask(table.column(filter_column), filter_value)
+        if column_mask is not None:
+            mask = column_mask if mask is None else pc.and_(mask, column_mask)
+
+    if mask is not None:
+        table = table.filter(mask)
+
+    indices = None
+    if sort_column != NO_COLUMN:
+        try:
+            # null은 기본값대로 마지막에 배치
+            indices = pc.sort_indices(table, sort_keys=[(sort_column, "descending" if descending else "ascending")])
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            print(f"Sort on {sort_column} failed: {e}")
+
+    return table, indices
+
+
+def show_result_table(df: Optional[pd.DataFrame], key: str, source: Optional[dict] = None, height: int = 400):
+    """페이지 단위 결과 뷰어 - 현재 페이지의 행만 DataFrame으로 변환해 표시
+
+    검색/필터/정렬은 Arrow 테이블에서 계산하므로 수십만 행 결과도 페이지 이동이 빠르다.
+    """
+    if pa is None:
+        st.dataframe(df, height=height)
+        return
+
+    cached = _get_table(key, df, source)
+    table = cached['table']
+    columns = table.column_names
+
+    col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
+    with col1:
+        search = st.text_input("🔎 검색", key=f"{key}_search", placeholder="모든 컬럼에서 검색")
+    with col2:
+        filter_column = st.selectbox("필터 컬럼", [NO_COLUMN] + columns, key=f"{key}_filter_column")
+    with col3:
+        filter_value = st.text_input("필터 값", key=f"{key}_filter_value",
+                                     disabled=filter_column == NO_COLUMN)
+    with col4:
+        sort_column = st.selectbox("정렬", [NO_COLUMN] + columns, key=f"{key}_sort_column")
+    with col5:
+        descending = st.checkbox("내림차순", key=f"{key}_descending")
+
+    # 조건이 바뀌었을 때만 다시 계산 (페이지 이동은 계산된 뷰를 재사용)
+    params = (search, filter_column, filter_value, sort_column, descending)
+    if cached['params'] != params:
+        cached['view'] = _apply_view(table, *params)
+        cached['params'] = params
+    view, indices = cached['view']
+
+    col1, col2, col3 = st.columns([1, 1, 3])
+    with col1:
+        page_size = st.selectbox("페이지 크기", PAGE_SIZES, key=f"{key}_page_size")
+    page_count = max(1, math.ceil(view.num_rows / page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = 1  # 필터로 행 수가 줄면 첫 페이지로
+    with col2:
+        page = st.number_input("페이지", min_value=1, max_value=page_count, step=1, key=page_key)
+    with col3:
+        st.caption(f"{view.num_rows:,} / {table.num_rows:,}개 항목 · {page_count:,}페이지")
+
+    start = (page - 1) * page_size
+    if indices is not None:
+        page_table = view.take(indices.slice(start, page_size))
+    else:
+        page_table = view.slice(start, page_size)
+
+    page_df = page_table.to_pandas()
+    page_df.index = range(start, start + len(page_df))
+    st.dataframe(page_df, height=height)
+
+
+def show_export_controls(df: pd.DataFrame, key: str, file_stem: str, source: Optional[dict] = None):
+    """결과 내보내기 - 요청했을 때만 파일을 만들고, 같은 결과는 이미 만든 파일을 재사용"""
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        export_format = st.selectbox("내보내기 형식", list(EXPORT_FORMATS), format_func=str.upper,
+                                     key=f"{key}_export_format", label_visibility="collapsed")
+    export_key = f"{key}_export_{export_format}"
+
+    with col2:
+        if st.button("📦 내보내기 준비", key=f"{key}_export", use_container_width=True):
+            with st.spinner(f"{export_format.upper()} 파일 생성 중..."):
+                try:
+                    export_path = export_result(df, export_format, source)
+                    st.session_state[export_key] = {'df': df, 'path': str(export_path)}
+                except Exception as e:
+                    st.error(f"❌ 내보내기 실패: {e}")
+
+    # 현재 결과로 만든 파일만 다운로드 제공 (결과가 바뀌면 다시 준비)
+    prepared = st.session_state.get(export_key)
+    if prepared and prepared['df'] is df and Path(prepared['path']).exists():
+        extension, mime = EXPORT_FORMATS[export_format]
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        with col3:
+            with open(prepared['path'], 'rb') as f:
+                st.download_button(
+                    label=f"💾 {export_format.upper()} 다운로드",
+                    data=f,
+                    file_name=f"{file_stem}_{timestamp}{extension}",
+                    mime=mime,
+                    key=f"{key}_download_{export_format}"
+                )
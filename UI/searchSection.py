@@ -0,0 +1,36 @@
+import time
+import pandas as pd
+import streamlit as st
+from common.ioc_index import ioc_index
+
+
+def show_search_results(query: str):
+    """캐시된 모든 덤프 결과에서 IOC 검색 (IP, 경로 일부, 해시, 뮤텍스 이름 등)"""
+    st.header("🔎 전체 검색")
+
+    if not ioc_index.available:
+        st.error("❌ 이 환경의 SQLite는 전문 검색(FTS5)을 지원하지 않아 검색할 수 없습니다.")
+        return
+
+    started = time.perf_counter()
+    hits = ioc_index.search(query)
+    elapsed = time.perf_counter() - started
+
+    pending = ioc_index.pending()
+    if pending:
+        st.caption(f"⏳ 색인 중인 결과가 있습니다 ({pending}개 작업 대기) - 일부 결과가 아직 검색되지 않을 수 있습니다.")
+
+    if not hits:
+        st.info(f"'{query}'와 일치하는 결과가 없습니다.")
+        return
+
+    st.success(f"✅ {len(hits):,}개 일치 · {elapsed * 1000:.1f}ms")
+
+    df = pd.DataFrame(hits).drop(columns=["dump_fingerprint"])
+    df.columns = ["덤프", "플러그인", "PID", "행", "일치 내용"]
+
+    # 플러그인별 일치 수 요약
+    summary = df.groupby(["덤프", "플러그인"]).size().reset_index(name="일치 수")
+    st.dataframe(summary, hide_index=True, use_container_width=True)
+
+    st.dataframe(df, hide_index=True, use_container_width=True, height=400)
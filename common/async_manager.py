@@ -1,10 +1,15 @@
-import multiprocessing
+import os
+import queue
+import threading
 import time
-import psutil
-from typing import Dict, Any
+import pandas as pd
+from typing import Dict, Any, Optional
 import streamlit as st
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from .volatility import run_volatility_process
+from .result_transport import attach, is_handle
+from .resource_sampler import resource_sampler
+from .scheduler import job_scheduler, estimate_remaining, deduplicate_plugins, _plugin_fields
+from .job_store import job_store, PLANNED, RUNNING, DONE, FAILED
+from .volatility import load_cached_process_result, log_with_time
 from UI.config import plugin_categories
 
 
@@ -16,10 +21,8 @@ class ResourceMonitor:
         self.memory_threshold = memory_threshold
 
     def get_current_usage(self):
-        """현재 CPU/메모리 사용률 반환"""
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory_percent = psutil.virtual_memory().percent
-        return cpu_percent, memory_percent
+        """현재 CPU/메모리 사용률 반환 (공유 샘플러의 최근 값, 대기 없음)"""
+        return resource_sampler.latest()
 
     def is_system_overloaded(self):
         """시스템이 과부하 상태인지 확인"""
@@ -53,135 +56,31 @@ class ResourceMonitor:
         return optimal_workers
 
 
-def monitor_resources_worker(queue: multiprocessing.Queue, category: str, stop_event: multiprocessing.Event):
-    """별도 프로세스에서 리소스 모니터링"""
-    monitor = ResourceMonitor()
+# 미리보기로 UI에 보관하는 최대 행 수 (전체 행 수는 별도로 표시)
+PARTIAL_PREVIEW_ROWS = 100000
 
-    while not stop_event.is_set():
-        try:
-            cpu_percent, memory_percent = monitor.get_current_usage()
-
-            # 큐에 리소스 정보 전송
-            queue.put({
-                'type': 'resource_update',
-                'category': category,
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory_percent,
-                'timestamp': time.time()
-            })
-
-            time.sleep(3)  # 3초마다 모니터링
-
-        except Exception as e:
-            queue.put({
-                'type': 'error',
-                'category': category,
-                'error': f"리소스 모니터링 오류: {str(e)}"
-            })
-            break
-
-
-def analysis_worker(dump_path: str, selected_category: str, max_workers: int,
-                    result_queue: multiprocessing.Queue, progress_queue: multiprocessing.Queue):
-    """별도 프로세스에서 분석 실행"""
-    try:
-        plugins_to_run = plugin_categories[selected_category]
-        completed_count = 0
-        total_count = len(plugins_to_run)
-
-        # 시작 알림
-        progress_queue.put({
-            'type': 'start',
-            'category': selected_category,
-            'total': total_count
-        })
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # 모든 작업 제출
-            future_to_plugin = {}
-
-            for plugin_data in plugins_to_run:
-                if isinstance(plugin_data, dict):
-                    # 새로운 딕셔너리 구조
-                    emoji = plugin_data['emoji']
-                    title = plugin_data['label']
-                    plugin = plugin_data['command']
-                else:
-                    # 기존 튜플 구조
-                    emoji, title, plugin = plugin_data
-
-                future = executor.submit(run_volatility_process, plugin, dump_path)
-                future_to_plugin[future] = (emoji, title, plugin)
-
-            # 완료된 작업 처리
-            for future in as_completed(future_to_plugin):
-                emoji, title, plugin = future_to_plugin[future]
-                completed_count += 1
-
-                try:
-                    plugin_name, df, error = future.result()
-
-                    # 결과를 큐에 전송 (간단한 구조로)
-                    result_queue.put({
-                        'type': 'result',
-                        'category': selected_category,
-                        'plugin_name': plugin_name,
-                        'plugin': plugin,
-                        'title': title,
-                        'df': df,
-                        'error': error,
-                        'from_cache': False  # 일단 기본값
-                    })
-
-                    # 진행 상황 업데이트
-                    progress_queue.put({
-                        'type': 'progress',
-                        'category': selected_category,
-                        'completed': completed_count,
-                        'total': total_count,
-                        'current_plugin': title,
-                        'last_completed': title
-                    })
-
-                except Exception as e:
-                    result_queue.put({
-                        'type': 'result',
-                        'category': selected_category,
-                        'plugin_name': plugin,
-                        'plugin': plugin,
-                        'title': title,
-                        'df': None,
-                        'error': str(e)
-                    })
-
-        # 완료 알림
-        progress_queue.put({
-            'type': 'completed',
-            'category': selected_category,
-            'total_time': time.time()
-        })
-
-    except Exception as e:
-        progress_queue.put({
-            'type': 'error',
-            'category': selected_category,
-            'error': str(e)
-        })
+# 전체 분석(모든 카테고리) 실행 키
+TRIAGE_KEY = "__triage__"
 
 
 class AsyncAnalysisManager:
     def __init__(self):
         self.running_processes = {}
-        self.resource_monitors = {}
         self.result_queues = {}
         self.progress_queues = {}
-        self.resource_queues = {}
         self.stop_events = {}
+        # 실행 키 -> 작업 기록 실행 id
+        self.run_ids = {}
         self.resource_monitor = ResourceMonitor()
+        # 전체 분석: 명령어 -> 결과를 받을 카테고리 목록, 전체 분석에 포함된 카테고리
+        self.triage_targets = {}
+        self.triage_categories = set()
+        # 만료된 실패 캐시 항목 자동 재실행
+        job_scheduler.start_failure_refresher()
 
     def start_category_analysis_async(self, dump_path: str, selected_category: str, max_workers: int):
-        """multiprocessing으로 비동기 분석 시작"""
-        if selected_category in self.running_processes:
+        """작업 스케줄러로 비동기 분석 시작"""
+        if selected_category in self.running_processes or self.is_triage_running():
             return False  # 이미 실행 중
 
         # 시스템 과부하 체크
@@ -189,81 +88,241 @@ class AsyncAnalysisManager:
             st.warning("⚠️ 시스템 리소스 사용률이 높습니다. 분석을 잠시 후 다시 시도하세요.")
             return False
 
+        # 카테고리를 단독으로 다시 실행하면 이전 전체 분석 진행 상태와 분리
+        self.triage_categories.discard(selected_category)
+
         # 세션 상태 초기화
-        self._initialize_session_state(selected_category)
+        plugins = plugin_categories[selected_category]
+        self._initialize_session_state(selected_category, [selected_category], len(plugins))
 
         # 최적 워커 수 계산
         optimal_workers = self.resource_monitor.get_optimal_workers(max_workers)
         if optimal_workers < max_workers:
             st.info(f"💡 시스템 성능을 고려하여 워커 수를 {max_workers}개에서 {optimal_workers}개로 조정했습니다.")
 
-        # 큐 생성
-        self.result_queues[selected_category] = multiprocessing.Queue()
-        self.progress_queues[selected_category] = multiprocessing.Queue()
-        self.resource_queues[selected_category] = multiprocessing.Queue()
-        self.stop_events[selected_category] = multiprocessing.Event()
-
-        # 분석 프로세스 시작
-        analysis_process = multiprocessing.Process(
-            target=analysis_worker,
-            args=(dump_path, selected_category, optimal_workers,
-                  self.result_queues[selected_category],
-                  self.progress_queues[selected_category])
-        )
-        analysis_process.start()
-        self.running_processes[selected_category] = analysis_process
-
-        # 리소스 모니터링 프로세스 시작
-        monitor_process = multiprocessing.Process(
-            target=monitor_resources_worker,
-            args=(self.resource_queues[selected_category],
-                  selected_category,
-                  self.stop_events[selected_category])
-        )
-        monitor_process.start()
-        self.resource_monitors[selected_category] = monitor_process
+        self._start_run(dump_path, selected_category, [selected_category], plugins, optimal_workers)
+        return True
+
+    def start_full_triage(self, dump_path: str):
+        """전체 분석: 모든 카테고리의 플러그인을 중복 없이 하나의 작업 묶음으로 실행
 
+        결과는 해당 플러그인을 포함한 모든 카테고리 탭에 전달된다.
+        """
+        if self.running_processes:
+            return False  # 다른 분석이 실행 중
+
+        if self.resource_monitor.is_system_overloaded():
+            st.warning("⚠️ 시스템 리소스 사용률이 높습니다. 분석을 잠시 후 다시 시도하세요.")
+            return False
+
+        plugins, self.triage_targets = deduplicate_plugins(plugin_categories)
+        self.triage_categories = set(plugin_categories.keys())
+        self._initialize_session_state(TRIAGE_KEY, list(plugin_categories.keys()), len(plugins))
+
+        # 카테고리 사이 유휴 시간 없이 전체 동시 실행 한도까지 사용
+        workers = self.resource_monitor.get_optimal_workers(job_scheduler.max_concurrency)
+        self._start_run(dump_path, TRIAGE_KEY, list(plugin_categories.keys()), plugins, workers)
         return True
 
-    def _initialize_session_state(self, selected_category: str):
-        """세션 상태 초기화"""
-        plugins_to_run = plugin_categories[selected_category]
+    def is_triage_running(self) -> bool:
+        """전체 분석 실행 여부"""
+        thread = self.running_processes.get(TRIAGE_KEY)
+        return thread is not None and thread.is_alive()
+
+    def _start_run(self, dump_path: str, run_key: str, categories: list, plugins: list, workers: int):
+        """스케줄러 실행 시작 (리소스 사용률은 공유 샘플러에서 조회)"""
+        # 작업 기록 (UI 재시작/새로고침 후 복원용)
+        run_id = job_store.start_run(run_key, dump_path, categories,
+                                     [(fields[2], fields[1]) for fields in map(_plugin_fields, plugins)], workers)
+        st.session_state[f"analysis_run_id_{run_key}"] = run_id
+        self._launch(dump_path, run_key, run_id, plugins, workers)
+
+    def _launch(self, dump_path: str, run_key: str, run_id: int, plugins: list, workers: int,
+                reattach: Optional[dict] = None, completed_offset: int = 0):
+        # 큐 생성 (스케줄러가 같은 프로세스의 스레드이므로 pickle 없는 큐 사용)
+        self.result_queues[run_key] = queue.Queue()
+        self.progress_queues[run_key] = queue.Queue()
+        self.stop_events[run_key] = threading.Event()
+        self.run_ids[run_key] = run_id
+
+        # 분석 시작 (스케줄러가 vol 자식 프로세스를 직접 실행)
+        self.running_processes[run_key] = job_scheduler.start_category(
+            dump_path, run_key, plugins, workers,
+            self.result_queues[run_key],
+            self.progress_queues[run_key],
+            self.stop_events[run_key],
+            run_id=run_id,
+            reattach=reattach,
+            completed_offset=completed_offset
+        )
 
+    def restore_runs(self, dump_path: str):
+        """작업 기록에서 끝나지 않은 실행 복원
+
+        새 세션(새로고침/다른 브라우저)에는 진행 상태와 완료된 결과를 채우고, 서버가 재시작돼
+        실행을 관리하던 스레드가 없으면 끝나지 않은 플러그인만 이어서 실행한다.
+        """
+        if not dump_path:
+            return
+
+        try:
+            runs = job_store.active_runs(dump_path)
+        except Exception as e:
+            print(f"Job store lookup failed: {e}")
+            return
+
+        for run in runs:
+            run_key = run["run_key"]
+            thread = self.running_processes.get(run_key)
+            if thread is None or not thread.is_alive():
+                if self.run_ids.get(run_key) == run["run_id"]:
+                    continue  # 이 서버에서 방금 끝남 (완료 기록 전)
+                if not job_store.is_orphaned(run) or not job_store.claim_run(run):
+                    continue  # 다른 서버 프로세스가 관리 중
+                if not os.path.exists(run["dump_path"]):
+                    job_store.finish_run(run["run_id"], "stopped")
+                    continue
+                self._resume_run(run)
+
+            if st.session_state.get(f"analysis_run_id_{run_key}") != run["run_id"]:
+                self._restore_session(run)
+
+    def _run_categories(self, run: dict) -> list:
+        """실행에 포함된 카테고리 중 현재 카탈로그에 있는 것"""
+        return [category for category in run["categories"] if category in plugin_categories]
+
+    def _resume_run(self, run: dict):
+        """서버 재시작으로 중단된 실행을 남은 플러그인만 이어서 실행 (실행 중이던 vol 프로세스는 다시 연결)"""
+        run_key = run["run_key"]
+        jobs = job_store.get_jobs(run["run_id"])
+        remaining = [("🔁", job["title"], job["plugin"]) for job in jobs if job["state"] in (PLANNED, RUNNING)]
+        reattach = {job["plugin"]: job for job in jobs if job["state"] == RUNNING and job["os_pid"]}
+
+        if run_key == TRIAGE_KEY:
+            categories = self._run_categories(run)
+            _, self.triage_targets = deduplicate_plugins({category: plugin_categories[category]
+                                                          for category in categories})
+            self.triage_categories = set(categories)
+
+        log_with_time(f"♻️ Resuming {run_key}: {len(remaining)}/{len(jobs)} plugins left, "
+                      f"{len(reattach)} to reattach")
+        self._launch(run["dump_path"], run_key, run["run_id"], remaining, run["workers"],
+                     reattach=reattach, completed_offset=len(jobs) - len(remaining))
+
+    def _restore_session(self, run: dict):
+        """작업 기록으로 세션 진행 상태를 채우고 완료된 플러그인 결과를 캐시에서 불러옴"""
+        run_key = run["run_key"]
+        jobs = job_store.get_jobs(run["run_id"])
+        finished = [job for job in jobs if job["state"] not in (PLANNED, RUNNING)]
+
+        self._initialize_session_state(run_key, self._run_categories(run), len(jobs))
+        progress = st.session_state[f"analysis_progress_{run_key}"]
+        progress.update({
+            'completed': len(finished),
+            'start_time': run["started_at"],
+            'workers': run["workers"],
+            'running_jobs': {job["plugin"]: job["started_at"] or time.time()
+                             for job in jobs if job["state"] == RUNNING},
+            'finished_jobs': {job["plugin"] for job in finished}
+        })
+        st.session_state[f"analysis_run_id_{run_key}"] = run["run_id"]
+        st.session_state["analysis_running"] = True
+
+        for job in finished:
+            if job["state"] not in (DONE, FAILED):
+                continue
+            loaded = load_cached_process_result(job["plugin"], run["dump_path"])
+            if loaded is None:
+                continue
+            _, df, error = loaded
+            handle = df if is_handle(df) else None
+            result = self._resolve_result({'df': None if handle else df, 'handle': handle, 'error': error})
+            for target in self._result_categories(run_key, job["plugin"]):
+                st.session_state[f"analysis_results_{target}_{job['plugin']}"] = result
+                st.session_state[f"analysis_source_{target}_{job['plugin']}"] = handle
+
+    def _initialize_session_state(self, run_key: str, categories: list, total: int):
+        """세션 상태 초기화"""
         # 기존 결과 삭제
-        for plugin_data in plugins_to_run:
-            # 딕셔너리 구조인지 튜플 구조인지 확인
-            if isinstance(plugin_data, dict):
-                plugin = plugin_data['command']
-            else:
-                # 튜플 구조 (emoji, title, plugin)
-                emoji, title, plugin = plugin_data
+        for category in categories:
+            for plugin_data in plugin_categories[category]:
+                # 딕셔너리 구조인지 튜플 구조인지 확인
+                if isinstance(plugin_data, dict):
+                    plugin = plugin_data['command']
+                else:
+                    # 튜플 구조 (emoji, title, plugin)
+                    emoji, title, plugin = plugin_data
 
-            result_key = f"analysis_results_{selected_category}_{plugin}"
-            if result_key in st.session_state:
-                del st.session_state[result_key]
+                result_key = f"analysis_results_{category}_{plugin}"
+                if result_key in st.session_state:
+                    del st.session_state[result_key]
+
+                partial_key = f"analysis_partial_{category}_{plugin}"
+                if partial_key in st.session_state:
+                    del st.session_state[partial_key]
+
+                source_key = f"analysis_source_{category}_{plugin}"
+                if source_key in st.session_state:
+                    del st.session_state[source_key]
 
         # 진행 상태 초기화
-        st.session_state[f"analysis_progress_{selected_category}"] = {
-            'total': len(plugins_to_run),
+        st.session_state[f"analysis_progress_{run_key}"] = {
+            'total': total,
             'completed': 0,
             'current_plugin': None,
             'status': 'running',
             'start_time': time.time(),
-            'cpu_usage': [],
-            'memory_usage': []
+            'estimates': {},
+            'workers': 1,
+            'running_jobs': {},
+            'finished_jobs': set()
         }
 
+        # 이벤트 카운터 (UI는 값이 바뀌었을 때만 해당 영역을 다시 그림)
+        st.session_state[f"analysis_events_{run_key}"] = {'progress': 0, 'results': 0, 'partials': 0}
+
+    def _resolve_key(self, category: str) -> str:
+        """카테고리가 전체 분석에 포함되어 있으면 전체 분석 실행 키 반환"""
+        if category not in self.running_processes and category in self.triage_categories:
+            return TRIAGE_KEY
+        return category
+
+    def _result_categories(self, run_key: str, plugin: str) -> list:
+        """결과를 전달할 카테고리 목록"""
+        if run_key == TRIAGE_KEY:
+            return self.triage_targets.get(plugin, [])
+        return [run_key]
+
     def update_from_queues(self, category: str):
         """큐에서 업데이트 정보 가져오기"""
-        # 결과 큐 처리
+        category = self._resolve_key(category)
+
+        # 결과 큐 처리 (전체 분석은 플러그인을 포함한 모든 카테고리에 전달)
         try:
-            if category in self.result_queues and self.result_queues[category] is not None:
-                while not self.result_queues[category].empty():
+            result_queue = self.result_queues.get(category)
+            if result_queue is not None:
+                while not result_queue.empty():
                     try:
-                        data = self.result_queues[category].get_nowait()
+                        data = result_queue.get_nowait()
+                        # 부분 결과 배치는 따로 셈 (완료된 결과만 페이지 전체 갱신 대상)
+                        self._count_event(category, 'results' if data['type'] == 'result' else 'partials')
+                        targets = self._result_categories(category, data['plugin_name'])
                         if data['type'] == 'result':
-                            result_key = f"analysis_results_{category}_{data['plugin_name']}"
-                            st.session_state[result_key] = (data['df'], data['error'])
+                            result = self._resolve_result(data)
+                            for target in targets:
+                                # 중단된 플러그인은 이미 수신한 부분 결과를 유지
+                                partial = st.session_state.get(f"analysis_partial_{target}_{data['plugin_name']}")
+                                if data.get('cancelled') and partial:
+                                    partial['stopped'] = True
+                                    continue
+
+                                st.session_state[f"analysis_results_{target}_{data['plugin_name']}"] = result
+                                # 결과 뷰어가 필터/정렬을 결과 파일에서 처리하도록 핸들 보관
+                                st.session_state[f"analysis_source_{target}_{data['plugin_name']}"] = data.get('handle')
+                                st.session_state.pop(f"analysis_partial_{target}_{data['plugin_name']}", None)
+                        elif data['type'] == 'partial':
+                            for target in targets:
+                                self._append_partial(f"analysis_partial_{target}_{data['plugin_name']}", data)
                     except:
                         break
         except Exception as e:
@@ -271,19 +330,33 @@ class AsyncAnalysisManager:
 
         # 진행 상황 큐 처리
         try:
-            if category in self.progress_queues and self.progress_queues[category] is not None:
-                while not self.progress_queues[category].empty():
+            progress_queue = self.progress_queues.get(category)
+            if progress_queue is not None:
+                while not progress_queue.empty():
                     try:
-                        data = self.progress_queues[category].get_nowait()
+                        data = progress_queue.get_nowait()
+                        self._count_event(category, 'progress')
                         progress_key = f"analysis_progress_{category}"
 
-                        if data['type'] == 'progress':
+                        if data['type'] == 'start':
                             if progress_key in st.session_state:
                                 st.session_state[progress_key].update({
+                                    'estimates': data.get('estimates', {}),
+                                    'workers': data.get('workers', 1)
+                                })
+                        elif data['type'] == 'job_start':
+                            if progress_key in st.session_state:
+                                st.session_state[progress_key]['running_jobs'][data['plugin']] = data['started_at']
+                        elif data['type'] == 'progress':
+                            if progress_key in st.session_state:
+                                progress = st.session_state[progress_key]
+                                progress.update({
                                     'completed': data['completed'],
                                     'current_plugin': data['current_plugin'],
                                     'last_completed': data['last_completed']
                                 })
+                                progress['running_jobs'].pop(data.get('plugin'), None)
+                                progress['finished_jobs'].add(data.get('plugin'))
                         elif data['type'] == 'completed':
                             if progress_key in st.session_state:
                                 st.session_state[progress_key]['status'] = 'completed'
@@ -301,62 +374,74 @@ class AsyncAnalysisManager:
         except Exception as e:
             print(f"Error processing progress queue for {category}: {e}")
 
-        # 리소스 큐 처리
+    def _count_event(self, run_key: str, kind: str):
+        """수신한 이벤트 수 증가"""
+        counts = st.session_state.setdefault(f"analysis_events_{run_key}",
+                                             {'progress': 0, 'results': 0, 'partials': 0})
+        counts[kind] = counts.get(kind, 0) + 1
+
+    def get_event_counts(self, category: str) -> Dict[str, int]:
+        """큐를 비운 뒤 지금까지 수신한 진행/결과/부분 결과 이벤트 수 반환"""
         try:
-            if category in self.resource_queues and self.resource_queues[category] is not None:
-                while not self.resource_queues[category].empty():
-                    try:
-                        data = self.resource_queues[category].get_nowait()
-                        if data['type'] == 'resource_update':
-                            progress_key = f"analysis_progress_{category}"
-                            if progress_key in st.session_state:
-                                st.session_state[progress_key]['cpu_usage'].append(data['cpu_percent'])
-                                st.session_state[progress_key]['memory_usage'].append(data['memory_percent'])
-
-                                # 최근 10개 데이터만 유지
-                                if len(st.session_state[progress_key]['cpu_usage']) > 10:
-                                    st.session_state[progress_key]['cpu_usage'] = st.session_state[progress_key][
-                                                                                      'cpu_usage'][-10:]
-                                    st.session_state[progress_key]['memory_usage'] = st.session_state[progress_key][
-                                                                                         'memory_usage'][-10:]
-                    except:
-                        break
+            self.update_from_queues(category)
+        except Exception as e:
+            print(f"Error updating queues for {category}: {e}")
+
+        counts = st.session_state.get(f"analysis_events_{self._resolve_key(category)}", {})
+        return {'progress': counts.get('progress', 0), 'results': counts.get('results', 0),
+                'partials': counts.get('partials', 0)}
+
+    def _resolve_result(self, data: dict):
+        """결과 메시지를 (df, error)로 변환 (핸들은 결과 파일에 연결)"""
+        handle = data.get('handle')
+        if handle is None:
+            return data['df'], data['error']
+
+        try:
+            return attach(handle), data['error']
         except Exception as e:
-            print(f"Error processing resource queue for {category}: {e}")
+            return None, f"결과를 불러오지 못했습니다: {e}"
+
+    def _append_partial(self, partial_key: str, data: dict):
+        """실행 중 도착한 행 배치 누적 (미리보기 행 수 제한)"""
+        partial = st.session_state.setdefault(partial_key, {'frames': [], 'preview_rows': 0, 'rows': 0})
+        partial['rows'] = data['rows']
+
+        if partial['preview_rows'] < PARTIAL_PREVIEW_ROWS and data['df'] is not None:
+            batch_df = data['df'].head(PARTIAL_PREVIEW_ROWS - partial['preview_rows'])
+            partial['frames'].append(batch_df)
+            partial['preview_rows'] += len(batch_df)
+
+    def get_result_source(self, category: str, plugin: str) -> Optional[dict]:
+        """완료된 플러그인 결과 파일 핸들 (없으면 None)"""
+        return st.session_state.get(f"analysis_source_{category}_{plugin}")
+
+    def get_partial_result(self, category: str, plugin: str):
+        """실행 중(또는 중단된) 플러그인의 부분 결과 (미리보기 DataFrame, 전체 수신 행 수, 중단 여부)"""
+        partial = st.session_state.get(f"analysis_partial_{category}_{plugin}")
+        if not partial or not partial['frames']:
+            return None, 0, False
+
+        # 여러 배치를 하나로 합쳐 보관 (rerun마다 다시 합치지 않도록)
+        if len(partial['frames']) > 1:
+            partial['frames'] = [pd.concat(partial['frames'], ignore_index=True)]
+        return partial['frames'][0], partial['rows'], partial.get('stopped', False)
 
     def _cleanup_category(self, category: str):
         """카테고리 정리"""
+        # 스레드는 강제 종료할 수 없으므로 중단 이벤트로 남은 작업 취소
+        if category in self.stop_events:
+            self.stop_events[category].set()
+
         try:
             if category in self.running_processes:
-                process = self.running_processes[category]
-                if process and process.is_alive():
-                    process.terminate()
-                    process.join(timeout=5)  # 5초 대기
-                    if process.is_alive():
-                        process.kill()  # 강제 종료
                 del self.running_processes[category]
         except Exception as e:
-            print(f"Error cleaning up analysis process for {category}: {e}")
-
-        try:
-            if category in self.resource_monitors:
-                if category in self.stop_events:
-                    self.stop_events[category].set()
-
-                monitor = self.resource_monitors[category]
-                if monitor and monitor.is_alive():
-                    monitor.terminate()
-                    monitor.join(timeout=3)
-                    if monitor.is_alive():
-                        monitor.kill()
-                del self.resource_monitors[category]
-        except Exception as e:
-            print(f"Error cleaning up monitor process for {category}: {e}")
+            print(f"Error cleaning up analysis thread for {category}: {e}")
 
         # 큐들과 이벤트 정리
         for queue_dict, name in [(self.result_queues, "result"),
-                                 (self.progress_queues, "progress"),
-                                 (self.resource_queues, "resource")]:
+                                 (self.progress_queues, "progress")]:
             try:
                 if category in queue_dict:
                     del queue_dict[category]
@@ -376,66 +461,57 @@ class AsyncAnalysisManager:
         except Exception as e:
             print(f"Error updating queues for {category}: {e}")
 
-        progress_key = f"analysis_progress_{category}"
+        progress_key = f"analysis_progress_{self._resolve_key(category)}"
         return st.session_state.get(progress_key, {})
 
-    def get_resource_info(self, category: str) -> Dict[str, Any]:
-        """리소스 사용 정보 반환"""
-        try:
-            self.update_from_queues(category)
-        except Exception as e:
-            print(f"Error updating queues for resource info {category}: {e}")
+    def get_eta(self, category: str) -> Optional[float]:
+        """남은 예상 시간 (초, 예상 정보가 없으면 None)"""
+        progress_data = self.get_progress(category)
+        if not progress_data.get('estimates'):
+            return None
+
+        return estimate_remaining(progress_data['estimates'], progress_data['running_jobs'],
+                                  progress_data['finished_jobs'], progress_data['workers'])
 
+    def get_resource_info(self, category: str) -> Dict[str, Any]:
+        """리소스 사용 정보 반환 (분석 시작 이후 공유 샘플러 기록 기준, 대기 없음)"""
         progress_data = self.get_progress(category)
-        cpu_usage = progress_data.get('cpu_usage', [])
-        memory_usage = progress_data.get('memory_usage', [])
-
-        if cpu_usage and memory_usage:
-            return {
-                'current_cpu': cpu_usage[-1] if cpu_usage else 0,
-                'current_memory': memory_usage[-1] if memory_usage else 0,
-                'avg_cpu': sum(cpu_usage) / len(cpu_usage),
-                'avg_memory': sum(memory_usage) / len(memory_usage),
-                'max_cpu': max(cpu_usage),
-                'max_memory': max(memory_usage)
-            }
+        samples = resource_sampler.history(since=progress_data.get('start_time'))
+
+        if samples:
+            cpu_usage = [cpu for _, cpu, _ in samples]
+            memory_usage = [memory for _, _, memory in samples]
         else:
-            try:
-                current_cpu, current_memory = self.resource_monitor.get_current_usage()
-                return {
-                    'current_cpu': current_cpu,
-                    'current_memory': current_memory,
-                    'avg_cpu': current_cpu,
-                    'avg_memory': current_memory,
-                    'max_cpu': current_cpu,
-                    'max_memory': current_memory
-                }
-            except Exception as e:
-                print(f"Error getting current resource usage: {e}")
-                return {
-                    'current_cpu': 0,
-                    'current_memory': 0,
-                    'avg_cpu': 0,
-                    'avg_memory': 0,
-                    'max_cpu': 0,
-                    'max_memory': 0
-                }
+            current_cpu, current_memory = resource_sampler.latest()
+            cpu_usage, memory_usage = [current_cpu], [current_memory]
+
+        return {
+            'current_cpu': cpu_usage[-1],
+            'current_memory': memory_usage[-1],
+            'avg_cpu': sum(cpu_usage) / len(cpu_usage),
+            'avg_memory': sum(memory_usage) / len(memory_usage),
+            'max_cpu': max(cpu_usage),
+            'max_memory': max(memory_usage),
+            'cpu_history': cpu_usage,
+            'memory_history': memory_usage
+        }
 
     def is_running(self, category: str) -> bool:
-        """분석이 실행 중인지 확인"""
+        """분석이 실행 중인지 확인 (전체 분석에 포함된 카테고리 포함)"""
+        category = self._resolve_key(category)
         try:
             self.update_from_queues(category)
         except Exception as e:
             print(f"Queue update failed for {category}: {e}")
 
-        # 프로세스가 실제로 살아있는지 확인
+        # 분석 스레드가 실제로 살아있는지 확인
         if category in self.running_processes:
             process = self.running_processes[category]
             if process and process.is_alive():
                 return True
             else:
-                # 죽은 프로세스 정리 및 상태 업데이트
-                print(f"Process for {category} is dead, cleaning up...")
+                # 끝난 스레드 정리 및 상태 업데이트
+                print(f"Analysis thread for {category} finished, cleaning up...")
                 st.session_state["analysis_running"] = False
                 progress_key = f"analysis_progress_{category}"
                 if progress_key in st.session_state:
@@ -447,14 +523,43 @@ class AsyncAnalysisManager:
         return False
 
     def stop_analysis(self, category: str):
-        """분석 중단"""
+        """분석 중단 - 대기 작업 취소 및 실행 중인 vol 프로세스 그룹 종료 (수신한 부분 결과는 유지)"""
+        category = self._resolve_key(category)
         if category in self.running_processes:
+            if category in self.stop_events:
+                self.stop_events[category].set()
+            job_scheduler.cancel(category)
+            if category in self.run_ids:
+                job_store.finish_run(self.run_ids[category], "stopped")
+
+            # 중단 전에 도착한 결과/부분 결과 반영 후 부분 결과를 중단 상태로 표시
+            self.update_from_queues(category)
+            categories = list(self.triage_categories) if category == TRIAGE_KEY else [category]
+            for target in categories:
+                for key, value in st.session_state.items():
+                    if key.startswith(f"analysis_partial_{target}_") and isinstance(value, dict):
+                        value['stopped'] = True
+
             progress_key = f"analysis_progress_{category}"
             if progress_key in st.session_state:
                 st.session_state[progress_key]["status"] = "stopped"
             st.session_state["analysis_running"] = False
             self._cleanup_category(category)
 
+    def cancel_plugin(self, category: str, plugin: str) -> bool:
+        """실행 중/대기 중인 플러그인 하나만 중단 (나머지 작업은 계속 실행)"""
+        run_key = self._resolve_key(category)
+        if run_key not in self.running_processes:
+            return False
+        job_scheduler.cancel(run_key, plugin)
+        return True
+
+    def stop_all(self):
+        """모든 분석과 백그라운드 작업(PID 분석, 실패 재실행) 중단"""
+        for run_key in list(self.running_processes):
+            self.stop_analysis(run_key)
+        job_scheduler.cancel()
+
 
 # 전역 분석 매니저 인스턴스
 analysis_manager = AsyncAnalysisManager()
\ No newline at end of file
@@ -1,9 +1,474 @@
 import hashlib
 import json
 import os
+import sqlite3
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple
 import pandas as pd
+from .fingerprint import FingerprintIndex
+from UI.config import env_config
+
+# 컬럼형 저장소 (선택적 의존성, 없으면 JSON만 사용)
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+# 컬럼형 결과를 DataFrame으로 읽을 때 정수 컬럼은 nullable 정수로 유지 (주소값 float 변환 방지)
+_PANDAS_TYPES = {}
+if pa is not None:
+    _PANDAS_TYPES = {pa.int64(): pd.Int64Dtype(), pa.uint64(): pd.UInt64Dtype()}
+
+
+def _is_tabular(result: dict) -> bool:
+    """컬럼형으로 저장 가능한 결과인지 확인 (트리 구조/텍스트 출력 제외)"""
+    if result.get("status") != "success":
+        return False
+
+    rows = result.get("result")
+    if not isinstance(rows, list) or not rows:
+        return False
+
+    return all(isinstance(row, dict) and not row.get("__children") for row in rows)
+
+
+def _build_column(values: list):
+    """값 목록을 Arrow 배열로 변환 (64비트 주소는 uint64, 혼합 타입은 문자열)"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+
+    try:
+        return pa.array(values, type=pa.uint64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError):
+        pass
+
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def rows_to_table(rows: list):
+    """Volatility JSON 행 목록을 Arrow 테이블로 변환"""
+    columns = {}
+    for row in rows:
+        for name in row:
+            if name != "__children":
+                columns.setdefault(name, None)
+
+    return pa.table({name: _build_column([row.get(name) for row in rows]) for name in columns})
+
+
+def table_to_frame(table) -> pd.DataFrame:
+    """Arrow 테이블을 DataFrame으로 변환 (컬럼별 블록 유지 - 가능한 컬럼은 복사 없이 참조)"""
+    return table.to_pandas(types_mapper=_PANDAS_TYPES.get, split_blocks=True)
+
+
+def read_table_file(table_path) -> 'pa.Table':
+    """Arrow IPC 파일(또는 스트리밍 기록된 IPC 스트림)을 메모리 매핑으로 읽기"""
+    source = pa.memory_map(str(table_path), 'r')
+    try:
+        return pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pa.ipc.open_stream(source).read_all()
+
+
+def _conform_table(table, schema):
+    """배치를 기존 스키마에 맞춤 (빠진 컬럼은 null, 맞출 수 없으면 None)"""
+    if not set(table.column_names) <= set(schema.names):
+        return None
+
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            column = table.column(field.name)
+            if column.type != field.type:
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    return None
+            columns.append(column)
+        else:
+            columns.append(pa.nulls(table.num_rows, type=field.type))
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _merged_schema(schemas: list):
+    """여러 배치 스키마 병합 (null 승격 등, 충돌하는 컬럼은 문자열)"""
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            current = fields.get(field.name)
+            if current is None or current == field.type or pa.types.is_null(field.type):
+                fields.setdefault(field.name, field.type)
+            elif pa.types.is_null(current):
+                fields[field.name] = field.type
+            else:
+                fields[field.name] = pa.string()
+
+    return pa.schema([pa.field(name, type_) for name, type_ in fields.items()])
+
+
+class ResultWriter:
+    """스트리밍 결과 기록기 - 배치가 도착하는 대로 디스크에 기록해 최대 메모리 사용량 제한"""
+
+    def __init__(self, cache: 'SimpleCache', file_path: str, command: str, pid: Optional[int] = None,
+                 on_batch=None):
+        self.cache = cache
+        # 배치 기록 후 호출: on_batch(batch_frame, total_rows) - 실행 중 결과 미리보기용
+        self.on_batch = on_batch
+        self.file_path = file_path
+        self.command = command
+        self.pid = pid
+        self.cache_key = cache._get_cache_key(file_path, command, pid)
+
+        spool_dir = cache.cache_dir / "spool"
+        spool_dir.mkdir(exist_ok=True)
+        self._spool_prefix = spool_dir / f"{self.cache_key}.{os.getpid()}.{id(self)}"
+
+        self.segments = []
+        self._sink = None
+        self._writer = None
+        self._schema = None
+        self.reset()
+
+    def reset(self):
+        """기록 내용 폐기 후 처음 상태로"""
+        self._discard_segments()
+        self.mode = "arrow" if pa is not None else "json"
+        self.json_rows = []
+        self.text_lines = []
+        self.row_count = 0
+
+    def write_rows(self, rows: list):
+        """행 배치 기록 (표 형태는 Arrow 스풀, 트리 구조는 JSON)"""
+        if not rows:
+            return
+
+        self.row_count += len(rows)
+
+        if self.mode == "arrow" and all(isinstance(row, dict) and not row.get("__children") for row in rows):
+            try:
+                table = rows_to_table(rows)
+                self._write_arrow_batch(table)
+                self._notify_batch(lambda: table_to_frame(table))
+                return
+            except Exception as e:
+                print(f"Columnar spool write failed, switching to JSON: {e}")
+
+        if self.mode == "arrow":
+            self._switch_to_json()
+        self.json_rows.extend(rows)
+        self._notify_batch(lambda: pd.DataFrame(rows))
+
+    def _notify_batch(self, make_frame):
+        """배치 콜백 호출 (콜백 오류는 기록에 영향 없음)"""
+        if self.on_batch is None:
+            return
+        try:
+            self.on_batch(make_frame(), self.row_count)
+        except Exception as e:
+            print(f"Partial result callback failed: {e}")
+
+    def write_text(self, line: str):
+        """JSON이 아닌 출력 줄 기록"""
+        self.text_lines.append(line)
+
+    def commit(self, result: dict, load_frame: bool = True) -> Optional[dict]:
+        """실행 결과 메타데이터와 함께 캐시에 확정 (저장된 항목 반환)"""
+        self._close_segment()
+
+        if result.get("status") != "success":
+            self._discard_segments()
+            return self.cache.save(self.file_path, self.command, result, self.pid)
+
+        if self.mode == "arrow" and self.segments:
+            try:
+                return self._commit_arrow(result, load_frame)
+            except Exception as e:
+                print(f"Columnar cache commit failed, falling back to JSON: {e}")
+                self._switch_to_json()
+
+        if self.json_rows:
+            output = self.json_rows
+        elif self.text_lines:
+            output = {"text_output": "\n".join(self.text_lines)}
+        else:
+            output = []
+
+        self._discard_segments()
+        return self.cache.save(self.file_path, self.command, dict(result, result=output), self.pid,
+                               load_frame=load_frame)
+
+    def abort(self):
+        """기록 중단 (스풀 삭제)"""
+        self._close_segment()
+        self._discard_segments()
+
+    def _write_arrow_batch(self, table):
+        """스풀 세그먼트에 배치 추가 (스키마가 바뀌면 새 세그먼트)"""
+        if self._writer is not None and table.schema != self._schema:
+            conformed = _conform_table(table, self._schema)
+            if conformed is None:
+                self._close_segment()
+            else:
+                table = conformed
+
+        if self._writer is None:
+            segment_path = Path(f"{self._spool_prefix}.{len(self.segments)}.arrows")
+            options = pa.ipc.IpcWriteOptions(compression=env_config.get('cache_compression'))
+            self._sink = pa.OSFile(str(segment_path), 'wb')
+            self._writer = pa.ipc.new_stream(self._sink, table.schema, options=options)
+            self._schema = table.schema
+            self.segments.append((segment_path, table.schema))
+
+        self._writer.write_table(table)
+
+    def _close_segment(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+        self._writer = None
+        self._sink = None
+        self._schema = None
+
+    def _discard_segments(self):
+        self._close_segment()
+        for segment_path, _ in self.segments:
+            try:
+                segment_path.unlink()
+            except FileNotFoundError:
+                pass
+        self.segments = []
+
+    def _switch_to_json(self):
+        """이미 스풀된 배치를 JSON 행으로 되돌리고 JSON 모드로 전환 (트리 구조 출력 등)"""
+        self._close_segment()
+        for segment_path, _ in self.segments:
+            with pa.memory_map(str(segment_path), 'r') as source:
+                for row in pa.ipc.open_stream(source).read_all().to_pylist():
+                    row.setdefault("__children", [])
+                    self.json_rows.append(row)
+        self._discard_segments()
+        self.mode = "json"
+
+    def _commit_arrow(self, result: dict, load_frame: bool = True) -> dict:
+        """스풀 세그먼트를 캐시 항목으로 확정"""
+        table_file = self.cache._get_table_file(self.cache_key)
+
+        if len(self.segments) == 1:
+            # 단일 세그먼트는 그대로 이동 (재기록 없음)
+            os.replace(self.segments[0][0], table_file)
+        else:
+            schema = _merged_schema([schema for _, schema in self.segments])
+            tmp_file = table_file.with_suffix(f".{os.getpid()}.tmp")
+            options = pa.ipc.IpcWriteOptions(compression=env_config.get('cache_compression'))
+
+            with pa.OSFile(str(tmp_file), 'wb') as sink:
+                with pa.ipc.new_stream(sink, schema, options=options) as writer:
+                    for segment_path, _ in self.segments:
+                        with pa.memory_map(str(segment_path), 'r') as source:
+                            for batch in pa.ipc.open_stream(source):
+                                table = pa.Table.from_batches([batch])
+                                columns = [
+                                    table.column(field.name).cast(field.type)
+                                    if field.name in table.column_names
+                                    else pa.nulls(table.num_rows, type=field.type)
+                                    for field in schema
+                                ]
+                                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            os.replace(tmp_file, table_file)
+
+        self._discard_segments()
+
+        entry = {k: v for k, v in result.items() if k not in ("frame", "result")}
+        entry.update(result_format="arrow", row_count=self.row_count)
+        return self.cache._commit_entry(self.file_path, self.command, self.pid, self.cache_key, entry, load_frame)
+
+
+class CacheManifest:
+    """캐시 항목 인덱스 (SQLite) - 통계 O(1), LRU/LFU 정리, 덤프/플러그인별 삭제"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    cache_key TEXT PRIMARY KEY,
+                    dump_fingerprint TEXT,
+                    dump_name TEXT,
+                    plugin TEXT,
+                    pid INTEGER,
+                    status TEXT,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+                CREATE INDEX IF NOT EXISTS idx_entries_dump ON entries(dump_fingerprint, plugin);
+
+                -- 통계는 트리거로 유지 (get_stats가 매 rerun마다 호출됨)
+                CREATE TABLE IF NOT EXISTS totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    entry_count INTEGER NOT NULL,
+                    total_bytes INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+
+                CREATE TRIGGER IF NOT EXISTS trg_entries_insert AFTER INSERT ON entries BEGIN
+                    UPDATE totals SET entry_count = entry_count + 1,
+                                      total_bytes = total_bytes + NEW.size_bytes WHERE id = 0;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_entries_delete AFTER DELETE ON entries BEGIN
+                    UPDATE totals SET entry_count = entry_count - 1,
+                                      total_bytes = total_bytes - OLD.size_bytes WHERE id = 0;
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_entries_update AFTER UPDATE OF size_bytes ON entries BEGIN
+                    UPDATE totals SET total_bytes = total_bytes - OLD.size_bytes + NEW.size_bytes WHERE id = 0;
+                END;
+            """)
+
+            # 실패 항목 만료 시각과 재실행용 덤프 경로 (이전 버전 인덱스에 컬럼 추가)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "expires_at" not in columns:
+                conn.execute("ALTER TABLE entries ADD COLUMN expires_at REAL")
+            if "dump_path" not in columns:
+                conn.execute("ALTER TABLE entries ADD COLUMN dump_path TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at)")
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 연결 (여러 프로세스/스레드에서 동시 사용)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, cache_key: str, dump_fingerprint: Optional[str], dump_name: Optional[str],
+               plugin: Optional[str], pid: Optional[int], status: Optional[str], size_bytes: int,
+               expires_at: Optional[float] = None, dump_path: Optional[str] = None):
+        """항목 기록 (이미 있으면 갱신)"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO entries (cache_key, dump_fingerprint, dump_name, plugin, pid, status,
+                                     size_bytes, created, last_access, expires_at, dump_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    dump_fingerprint = excluded.dump_fingerprint, dump_name = excluded.dump_name,
+                    plugin = excluded.plugin, pid = excluded.pid, status = excluded.status,
+                    size_bytes = excluded.size_bytes, created = excluded.created,
+                    last_access = excluded.last_access, expires_at = excluded.expires_at,
+                    dump_path = COALESCE(excluded.dump_path, entries.dump_path)
+            """, (cache_key, dump_fingerprint, dump_name, plugin, pid, status, size_bytes, now, now,
+                  expires_at, dump_path))
+
+    def touch(self, cache_key: str):
+        """조회 시각/횟수 갱신"""
+        with self._connect() as conn:
+            conn.execute("UPDATE entries SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                         (time.time(), cache_key))
+
+    def remove(self, cache_keys: list):
+        """항목 삭제"""
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE cache_key = ?", [(k,) for k in cache_keys])
+
+    def clear(self):
+        """전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Tuple[int, int]:
+        """(항목 수, 전체 바이트)"""
+        with self._connect() as conn:
+            return conn.execute("SELECT entry_count, total_bytes FROM totals WHERE id = 0").fetchone()
+
+    def eviction_candidates(self, bytes_to_free: int, policy: str = "lru", exclude: Optional[str] = None) -> list:
+        """정리할 항목 키 (LRU: 오래 조회되지 않은 순 / LFU: 적게 조회된 순)"""
+        order = "hits ASC, last_access ASC" if policy == "lfu" else "last_access ASC"
+        keys, freed = [], 0
+
+        with self._connect() as conn:
+            for cache_key, size_bytes in conn.execute(
+                    f"SELECT cache_key, size_bytes FROM entries ORDER BY {order}"):
+                if freed >= bytes_to_free:
+                    break
+                if cache_key == exclude:
+                    continue
+                keys.append(cache_key)
+                freed += size_bytes
+        return keys
+
+    def is_expired(self, cache_key: str, now: Optional[float] = None) -> bool:
+        """만료된 실패 항목인지 확인"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT expires_at FROM entries WHERE cache_key = ?", (cache_key,)).fetchone()
+        return bool(row and row[0] is not None and row[0] <= (now or time.time()))
+
+    def expired_failures(self, now: Optional[float] = None) -> list:
+        """만료된 실패 항목 (캐시 키, 덤프 경로, 플러그인, PID) - 오래 만료된 순"""
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT cache_key, dump_path, plugin, pid FROM entries
+                WHERE expires_at IS NOT NULL AND expires_at <= ? ORDER BY expires_at
+            """, (now or time.time(),)).fetchall()
+
+    def find_keys(self, dump_fingerprint: Optional[str] = None, plugin: Optional[str] = None) -> list:
+        """덤프/플러그인 조건에 맞는 항목 키"""
+        query, params = "SELECT cache_key FROM entries WHERE 1 = 1", []
+        if dump_fingerprint:
+            query += " AND dump_fingerprint = ?"
+            params.append(dump_fingerprint)
+        if plugin:
+            query += " AND plugin = ?"
+            params.append(plugin)
+
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute(query, params)]
+
+    def iter_entries(self) -> list:
+        """모든 항목 (캐시 키, 덤프 지문, 덤프 이름, 플러그인, PID, 상태)"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT cache_key, dump_fingerprint, dump_name, plugin, pid, status FROM entries").fetchall()
+
+    def list_entries(self, dump_fingerprint: str) -> list:
+        """덤프의 전체 결과(PID 미지정) 성공 항목 (캐시 키, 플러그인)"""
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT cache_key, plugin FROM entries
+                WHERE dump_fingerprint = ? AND pid IS NULL AND status = 'success' ORDER BY plugin
+            """, (dump_fingerprint,)).fetchall()
+
+    def list_dumps(self) -> list:
+        """덤프별 요약 (지문, 이름, 항목 수, 바이트)"""
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT dump_fingerprint, MAX(dump_name), COUNT(*), SUM(size_bytes)
+                FROM entries GROUP BY dump_fingerprint ORDER BY MAX(last_access) DESC
+            """).fetchall()
+
+    def list_plugins(self, dump_fingerprint: Optional[str] = None) -> list:
+        """플러그인별 요약 (플러그인, 항목 수, 바이트)"""
+        query, params = "SELECT plugin, COUNT(*), SUM(size_bytes) FROM entries", []
+        if dump_fingerprint:
+            query += " WHERE dump_fingerprint = ?"
+            params.append(dump_fingerprint)
+        query += " GROUP BY plugin ORDER BY plugin"
+
+        with self._connect() as conn:
+            return conn.execute(query, params).fetchall()
 
 
 class SimpleCache:
@@ -12,15 +477,43 @@ class SimpleCache:
     def __init__(self, cache_dir: str = "./cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.fingerprints = FingerprintIndex(self.cache_dir / "index" / "fingerprints.json")
+        self.max_bytes = int(env_config.get('cache_max_mb', 0) * 1024 * 1024)
+        self.eviction_policy = env_config.get('cache_eviction', 'lru')
 
-    def _get_cache_key(self, file_path: str, command: str, pid: Optional[int] = None) -> str:
-        """캐시 키 생성"""
-        # 파일 정보
+        manifest_path = self.cache_dir / "index" / "manifest.db"
+        is_new_manifest = not manifest_path.exists()
+        self.manifest = CacheManifest(manifest_path)
+        if is_new_manifest:
+            self._rebuild_manifest()
+
+        # 항목 저장/삭제를 통지받는 리스너 (검색 인덱스 등)
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """리스너 등록 - on_entry_saved(cache_key, dump_fingerprint, dump_name, plugin, pid, status),
+        on_entries_deleted(cache_keys), on_cache_cleared() 메서드를 가진 객체"""
+        self._listeners.append(listener)
+
+    def _notify(self, method: str, *args):
+        for listener in self._listeners:
+            try:
+                getattr(listener, method)(*args)
+            except Exception as e:
+                print(f"Cache listener {method} failed: {e}")
+
+    def _get_dump_key(self, file_path: str) -> str:
+        """덤프 파일 식별 키 생성 (샘플링 콘텐츠 지문 기반)"""
         try:
-            stat = os.stat(file_path)
-            file_info = f"{Path(file_path).name}_{stat.st_size}_{stat.st_mtime}"
+            return self.fingerprints.get_fingerprint(file_path)
         except:
-            file_info = Path(file_path).name
+            # 파일에 접근할 수 없으면 이름 기반 키 사용
+            return hashlib.md5(Path(file_path).name.encode()).hexdigest()
+
+    def _get_cache_key(self, file_path: str, command: str, pid: Optional[int] = None) -> str:
+        """캐시 키 생성"""
+        # 파일 정보 (복사/이동/touch 해도 내용이 같으면 같은 키)
+        file_info = self._get_dump_key(file_path)
 
         # 분석 정보
         analysis_info = f"{command}_{pid if pid else 'no_pid'}"
@@ -30,32 +523,238 @@ class SimpleCache:
         return hashlib.md5(hash_string.encode()).hexdigest()
 
     def _get_cache_file(self, cache_key: str) -> Path:
-        """캐시 파일 경로"""
+        """캐시 파일 경로 (메타데이터 또는 JSON 결과)"""
         return self.cache_dir / f"{cache_key}.json"
 
-    def get(self, file_path: str, command: str, pid: Optional[int] = None) -> Optional[dict]:
-        """캐시 조회"""
+    def _get_table_file(self, cache_key: str) -> Path:
+        """컬럼형 결과 파일 경로 (Arrow IPC)"""
+        return self.cache_dir / f"{cache_key}.arrow"
+
+    def _get_pid_index_file(self, cache_key: str) -> Path:
+        """PID 분할 인덱스 사이드카 경로 (결과 항목과 함께 삭제)"""
+        index_dir = self.cache_dir / "pid_index"
+        index_dir.mkdir(exist_ok=True)
+        return index_dir / f"{cache_key}.arrow"
+
+    def get(self, file_path: str, command: str, pid: Optional[int] = None,
+            load_frame: bool = True) -> Optional[dict]:
+        """캐시 조회 (컬럼형 결과는 'table_path'에 파일 경로, load_frame이면 'frame'에 DataFrame)"""
         cache_key = self._get_cache_key(file_path, command, pid)
         cache_file = self._get_cache_file(cache_key)
 
         if cache_file.exists():
             try:
                 with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    entry = json.load(f)
+
+                # 만료된 실패 항목은 캐시 미스 (다시 실행)
+                if entry.get("expires_at") and entry["expires_at"] <= time.time():
+                    return None
+
+                if entry.get("result_format") == "arrow":
+                    entry["table_path"] = str(self._get_table_file(cache_key))
+                    if load_frame:
+                        entry["frame"] = table_to_frame(self._read_table(cache_key))
+                elif pa is not None and _is_tabular(entry):
+                    # 기존 JSON 결과는 조회 시점에 컬럼형으로 변환
+                    entry = self._write_entry(cache_key, entry, load_frame)
+
+                self.manifest.touch(cache_key)
+                return entry
             except:
                 pass
         return None
 
-    def save(self, file_path: str, command: str, result: dict, pid: Optional[int] = None):
-        """캐시 저장"""
+    def has_entry(self, file_path: str, command: str, pid: Optional[int] = None) -> bool:
+        """결과를 읽지 않고 캐시 항목 존재 여부만 확인 (만료된 실패 항목은 없는 것으로 취급)"""
         cache_key = self._get_cache_key(file_path, command, pid)
-        cache_file = self._get_cache_file(cache_key)
+        if not self._get_cache_file(cache_key).exists():
+            return False
+        try:
+            return not self.manifest.is_expired(cache_key)
+        except Exception as e:
+            print(f"Cache manifest lookup failed: {e}")
+            return True
+
+    def save(self, file_path: str, command: str, result: dict, pid: Optional[int] = None,
+             load_frame: bool = True) -> Optional[dict]:
+        """캐시 저장 (저장된 항목 반환, 실패 시 None)"""
+        cache_key = self._get_cache_key(file_path, command, pid)
+        dump_fingerprint = self._get_dump_key(file_path)
 
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False)
+            entry = self._write_entry(cache_key, dict(result, dump_fingerprint=dump_fingerprint), load_frame)
         except Exception as e:
             print(f"Cache save failed: {e}")
+            return None
+
+        self._record_entry(file_path, command, pid, cache_key, result.get("status"), result.get("expires_at"))
+        return entry
+
+    def open_writer(self, file_path: str, command: str, pid: Optional[int] = None, on_batch=None) -> ResultWriter:
+        """스트리밍 결과 기록기 생성 (실행 중 배치 단위로 캐시에 기록)"""
+        return ResultWriter(self, file_path, command, pid, on_batch=on_batch)
+
+    def _commit_entry(self, file_path: str, command: str, pid: Optional[int], cache_key: str, entry: dict,
+                      load_frame: bool = True) -> dict:
+        """컬럼형 파일이 이미 기록된 항목의 메타데이터 확정"""
+        entry = dict(entry, dump_fingerprint=self._get_dump_key(file_path))
+        with open(self._get_cache_file(cache_key), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+        self._record_entry(file_path, command, pid, cache_key, entry.get("status"))
+        entry["table_path"] = str(self._get_table_file(cache_key))
+        if load_frame:
+            entry["frame"] = table_to_frame(self._read_table(cache_key))
+        return entry
+
+    def _record_entry(self, file_path: str, command: str, pid: Optional[int], cache_key: str, status: Optional[str],
+                      expires_at: Optional[float] = None):
+        """인덱스 기록 및 용량 한도 적용"""
+        self._delete_exports(cache_key)  # 이전 결과로 만든 내보내기 파일
+        try:
+            self.manifest.record(cache_key, self._get_dump_key(file_path), Path(file_path).name, command, pid,
+                                 status, self._entry_size(cache_key), expires_at, os.path.abspath(file_path))
+            self._enforce_budget(exclude=cache_key)
+        except Exception as e:
+            print(f"Cache manifest update failed: {e}")
+
+        self._notify("on_entry_saved", cache_key, self._get_dump_key(file_path), Path(file_path).name,
+                     command, pid, status)
+
+    def _entry_size(self, cache_key: str) -> int:
+        """항목이 차지하는 디스크 크기"""
+        size = 0
+        for path in (self._get_cache_file(cache_key), self._get_table_file(cache_key)):
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def _delete_exports(self, cache_key: str):
+        """항목 결과로 만든 내보내기 파일 삭제 (common.exporter가 '{cache_key}-{mtime}' 이름으로 생성)"""
+        for export_file in self.cache_dir.glob(f"exports/{cache_key}-*"):
+            try:
+                export_file.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _delete_entries(self, cache_keys: list) -> int:
+        """항목 파일과 인덱스 삭제"""
+        for cache_key in cache_keys:
+            for path in (self._get_cache_file(cache_key), self._get_table_file(cache_key),
+                         self._get_pid_index_file(cache_key)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._delete_exports(cache_key)
+        self.manifest.remove(cache_keys)
+        self._notify("on_entries_deleted", list(cache_keys))
+        return len(cache_keys)
+
+    def _enforce_budget(self, exclude: Optional[str] = None):
+        """용량 한도를 넘으면 정책(LRU/LFU)에 따라 오래된 항목 정리"""
+        if self.max_bytes <= 0:
+            return
+
+        _, total_bytes = self.manifest.stats()
+        if total_bytes <= self.max_bytes:
+            return
+
+        victims = self.manifest.eviction_candidates(total_bytes - self.max_bytes, self.eviction_policy, exclude)
+        if victims:
+            self._delete_entries(victims)
+            print(f"Cache evicted {len(victims)} entries ({self.eviction_policy})")
+
+    def _rebuild_manifest(self):
+        """인덱스가 없을 때 기존 캐시 파일로부터 한 번 재구성"""
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                cache_key = cache_file.stem
+                self.manifest.record(cache_key, entry.get("dump_fingerprint"), None, entry.get("command"),
+                                     entry.get("pid"), entry.get("status"), self._entry_size(cache_key),
+                                     entry.get("expires_at"))
+            except Exception as e:
+                print(f"Cache manifest rebuild skipped {cache_file.name}: {e}")
+
+    def purge(self, dump_fingerprint: Optional[str] = None, plugin: Optional[str] = None) -> int:
+        """덤프/플러그인 단위 선택 정리"""
+        return self._delete_entries(self.manifest.find_keys(dump_fingerprint, plugin))
+
+    def _write_entry(self, cache_key: str, result: dict, load_frame: bool = True) -> dict:
+        """결과 기록 - 표 형태는 Arrow(+zstd), 그 외(text_output/트리/오류)는 JSON"""
+        cache_file = self._get_cache_file(cache_key)
+        entry = {k: v for k, v in result.items() if k not in ("frame", "table_path")}
+
+        if pa is not None and _is_tabular(entry):
+            try:
+                table = rows_to_table(entry.pop("result"))
+                self._write_table(cache_key, table)
+                entry["result_format"] = "arrow"
+                entry["row_count"] = table.num_rows
+            except Exception as e:
+                print(f"Columnar cache write failed, falling back to JSON: {e}")
+                entry = {k: v for k, v in result.items() if k not in ("frame", "table_path")}
+                table = None
+        else:
+            table = None
+
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+        if table is not None:
+            entry = dict(entry, table_path=str(self._get_table_file(cache_key)))
+            if load_frame:
+                entry["frame"] = table_to_frame(table)
+        return entry
+
+    def _write_table(self, cache_key: str, table):
+        """Arrow IPC 파일 기록 (임시 파일 후 교체)"""
+        table_file = self._get_table_file(cache_key)
+        tmp_file = table_file.with_suffix(f".{os.getpid()}.tmp")
+        options = pa.ipc.IpcWriteOptions(compression=env_config.get('cache_compression'))
+
+        with pa.OSFile(str(tmp_file), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        os.replace(tmp_file, table_file)
+
+    def _read_table(self, cache_key: str):
+        """캐시 항목의 Arrow 테이블 읽기 (메모리 매핑)"""
+        return read_table_file(self._get_table_file(cache_key))
+
+    def get_config_path(self, file_path: str) -> Path:
+        """덤프별 Volatility 설정 파일 경로 (automagic 결과, vol.py -c 형식)"""
+        config_dir = self.cache_dir / "configs"
+        config_dir.mkdir(exist_ok=True)
+        return config_dir / f"{self._get_dump_key(file_path)}.json"
+
+    def load_dump_config(self, file_path: str) -> Optional[dict]:
+        """저장된 덤프 설정 조회 (인제스트 전이면 None, 인제스트 실패 시 빈 dict)"""
+        config_path = self.get_config_path(file_path)
+        if config_path.exists():
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                pass
+        return None
+
+    def save_dump_config(self, file_path: str, config: dict):
+        """덤프 설정 저장"""
+        config_path = self.get_config_path(file_path)
+        tmp_path = config_path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, config_path)
+        except Exception as e:
+            print(f"Config save failed: {e}")
 
     def clear(self) -> int:
         """캐시 정리"""
@@ -64,21 +763,35 @@ class SimpleCache:
             for cache_file in self.cache_dir.glob("*.json"):
                 cache_file.unlink()
                 count += 1
+            for table_file in self.cache_dir.glob("*.arrow"):
+                table_file.unlink()
+            for config_file in self.cache_dir.glob("configs/*.json"):
+                config_file.unlink()
+            for spool_file in self.cache_dir.glob("spool/*"):
+                spool_file.unlink()
+            for index_file in self.cache_dir.glob("pid_index/*"):
+                index_file.unlink()
+            for export_file in self.cache_dir.glob("exports/*"):
+                export_file.unlink()
+            for database_file in self.cache_dir.glob("sql/*"):
+                database_file.unlink()
+            self.manifest.clear()
+            self._notify("on_cache_cleared")
         except:
             pass
         return count
 
     def get_stats(self) -> dict:
-        """캐시 통계"""
+        """캐시 통계 (인덱스의 합계만 조회)"""
         try:
-            files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in files)
+            count, total_size = self.manifest.stats()
             return {
-                'count': len(files),
-                'size_mb': total_size / (1024 * 1024)
+                'count': count,
+                'size_mb': total_size / (1024 * 1024),
+                'max_mb': self.max_bytes / (1024 * 1024)
             }
         except:
-            return {'count': 0, 'size_mb': 0}
+            return {'count': 0, 'size_mb': 0, 'max_mb': 0}
 
 
 # 전역 캐시 인스턴스
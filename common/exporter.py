@@ -0,0 +1,164 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+from .cache_manager import pa, simple_cache
+from .result_transport import attach_table, is_handle
+
+# 형식별 (확장자, MIME 타입)
+EXPORT_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "jsonl": (".jsonl", "application/x-ndjson")
+}
+
+# 한 번에 변환/기록하는 행 수
+EXPORT_CHUNK_ROWS = 50000
+
+
+def get_export_dir() -> Path:
+    """내보내기 파일 디렉토리 (캐시 정리 시 함께 삭제)"""
+    export_dir = simple_cache.cache_dir / "exports"
+    export_dir.mkdir(parents=True, exist_ok=True)
+    return export_dir
+
+
+def _result_identity(df: Optional[pd.DataFrame], source: Optional[dict]) -> str:
+    """결과 식별자 - 결과 파일이 있으면 캐시 키와 수정 시각, 없으면 DataFrame 내용 해시"""
+    if is_handle(source):
+        table_path = Path(source["path"])
+        try:
+            return f"{table_path.stem}-{table_path.stat().st_mtime_ns}"
+        except FileNotFoundError:
+            pass
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(map(str, df.columns)).encode("utf-8"))
+    for name in df.columns:
+        column = df[name]
+        try:
+            hashed = pd.util.hash_pandas_object(column, index=False)
+        except TypeError:
+            # 트리/JSON 결과의 리스트/딕셔너리 값 (__children 등)은 해시할 수 없으므로 문자열로 정규화
+            hashed = pd.util.hash_pandas_object(column.astype(str), index=False)
+        digest.update(hashed.values.tobytes())
+    return f"frame-{digest.hexdigest()}"
+
+
+def _iter_chunks(df: Optional[pd.DataFrame], source: Optional[dict]):
+    """EXPORT_CHUNK_ROWS 단위 DataFrame 조각 (결과 파일이 있으면 배치 단위로만 변환)"""
+    if pa is not None and is_handle(source):
+        try:
+            table = attach_table(source)
+        except FileNotFoundError:
+            table = None
+        if table is not None:
+            for batch in table.to_batches(max_chunksize=EXPORT_CHUNK_ROWS):
+                yield batch.to_pandas()
+            return
+
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        yield df.iloc[start:start + EXPORT_CHUNK_ROWS]
+
+
+def _write_csv(df: Optional[pd.DataFrame], source: Optional[dict], output_path: Path):
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(_iter_chunks(df, source)):
+            chunk.to_csv(f, header=i == 0, index=False)
+
+
+def _write_jsonl(df: Optional[pd.DataFrame], source: Optional[dict], output_path: Path):
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in _iter_chunks(df, source):
+            if len(chunk):
+                f.write(chunk.to_json(orient="records", lines=True, force_ascii=False, date_format="iso").rstrip("\n"))
+                f.write("\n")
+
+
+def _frame_schema(df: pd.DataFrame):
+    """DataFrame 전체 기준 Arrow 스키마와 문자열로 바꿔 기록할 컬럼
+
+    조각마다 타입을 추론하면 첫 조각이 모두 None이거나 조각마다 타입이 다를 때 스키마가 맞지 않으므로
+    전체 컬럼으로 한 번 정한다. 혼합 타입이거나 값이 모두 비어 있는 컬럼은 문자열로 기록.
+    """
+    fields, string_columns = [], set()
+    for name in df.columns:
+        try:
+            field = pa.Schema.from_pandas(df[[name]], preserve_index=False).field(0)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            field = None
+        if field is None or pa.types.is_null(field.type):
+            field = pa.field(str(name), pa.string())
+            string_columns.add(name)
+        fields.append(field)
+    return pa.schema(fields), string_columns
+
+
+def _iter_tables(df: Optional[pd.DataFrame], source: Optional[dict]):
+    """같은 스키마의 Arrow 테이블 조각 (결과 파일이 있으면 파일의 스키마 그대로)"""
+    if is_handle(source):
+        try:
+            table = attach_table(source)
+        except FileNotFoundError:
+            table = None
+        if table is not None:
+            if table.num_rows == 0:
+                yield table
+            for batch in table.to_batches(max_chunksize=EXPORT_CHUNK_ROWS):
+                yield pa.Table.from_batches([batch], schema=table.schema)
+            return
+
+    schema, string_columns = _frame_schema(df)
+    if df.empty:
+        yield schema.empty_table()
+    for chunk in _iter_chunks(df, None):
+        if string_columns:
+            chunk = chunk.copy()
+            for name in string_columns:
+                chunk[name] = chunk[name].map(lambda value: None if value is None or value is pd.NA
+                                              or (isinstance(value, float) and value != value) else str(value))
+        yield pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+
+def _write_parquet(df: Optional[pd.DataFrame], source: Optional[dict], output_path: Path):
+    if pa is None:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow가 필요합니다.")
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for table in _iter_tables(df, source):
+            if writer is None:
+                writer = pq.ParquetWriter(str(output_path), table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+_WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+def export_result(df: Optional[pd.DataFrame], export_format: str, source: Optional[dict] = None) -> Path:
+    """결과를 지정 형식 파일로 내보내기 (같은 결과/형식은 이미 만든 파일 재사용)
+
+    조각 단위로 디스크에 기록하므로 전체 내용을 메모리의 문자열로 만들지 않는다.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+
+    extension, _ = EXPORT_FORMATS[export_format]
+    output_path = get_export_dir() / f"{_result_identity(df, source)}{extension}"
+    if output_path.exists():
+        return output_path
+
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        _WRITERS[export_format](df, source, tmp_path)
+        os.replace(tmp_path, output_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return output_path
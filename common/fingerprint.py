@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+# 샘플링 설정: 앞/뒤 블록 + 내부 균등 간격 블록
+SAMPLE_BLOCK_SIZE = 1024 * 1024
+INTERIOR_SAMPLES = 62
+FULL_HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _read_block(file_path: str, offset: int, size: int) -> bytes:
+    """지정 오프셋의 블록 읽기 (스레드별 독립 파일 핸들)"""
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def compute_sampled_fingerprint(file_path: str, block_size: int = SAMPLE_BLOCK_SIZE,
+                                interior_samples: int = INTERIOR_SAMPLES, max_workers: int = 8) -> str:
+    """샘플 블록 기반 콘텐츠 지문 (파일 이름/mtime과 무관, 멀티 GB 덤프도 수십 MB만 읽음)"""
+    size = os.path.getsize(file_path)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(size.to_bytes(8, 'little'))
+
+    # 작은 파일은 전체를 해시 (샘플링과 결과가 같도록 블록 단위로)
+    if size <= block_size * (interior_samples + 2):
+        offsets = list(range(0, size, block_size))
+    else:
+        stride = (size - block_size) // (interior_samples + 1)
+        offsets = [0] + [stride * i for i in range(1, interior_samples + 1)] + [size - block_size]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        blocks = executor.map(lambda offset: _read_block(file_path, offset, block_size), offsets)
+        for offset, block in zip(offsets, blocks):
+            digest.update(offset.to_bytes(8, 'little'))
+            digest.update(block)
+
+    return f"s1-{digest.hexdigest()}"
+
+
+def compute_full_sha256(file_path: str) -> str:
+    """전체 파일 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(FULL_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FingerprintIndex:
+    """(inode, size, mtime) -> 지문 사이드카 인덱스 - 덤프당 지문 계산은 한 번만"""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries = {}
+        self._loaded_mtime = None
+        self._lock = threading.Lock()
+        self._hashing = set()
+
+    def _stat_key(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _reload(self):
+        """다른 프로세스가 갱신한 인덱스 반영 (lock 보유 상태에서 호출)"""
+        try:
+            mtime = self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if mtime != self._loaded_mtime:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                self._loaded_mtime = mtime
+            except Exception as e:
+                print(f"Fingerprint index load failed: {e}")
+
+    def _write(self):
+        """인덱스 저장 (lock 보유 상태에서 호출)"""
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.index_path)
+            self._loaded_mtime = self.index_path.stat().st_mtime_ns
+        except Exception as e:
+            print(f"Fingerprint index save failed: {e}")
+
+    def _lookup(self, stat_key: str) -> Optional[dict]:
+        """인덱스 조회 (lock 보유 상태에서 호출)"""
+        entry = self._entries.get(stat_key)
+        if entry is None:
+            self._reload()
+            entry = self._entries.get(stat_key)
+        return entry
+
+    def get_fingerprint(self, file_path: str) -> str:
+        """덤프 지문 반환 (인덱스에 없을 때만 계산)"""
+        stat_key = self._stat_key(file_path)
+
+        with self._lock:
+            entry = self._lookup(stat_key)
+            if entry:
+                return entry['fingerprint']
+
+        fingerprint = compute_sampled_fingerprint(file_path)
+
+        with self._lock:
+            self._reload()
+            self._entries[stat_key] = {
+                'path': os.path.abspath(file_path),
+                'fingerprint': fingerprint,
+                'sha256': None
+            }
+            self._write()
+
+        return fingerprint
+
+    def get_sha256(self, file_path: str) -> Optional[str]:
+        """계산된 전체 SHA-256 반환 (아직 없으면 None)"""
+        with self._lock:
+            entry = self._lookup(self._stat_key(file_path))
+            return entry.get('sha256') if entry else None
+
+    def request_full_hash(self, file_path: str):
+        """전체 SHA-256을 백그라운드 스레드에서 계산"""
+        self.get_fingerprint(file_path)
+        stat_key = self._stat_key(file_path)
+
+        with self._lock:
+            entry = self._lookup(stat_key)
+            if entry.get('sha256') or stat_key in self._hashing:
+                return
+            self._hashing.add(stat_key)
+
+        def worker():
+            try:
+                sha256 = compute_full_sha256(file_path)
+                with self._lock:
+                    self._reload()
+                    if stat_key in self._entries:
+                        self._entries[stat_key]['sha256'] = sha256
+                        self._write()
+            except Exception as e:
+                print(f"Full hash failed for {file_path}: {e}")
+            finally:
+                with self._lock:
+                    self._hashing.discard(stat_key)
+
+        threading.Thread(target=worker, daemon=True).start()
@@ -0,0 +1,283 @@
+import json
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+from .cache_manager import pa, read_table_file, simple_cache
+from .pid_index import PID_COLUMNS
+
+if pa is not None:
+    import pyarrow.compute as pc
+
+# 한 번에 인덱스에 넣는 행 수와 검색 결과 최대 개수
+INDEX_BATCH_ROWS = 20000
+DEFAULT_SEARCH_LIMIT = 200
+
+
+def _flatten_rows(rows: list):
+    """JSON 결과 행 (트리 구조의 __children 포함) 평탄화"""
+    for row in rows:
+        if isinstance(row, dict):
+            yield row
+            yield from _flatten_rows(row.get("__children") or [])
+
+
+def _row_pid(row: dict):
+    for name in PID_COLUMNS:
+        if isinstance(row.get(name), int):
+            return row[name]
+    return None
+
+
+def build_match_query(text: str) -> str:
+    """검색어를 FTS5 구문 검색식으로 변환 (IP/경로 구분자는 토큰 경계, 마지막 토큰은 접두사 일치)"""
+    return '"' + text.replace('"', '""') + '"*'
+
+
+class IocIndex:
+    """캐시된 모든 결과(PID 실행 포함)의 문자열 컬럼에 대한 역색인 (SQLite FTS5)
+
+    결과 행마다 문자열 값을 하나의 문서로 색인한다. 항목별 행은 연속된 rowid 범위에 기록해
+    결과가 바뀌거나 삭제되면 범위 단위로 지운다. 색인은 캐시 저장을 통지받아 백그라운드 스레드에서 갱신한다.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self.available = True
+
+        try:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS documents (
+                        doc_id INTEGER PRIMARY KEY,
+                        cache_key TEXT UNIQUE,
+                        dump_fingerprint TEXT,
+                        dump_name TEXT,
+                        plugin TEXT,
+                        pid TEXT,
+                        mtime_ns INTEGER,
+                        rowid_start INTEGER,
+                        rowid_end INTEGER
+                    );
+                    CREATE VIRTUAL TABLE IF NOT EXISTS rows_fts USING fts5(
+                        content, doc_id UNINDEXED, row UNINDEXED, row_pid UNINDEXED
+                    );
+                """)
+        except sqlite3.OperationalError as e:
+            # FTS5가 없는 SQLite 빌드
+            print(f"IOC index disabled: {e}")
+            self.available = False
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 연결"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_worker(self):
+        """색인 스레드 시작 (처음 시작할 때 캐시와 색인을 한 번 맞춤)"""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="ioc-indexer", daemon=True)
+                self._worker.start()
+                self._queue.put(("reconcile", None))
+
+    def start(self):
+        if self.available:
+            self._ensure_worker()
+
+    # SimpleCache 리스너
+
+    def on_entry_saved(self, cache_key: str, dump_fingerprint: str, dump_name: str, plugin: str,
+                       pid, status: Optional[str]):
+        if self.available:
+            self._ensure_worker()
+            self._queue.put(("index", (cache_key, dump_fingerprint, dump_name, plugin, pid, status)))
+
+    def on_entries_deleted(self, cache_keys: list):
+        if self.available:
+            self._ensure_worker()
+            self._queue.put(("delete", cache_keys))
+
+    def on_cache_cleared(self):
+        if self.available:
+            self._ensure_worker()
+            self._queue.put(("clear", None))
+
+    def _run(self):
+        while True:
+            kind, payload = self._queue.get()
+            try:
+                if kind == "index":
+                    self._index_entry(*payload)
+                elif kind == "delete":
+                    with self._connect() as conn:
+                        for cache_key in payload:
+                            self._delete_document(conn, cache_key)
+                elif kind == "clear":
+                    with self._connect() as conn:
+                        conn.execute("DELETE FROM rows_fts")
+                        conn.execute("DELETE FROM documents")
+                elif kind == "reconcile":
+                    self._reconcile()
+            except Exception as e:
+                print(f"IOC index {kind} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _reconcile(self):
+        """캐시 인덱스와 비교해 빠진 항목 색인, 사라진 항목 삭제 (색인 기능 도입 전 캐시 포함)"""
+        entries = {row[0]: row for row in simple_cache.manifest.iter_entries()}
+
+        with self._connect() as conn:
+            indexed = {cache_key: mtime_ns for cache_key, mtime_ns in
+                       conn.execute("SELECT cache_key, mtime_ns FROM documents")}
+            for cache_key in set(indexed) - set(entries):
+                self._delete_document(conn, cache_key)
+
+        for cache_key, entry in entries.items():
+            if cache_key not in indexed or indexed[cache_key] != self._entry_mtime(cache_key):
+                self._index_entry(*entry)
+
+    def _entry_mtime(self, cache_key: str) -> Optional[int]:
+        try:
+            return simple_cache._get_cache_file(cache_key).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _delete_document(self, conn, cache_key: str):
+        """항목의 행 범위와 문서 기록 삭제"""
+        document = conn.execute("SELECT rowid_start, rowid_end FROM documents WHERE cache_key = ?",
+                                (cache_key,)).fetchone()
+        if document:
+            if document[0] is not None:
+                conn.execute("DELETE FROM rows_fts WHERE rowid BETWEEN ? AND ?", document)
+            conn.execute("DELETE FROM documents WHERE cache_key = ?", (cache_key,))
+
+    def _iter_row_batches(self, cache_key: str):
+        """(행 번호, 문자열 내용, 행 PID) 배치 - Arrow 결과는 문자열 컬럼만 이어 붙임"""
+        table_path = simple_cache._get_table_file(cache_key)
+        if pa is not None and table_path.exists():
+            table = read_table_file(table_path)
+            string_columns = [name for name in table.column_names
+                              if pa.types.is_string(table.schema.field(name).type)
+                              or pa.types.is_large_string(table.schema.field(name).type)]
+            pid_column = next((name for name in PID_COLUMNS if name in table.column_names), None)
+            if not string_columns:
+                return
+
+            offset = 0
+            for batch in table.to_batches(max_chunksize=INDEX_BATCH_ROWS):
+                columns = [batch.column(name) for name in string_columns]
+                if len(columns) == 1:
+                    contents = pc.fill_null(columns[0], "")
+                else:
+                    contents = pc.binary_join_element_wise(*columns, " ", null_handling="replace",
+                                                           null_replacement="")
+                pids = batch.column(pid_column).to_pylist() if pid_column else [None] * batch.num_rows
+                yield [(offset + i, content, pid) for i, (content, pid)
+                       in enumerate(zip(contents.to_pylist(), pids)) if content.strip()]
+                offset += batch.num_rows
+            return
+
+        # JSON 결과 (트리/텍스트 출력)
+        try:
+            with open(simple_cache._get_cache_file(cache_key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return
+
+        rows = entry.get("result")
+        # 텍스트 출력은 result 안에 저장됨 ({"text_output": ...})
+        text_output = rows.get("text_output") if isinstance(rows, dict) else entry.get("text_output")
+        if isinstance(rows, list):
+            batch = []
+            for i, row in enumerate(_flatten_rows(rows)):
+                content = " ".join(value for name, value in row.items()
+                                   if isinstance(value, str) and name != "__children")
+                if content.strip():
+                    batch.append((i, content, _row_pid(row)))
+                if len(batch) >= INDEX_BATCH_ROWS:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        elif isinstance(text_output, str):
+            lines = text_output.splitlines()
+            yield [(i, line, None) for i, line in enumerate(lines) if line.strip()]
+
+    def _index_entry(self, cache_key: str, dump_fingerprint: str, dump_name: str, plugin: str,
+                     pid, status: Optional[str]):
+        """항목 하나를 (다시) 색인"""
+        mtime_ns = self._entry_mtime(cache_key)
+
+        with self._connect() as conn:
+            self._delete_document(conn, cache_key)
+            if status != "success" or mtime_ns is None:
+                return
+
+            cursor = conn.execute("""
+                INSERT INTO documents (cache_key, dump_fingerprint, dump_name, plugin, pid, mtime_ns)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (cache_key, dump_fingerprint, dump_name, plugin, None if pid is None else str(pid), mtime_ns))
+            doc_id = cursor.lastrowid
+
+            # 항목의 행은 연속된 rowid로 기록 (삭제 시 범위로 제거)
+            rowid_start = conn.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM rows_fts").fetchone()[0]
+            next_rowid = rowid_start
+            for batch in self._iter_row_batches(cache_key):
+                conn.executemany(
+                    "INSERT INTO rows_fts (rowid, content, doc_id, row, row_pid) VALUES (?, ?, ?, ?, ?)",
+                    [(next_rowid + i, content, doc_id, row, row_pid)
+                     for i, (row, content, row_pid) in enumerate(batch)]
+                )
+                next_rowid += len(batch)
+
+            if next_rowid > rowid_start:
+                conn.execute("UPDATE documents SET rowid_start = ?, rowid_end = ? WHERE doc_id = ?",
+                             (rowid_start, next_rowid - 1, doc_id))
+
+    def pending(self) -> int:
+        """색인 대기 중인 작업 수"""
+        return self._queue.unfinished_tasks
+
+    def search(self, text: str, limit: int = DEFAULT_SEARCH_LIMIT) -> list:
+        """모든 덤프의 결과에서 검색 (덤프, 플러그인, PID, 행 번호, 일치 부분)"""
+        text = text.strip()
+        if not self.available or not text:
+            return []
+
+        self.start()
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT d.dump_name, d.dump_fingerprint, d.plugin, COALESCE(d.pid, f.row_pid), f.row,
+                       snippet(rows_fts, 0, '[', ']', '…', 16)
+                FROM rows_fts f JOIN documents d ON d.doc_id = f.doc_id
+                WHERE rows_fts MATCH ?
+                LIMIT ?
+            """, (build_match_query(text), limit)).fetchall()
+
+        return [{
+            "dump": dump_name,
+            "dump_fingerprint": dump_fingerprint,
+            "plugin": plugin,
+            "pid": None if pid is None else str(pid),
+            "row": row,
+            "match": match
+        } for dump_name, dump_fingerprint, plugin, pid, row, match in rows]
+
+
+# 전역 IOC 인덱스 인스턴스 (캐시 저장/삭제 시 자동 갱신)
+ioc_index = IocIndex(simple_cache.cache_dir / "index" / "ioc.db")
+simple_cache.add_listener(ioc_index)
@@ -0,0 +1,188 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+import psutil
+from .cache_manager import simple_cache
+
+# 작업 상태
+PLANNED, RUNNING, DONE, FAILED, CANCELLED = "planned", "running", "done", "failed", "cancelled"
+
+
+def _process_id(pid: int) -> Optional[str]:
+    """프로세스 식별자 (PID 재사용과 구분하도록 시작 시각 포함, 없는 프로세스는 None)"""
+    try:
+        return f"{pid}:{psutil.Process(pid).create_time()}"
+    except psutil.Error:
+        return None
+
+
+# 이 서버 프로세스의 식별자
+OWNER_ID = _process_id(os.getpid())
+
+
+class JobStore:
+    """분석 실행 기록 (SQLite) - 실행별 플러그인 작업 상태와 vol 프로세스 정보
+
+    UI 세션이 새로 열리면 진행 상태와 완료된 결과를 이 기록에서 복원하고, 서버가 재시작되면
+    끝나지 않은 실행을 이어서 진행한다 (실행 중이던 vol 프로세스는 출력 파일로 다시 연결).
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_key TEXT NOT NULL,
+                    dump_path TEXT NOT NULL,
+                    categories TEXT NOT NULL,
+                    workers INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    owner TEXT,
+                    started_at REAL NOT NULL,
+                    finished_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, dump_path);
+
+                CREATE TABLE IF NOT EXISTS jobs (
+                    run_id INTEGER NOT NULL,
+                    plugin TEXT NOT NULL,
+                    title TEXT,
+                    position INTEGER NOT NULL,
+                    state TEXT NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    error TEXT,
+                    command TEXT,
+                    os_pid INTEGER,
+                    create_time REAL,
+                    spool_id TEXT,
+                    timeout REAL,
+                    PRIMARY KEY (run_id, plugin)
+                );
+            """)
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 연결 (여러 스레드에서 동시 사용)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def start_run(self, run_key: str, dump_path: str, categories: list, plugins: list, workers: int) -> int:
+        """실행 기록 시작 (같은 실행 키의 이전 실행은 중단 처리) - plugins: [(플러그인, 제목)]"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("UPDATE runs SET status = 'stopped', finished_at = ? WHERE run_key = ? AND status = 'running'",
+                         (now, run_key))
+            run_id = conn.execute("""
+                INSERT INTO runs (run_key, dump_path, categories, workers, status, owner, started_at)
+                VALUES (?, ?, ?, ?, 'running', ?, ?)
+            """, (run_key, os.path.abspath(dump_path), json.dumps(categories, ensure_ascii=False), workers,
+                  OWNER_ID, now)).lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (run_id, plugin, title, position, state) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, plugin, title, i, PLANNED) for i, (plugin, title) in enumerate(plugins)]
+            )
+        return run_id
+
+    def finish_run(self, run_id: int, status: str):
+        """실행 종료 기록 (이미 끝난 실행은 그대로 둠)"""
+        with self._connect() as conn:
+            conn.execute("UPDATE runs SET status = ?, finished_at = ? WHERE run_id = ? AND status = 'running'",
+                         (status, time.time(), run_id))
+
+    def claim_run(self, run: dict) -> bool:
+        """끝나지 않은 실행을 현재 프로세스가 이어받음 (다른 프로세스가 먼저 가져갔으면 False)"""
+        with self._connect() as conn:
+            cursor = conn.execute("""
+                UPDATE runs SET owner = ? WHERE run_id = ? AND status = 'running' AND owner IS ?
+            """, (OWNER_ID, run["run_id"], run["owner"]))
+            return cursor.rowcount == 1
+
+    @contextmanager
+    def job(self, run_id: Optional[int], plugin: str):
+        """작업 구간 - 이 스레드에서 시작한 vol 프로세스를 (run_id, plugin) 작업에 기록"""
+        previous = getattr(self._local, 'job', None)
+        self._local.job = (run_id, plugin) if run_id is not None else None
+        try:
+            yield
+        finally:
+            self._local.job = previous
+
+    def set_state(self, run_id: Optional[int], plugin: str, state: str, error: Optional[str] = None):
+        """작업 상태 기록"""
+        if run_id is None:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                if state == RUNNING:
+                    conn.execute("UPDATE jobs SET state = ?, started_at = COALESCE(started_at, ?) "
+                                 "WHERE run_id = ? AND plugin = ?", (state, now, run_id, plugin))
+                else:
+                    conn.execute("""
+                        UPDATE jobs SET state = ?, finished_at = ?, error = ?, os_pid = NULL, spool_id = NULL
+                        WHERE run_id = ? AND plugin = ?
+                    """, (state, now, error, run_id, plugin))
+        except Exception as e:
+            print(f"Job store update failed: {e}")
+
+    def attach_process(self, command: str, os_pid: int, spool_id: str, timeout: float):
+        """현재 작업의 vol 프로세스와 출력 파일 기록 (재시작 후 다시 연결할 때 사용)"""
+        job = getattr(self._local, 'job', None)
+        if job is None:
+            return
+        try:
+            create_time = psutil.Process(os_pid).create_time()
+            with self._connect() as conn:
+                conn.execute("""
+                    UPDATE jobs SET command = ?, os_pid = ?, create_time = ?, spool_id = ?, timeout = ?
+                    WHERE run_id = ? AND plugin = ?
+                """, (command, os_pid, create_time, spool_id, timeout, *job))
+        except Exception as e:
+            print(f"Job store update failed: {e}")
+
+    def active_runs(self, dump_path: Optional[str] = None) -> list:
+        """끝나지 않은 실행 목록 (dict)"""
+        query, params = "SELECT * FROM runs WHERE status = 'running'", []
+        if dump_path:
+            query += " AND dump_path = ?"
+            params.append(os.path.abspath(dump_path))
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            runs = [dict(row) for row in conn.execute(query + " ORDER BY run_id", params)]
+        for run in runs:
+            run["categories"] = json.loads(run["categories"])
+        return runs
+
+    def get_jobs(self, run_id: int) -> list:
+        """실행의 작업 목록 (dict, 제출 순서)"""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in
+                    conn.execute("SELECT * FROM jobs WHERE run_id = ? ORDER BY position", (run_id,))]
+
+    def is_orphaned(self, run: dict) -> bool:
+        """실행을 관리하던 프로세스가 더 이상 없는지 확인 (서버 재시작)"""
+        owner = run.get("owner")
+        if owner == OWNER_ID:
+            return False
+        return owner is None or _process_id(int(owner.split(":")[0])) != owner
+
+
+# 전역 작업 기록 인스턴스
+job_store = JobStore(simple_cache.cache_dir / "index" / "jobs.db")
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+import numpy as np
+import pandas as pd
+from .cache_manager import SimpleCache, simple_cache, pa, read_table_file, table_to_frame
+
+# --pid 실행 결과가 전체 실행 결과를 PID 컬럼으로 거른 것과 같은 플러그인
+# (memmap/dumpfiles/yarascan은 PID 지정 여부에 따라 동작 자체가 달라 제외)
+SUPERSET_PLUGINS = {
+    "windows.dlllist",
+    "windows.malfind",
+    "windows.vadinfo",
+    "windows.handles",
+    "windows.cmdline",
+    "windows.envars",
+    "windows.ldrmodules",
+    "windows.privileges",
+    "windows.getsids",
+    "windows.threads",
+}
+
+# 플러그인마다 다른 PID 컬럼 이름
+PID_COLUMNS = ("PID", "Pid", "pid")
+
+# 프로세스 메모리에 유지하는 분할 테이블 수
+MAX_LOADED_TABLES = 8
+
+
+class PidIndex:
+    """전체 실행 결과의 PID 분할 인덱스 - PID 질의를 Volatility 재실행 없이 처리
+
+    캐시된 결과를 PID 순으로 정렬한 사본(무압축 Arrow)과 PID별 (시작, 길이)를 사이드카로 저장하고,
+    질의는 메모리 매핑된 사본의 구간만 잘라 반환한다.
+    """
+
+    def __init__(self, cache: SimpleCache):
+        self.cache = cache
+        self._tables = OrderedDict()  # cache_key -> (source_mtime_ns, table, offsets)
+        self._lock = threading.Lock()
+
+    def lookup(self, dump_path: str, command: str, pid: int) -> Optional[pd.DataFrame]:
+        """캐시된 전체 실행 결과에서 PID 행 조회 (상위 결과가 없으면 None)"""
+        if pa is None or command not in SUPERSET_PLUGINS:
+            return None
+
+        entry = self.cache.get(dump_path, command, load_frame=False)
+        if not entry or entry.get("status") != "success" or not entry.get("table_path"):
+            return None
+
+        try:
+            partitioned = self._load(Path(entry["table_path"]))
+        except Exception as e:
+            print(f"PID index load failed for {command}: {e}")
+            return None
+
+        if partitioned is None:
+            return None  # PID 컬럼이 없는 결과
+
+        table, offsets = partitioned
+        start, length = offsets.get(str(pid), (0, 0))
+        return table_to_frame(table.slice(start, length))
+
+    def _load(self, table_path: Path):
+        """분할 테이블 로드 (메모리 → 사이드카 파일 → 새로 생성 순)"""
+        cache_key = table_path.stem
+        source_mtime = table_path.stat().st_mtime_ns
+
+        with self._lock:
+            loaded = self._tables.get(cache_key)
+            if loaded and loaded[0] == source_mtime:
+                self._tables.move_to_end(cache_key)
+                return loaded[1]
+
+            index_file = self.cache._get_pid_index_file(cache_key)
+            partitioned = self._read_index(index_file, source_mtime)
+            if partitioned is False:
+                partitioned = self._build_index(table_path, index_file, source_mtime)
+
+            self._tables[cache_key] = (source_mtime, partitioned)
+            while len(self._tables) > MAX_LOADED_TABLES:
+                self._tables.popitem(last=False)
+            return partitioned
+
+    def _read_index(self, index_file: Path, source_mtime: int):
+        """사이드카 파일 읽기 (없거나 원본보다 오래되었으면 False)"""
+        if not index_file.exists():
+            return False
+
+        table = read_table_file(index_file)
+        metadata = table.schema.metadata or {}
+        if int(metadata.get(b"source_mtime_ns", b"0")) != source_mtime:
+            return False
+
+        offsets = json.loads(metadata[b"pid_offsets"])
+        return (table, offsets) if offsets is not None else None
+
+    def _build_index(self, table_path: Path, index_file: Path, source_mtime: int):
+        """원본 결과를 PID 순으로 정렬해 사이드카 파일로 저장"""
+        table = read_table_file(table_path)
+        pid_column = next((name for name in PID_COLUMNS if name in table.column_names), None)
+
+        if pid_column is None:
+            partitioned, offsets = None, None
+            table = table.slice(0, 0)
+        else:
+            pids = table.column(pid_column).to_pandas().fillna(-1).astype(np.int64).to_numpy()
+            order = np.argsort(pids, kind="stable")
+            table = table.take(pa.array(order))
+            values, starts, counts = np.unique(pids[order], return_index=True, return_counts=True)
+            offsets = {str(v): (int(s), int(c)) for v, s, c in zip(values, starts, counts)}
+            partitioned = (table, offsets)
+
+        metadata = {b"source_mtime_ns": str(source_mtime).encode(), b"pid_offsets": json.dumps(offsets).encode()}
+        table = table.replace_schema_metadata(metadata)
+
+        # 구간 조회가 복사 없이 이루어지도록 무압축으로 기록
+        tmp_file = index_file.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp_file), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_file, index_file)
+
+        if partitioned is None:
+            return None
+        # 기록한 파일을 메모리 매핑으로 다시 열어 정렬 사본을 힙에 유지하지 않음
+        return self._read_index(index_file, source_mtime)
+
+
+# 전역 PID 인덱스 인스턴스
+pid_index = PidIndex(simple_cache)
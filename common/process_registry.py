@@ -0,0 +1,216 @@
+import os
+import signal
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+import psutil
+
+# 중단 요청 후 SIGTERM에서 SIGKILL까지 기다리는 시간 (초)
+KILL_GRACE_SECONDS = 5.0
+
+CANCELLED_MESSAGE = "분석이 중단되었습니다."
+
+
+def kill_tree(process: subprocess.Popen, grace: float = KILL_GRACE_SECONDS):
+    """프로세스와 그 하위 프로세스 전체 종료 (SIGTERM 후 grace초 안에 끝나지 않으면 SIGKILL)"""
+    if process.poll() is not None:
+        return
+
+    if os.name == 'posix':
+        # spawn()으로 시작한 프로세스는 자신이 리더인 프로세스 그룹을 가짐
+        def send(sig):
+            try:
+                os.killpg(process.pid, sig)
+            except ProcessLookupError:
+                pass
+    else:
+        try:
+            tree = [psutil.Process(process.pid)]
+            tree += tree[0].children(recursive=True)
+        except psutil.Error:
+            tree = []
+
+        def send(sig):
+            for proc in tree:
+                try:
+                    proc.terminate() if sig == signal.SIGTERM else proc.kill()
+                except psutil.Error:
+                    pass
+
+    send(signal.SIGTERM)
+
+    def force_kill():
+        if process.poll() is None:
+            send(signal.SIGKILL if os.name == 'posix' else None)
+
+    timer = threading.Timer(grace, force_kill)
+    timer.daemon = True
+    timer.start()
+
+
+class ReattachedProcess:
+    """이전 서버 프로세스가 시작한 vol 프로세스 (자식이 아니므로 psutil로 상태 확인)
+
+    Popen과 같은 pid/poll()/wait() 인터페이스를 제공해 kill_tree()와 출력 수집에 그대로 사용한다.
+    """
+
+    def __init__(self, pid: int, proc: Optional[psutil.Process]):
+        self.pid = pid
+        self._proc = proc
+        self.returncode = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                if self._proc is not None and self._proc.is_running() \
+                        and self._proc.status() != psutil.STATUS_ZOMBIE:
+                    return None
+            except psutil.Error:
+                pass
+            # 실제 종료 코드는 알 수 없음 (vol 종료 코드는 출력 파일 옆의 종료 코드 파일로 확인)
+            self.returncode = -1
+        return self.returncode
+
+    def wait(self) -> int:
+        while self.poll() is None:
+            time.sleep(0.2)
+        return self.returncode
+
+
+class ProcessRegistry:
+    """실행 중인 작업의 vol 프로세스 그룹 관리 - 실행 키/플러그인 단위 또는 전체 중단
+
+    작업 스레드는 job() 구간 안에서 spawn()으로 프로세스를 시작하고, 워커 풀처럼 프로세스를
+    직접 소유하지 않는 백엔드는 on_cancel()로 중단 방법을 등록한다.
+    """
+
+    def __init__(self, grace: float = KILL_GRACE_SECONDS):
+        self.grace = grace
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._processes: Dict[Tuple[str, Optional[str]], set] = {}
+        self._callbacks: Dict[Tuple[str, Optional[str]], set] = {}
+        self._cancelled = set()
+        # 아직 시작되지 않은(대기 중인) 작업에 대한 중단 요청 - job() 진입 시 적용
+        self._pending = set()
+
+    @contextmanager
+    def job(self, run_key: str, plugin: Optional[str] = None):
+        """작업 구간 - 이 스레드에서 시작한 프로세스를 (run_key, plugin)에 연결"""
+        tag = (run_key, plugin)
+        previous = getattr(self._local, 'tag', None)
+        self._local.tag = tag
+        with self._lock:
+            self._processes.setdefault(tag, set())
+            if tag in self._pending or (run_key, None) in self._pending:
+                self._pending.discard(tag)
+                self._cancelled.add(tag)
+        try:
+            yield tag
+        finally:
+            self._local.tag = previous
+            with self._lock:
+                self._processes.pop(tag, None)
+                self._callbacks.pop(tag, None)
+                self._cancelled.discard(tag)
+
+    def is_cancelled(self) -> bool:
+        """현재 작업에 중단 요청이 있었는지 확인"""
+        tag = getattr(self._local, 'tag', None)
+        with self._lock:
+            return tag is not None and tag in self._cancelled
+
+    def spawn(self, cmd: list, **kwargs) -> subprocess.Popen:
+        """새 프로세스 그룹으로 프로세스 시작 (현재 작업이 이미 중단됐으면 바로 종료)"""
+        if os.name == 'posix':
+            kwargs['start_new_session'] = True
+        else:
+            kwargs['creationflags'] = kwargs.get('creationflags', 0) | subprocess.CREATE_NEW_PROCESS_GROUP
+
+        process = subprocess.Popen(cmd, **kwargs)
+        tag = getattr(self._local, 'tag', None)
+        if tag is not None:
+            with self._lock:
+                self._processes.setdefault(tag, set()).add(process)
+                cancelled = tag in self._cancelled
+            if cancelled:
+                kill_tree(process, self.grace)
+        return process
+
+    def reattach(self, os_pid: int, create_time: float) -> ReattachedProcess:
+        """기록된 vol 프로세스를 현재 작업에 연결 (이미 끝났거나 PID가 재사용됐으면 종료된 상태로 반환)"""
+        try:
+            proc = psutil.Process(os_pid)
+            if abs(proc.create_time() - create_time) > 1:
+                proc = None
+        except psutil.Error:
+            proc = None
+
+        process = ReattachedProcess(os_pid, proc)
+        tag = getattr(self._local, 'tag', None)
+        if tag is not None:
+            with self._lock:
+                self._processes.setdefault(tag, set()).add(process)
+                cancelled = tag in self._cancelled
+            if cancelled:
+                kill_tree(process, self.grace)
+        return process
+
+    def release(self, process: subprocess.Popen):
+        """끝난 프로세스 등록 해제"""
+        with self._lock:
+            for processes in self._processes.values():
+                processes.discard(process)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]):
+        """구간 안에서 현재 작업이 중단되면 callback 호출"""
+        tag = getattr(self._local, 'tag', None)
+        if tag is None:
+            yield
+            return
+
+        with self._lock:
+            self._callbacks.setdefault(tag, set()).add(callback)
+            cancelled = tag in self._cancelled
+        if cancelled:
+            callback()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._callbacks.get(tag, set()).discard(callback)
+
+    def clear_pending(self, run_key: str):
+        """실행 키의 대기 중 중단 요청 삭제 (새 실행 시작 시 - 이전 실행에 대한 요청이 남지 않도록)"""
+        with self._lock:
+            self._pending = {tag for tag in self._pending if tag[0] != run_key}
+
+    def cancel(self, run_key: Optional[str] = None, plugin: Optional[str] = None) -> int:
+        """작업 중단 - run_key만 지정하면 실행 전체, 둘 다 없으면 모든 작업 (종료한 프로세스 수 반환)
+
+        run_key를 지정한 요청은 아직 job()에 들어오지 않은 대기 중 작업에도 적용된다.
+        """
+        with self._lock:
+            tags = {tag for tag in self._processes
+                    if (run_key is None or tag[0] == run_key) and (plugin is None or tag[1] == plugin)}
+            self._cancelled |= tags
+            if run_key is not None:
+                self._pending.add((run_key, plugin))
+            processes = [process for tag in tags for process in self._processes.get(tag, ())]
+            callbacks = [callback for tag in tags for callback in self._callbacks.get(tag, ())]
+
+        for process in processes:
+            kill_tree(process, self.grace)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Cancel callback failed: {e}")
+        return len(processes) + len(callbacks)
+
+
+# 전역 프로세스 레지스트리 인스턴스
+process_registry = ProcessRegistry()
@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+import psutil
+
+# 샘플링 간격 (초)과 링 버퍼 크기 (기본 10분)
+SAMPLE_INTERVAL = 1.0
+SAMPLE_CAPACITY = 600
+
+
+class ResourceSampler:
+    """공유 리소스 샘플러 - 백그라운드 스레드 하나가 고정 크기 링 버퍼에 기록하고,
+    모든 세션/화면은 대기 없이 버퍼를 읽는다 (psutil.cpu_percent(interval=1) 대체)"""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, capacity: int = SAMPLE_CAPACITY):
+        self.interval = interval
+        self._samples = deque(maxlen=capacity)  # (timestamp, cpu_percent, memory_percent)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._owner_pid = None
+
+    def _ensure_started(self):
+        """샘플링 스레드 시작 (프로세스당 하나)"""
+        if self._thread is not None and self._thread.is_alive() and self._owner_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._owner_pid == os.getpid():
+                return
+            self._owner_pid = os.getpid()
+            self._samples.clear()
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+
+    def _sample(self):
+        """샘플 하나 기록 (cpu_percent는 직전 호출 이후의 평균이므로 대기 없음)"""
+        sample = (time.time(), psutil.cpu_percent(interval=None), psutil.virtual_memory().percent)
+        with self._lock:
+            self._samples.append(sample)
+        return sample
+
+    def _run(self):
+        psutil.cpu_percent(interval=None)  # 기준점 설정
+        while True:
+            time.sleep(self.interval)
+            try:
+                self._sample()
+            except Exception as e:
+                print(f"Resource sampling failed: {e}")
+
+    def latest(self) -> Tuple[float, float]:
+        """최근 (CPU %, 메모리 %) - 아직 샘플이 없으면 메모리만 즉시 측정"""
+        self._ensure_started()
+        with self._lock:
+            if self._samples:
+                _, cpu_percent, memory_percent = self._samples[-1]
+                return cpu_percent, memory_percent
+        return 0.0, psutil.virtual_memory().percent
+
+    def history(self, since: Optional[float] = None) -> list:
+        """since 이후의 (timestamp, CPU %, 메모리 %) 샘플 목록"""
+        self._ensure_started()
+        with self._lock:
+            samples = list(self._samples)
+        if since is not None:
+            samples = [sample for sample in samples if sample[0] >= since]
+        return samples
+
+
+# 전역 리소스 샘플러 인스턴스
+resource_sampler = ResourceSampler()
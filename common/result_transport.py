@@ -0,0 +1,45 @@
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+from .cache_manager import pa, read_table_file, table_to_frame
+
+# 결과 전달 방식: DataFrame을 큐로 pickle 하지 않고 캐시에 기록된 Arrow 파일 경로만 전달
+TRANSPORT_FORMAT = "arrow"
+
+
+def make_handle(entry: dict) -> Optional[dict]:
+    """캐시 항목에서 전달용 핸들 생성 (컬럼형 결과가 아니면 None)"""
+    table_path = entry.get("table_path")
+    if pa is None or not table_path:
+        return None
+
+    return {
+        "format": TRANSPORT_FORMAT,
+        "path": str(Path(table_path).resolve()),
+        "rows": entry.get("row_count")
+    }
+
+
+def is_handle(value) -> bool:
+    """전달된 값이 결과 핸들인지 확인"""
+    return isinstance(value, dict) and value.get("format") == TRANSPORT_FORMAT and "path" in value
+
+
+def attach_table(handle: dict) -> 'pa.Table':
+    """핸들이 가리키는 Arrow 파일을 메모리 매핑으로 열어 테이블 반환 (필터/정렬을 Arrow에서 처리할 때 사용)"""
+    if pa is None:
+        raise RuntimeError("pyarrow가 설치되어 있지 않아 결과 파일을 열 수 없습니다.")
+
+    table_path = Path(handle["path"])
+    if not table_path.exists():
+        raise FileNotFoundError(f"결과 파일이 정리되었습니다: {table_path.name}")
+
+    return read_table_file(table_path)
+
+
+def attach(handle: dict) -> pd.DataFrame:
+    """핸들이 가리키는 Arrow 파일을 메모리 매핑으로 열어 DataFrame 반환
+
+    비압축 파일의 고정 폭 컬럼은 매핑된 버퍼를 그대로 참조한다 (CACHE_COMPRESSION 미사용 시).
+    """
+    return table_to_frame(attach_table(handle))
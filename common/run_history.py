@@ -0,0 +1,217 @@
+import os
+import sqlite3
+import statistics
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from .cache_manager import simple_cache
+
+# 이력이 전혀 없는 플러그인의 기본 예상 실행 시간 (초)
+DEFAULT_ESTIMATE = 60.0
+
+# 추정에 사용할 플러그인별 최근 실행 수
+HISTORY_WINDOW = 20
+
+# 메모리 이력이 전혀 없는 플러그인의 기본 예상 최대 메모리 (MB)
+DEFAULT_MEMORY_MB = 1024.0
+
+# 적응형 제한 시간: 덤프 크기로 보정한 과거 실행 시간의 상위 백분위 × 여유 배수
+TIMEOUT_PERCENTILE = 0.95
+TIMEOUT_MARGIN = 3.0
+MIN_TIMEOUT = 120.0
+# 성공 이력이 이보다 적으면 기본 제한 시간보다 짧게 잡지 않음
+MIN_TIMEOUT_SAMPLES = 3
+
+
+def _pid_count(pid) -> int:
+    """실행한 PID 수 (PID 미지정 0, 일괄 실행은 목록 길이)"""
+    if isinstance(pid, (list, tuple, set)):
+        return len(pid)
+    return 1 if pid else 0
+
+
+class RunHistory:
+    """플러그인 실행 시간 이력 (SQLite) - 덤프 크기로 정규화해 다른 덤프의 실행 시간 추정"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    plugin TEXT NOT NULL,
+                    pid_scoped INTEGER NOT NULL DEFAULT 0,
+                    pid_count INTEGER,
+                    dump_fingerprint TEXT,
+                    dump_size INTEGER NOT NULL,
+                    duration REAL NOT NULL,
+                    status TEXT,
+                    finished_at REAL NOT NULL,
+                    peak_rss_mb REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_runs_plugin ON runs(plugin, pid_scoped, status, finished_at);
+            """)
+
+            # 이전 버전 이력 파일에 최대 메모리 컬럼 추가
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+            if "peak_rss_mb" not in columns:
+                conn.execute("ALTER TABLE runs ADD COLUMN peak_rss_mb REAL")
+            # 여러 PID 일괄 실행의 PID 수 (없으면 PID 하나 실행)
+            if "pid_count" not in columns:
+                conn.execute("ALTER TABLE runs ADD COLUMN pid_count INTEGER")
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 연결 (여러 스레드에서 동시 사용)"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, dump_path: str, plugin: str, pid: Optional[int], duration: float, status: Optional[str],
+               peak_rss_mb: Optional[float] = None):
+        """실제 실행 한 번 기록 (캐시 적중은 기록하지 않음, pid는 PID 하나 또는 일괄 실행한 PID 목록)"""
+        try:
+            dump_size = os.path.getsize(dump_path)
+            with self._connect() as conn:
+                conn.execute("""
+                    INSERT INTO runs (plugin, pid_scoped, pid_count, dump_fingerprint, dump_size, duration, status,
+                                      finished_at, peak_rss_mb)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (plugin, 1 if pid else 0, _pid_count(pid), simple_cache._get_dump_key(dump_path), dump_size,
+                      duration, status, time.time(), peak_rss_mb))
+        except Exception as e:
+            print(f"Run history record failed: {e}")
+
+    def _seconds_per_byte(self, conn, plugin: str) -> Optional[float]:
+        """최근 성공 실행의 바이트당 실행 시간 중앙값"""
+        rows = conn.execute("""
+            SELECT duration, dump_size FROM runs
+            WHERE plugin = ? AND pid_scoped = 0 AND status = 'success' AND dump_size > 0
+            ORDER BY finished_at DESC LIMIT ?
+        """, (plugin, HISTORY_WINDOW)).fetchall()
+        if not rows:
+            return None
+        return statistics.median(duration / dump_size for duration, dump_size in rows)
+
+    def estimate(self, dump_path: str, plugins: Iterable[str]) -> Dict[str, float]:
+        """덤프에 대한 플러그인별 예상 실행 시간 (초)
+
+        캐시된 플러그인은 0, 이력이 없는 플러그인은 다른 플러그인 추정치의 중앙값을 사용한다.
+        """
+        plugins = list(plugins)
+        try:
+            dump_size = os.path.getsize(dump_path)
+            with self._connect() as conn:
+                rates = {plugin: self._seconds_per_byte(conn, plugin) for plugin in plugins}
+        except Exception as e:
+            print(f"Run history lookup failed: {e}")
+            dump_size, rates = 0, {}
+
+        known = [rate * dump_size for rate in rates.values() if rate is not None]
+        fallback = statistics.median(known) if known else DEFAULT_ESTIMATE
+
+        estimates = {}
+        for plugin in plugins:
+            if simple_cache.has_entry(dump_path, plugin):
+                estimates[plugin] = 0.0
+            elif rates.get(plugin) is not None:
+                estimates[plugin] = rates[plugin] * dump_size
+            else:
+                estimates[plugin] = fallback
+        return estimates
+
+    def timeout_for(self, dump_path: str, plugin: str, pid=None, default: float = 600.0,
+                    maximum: float = 7200.0) -> float:
+        """플러그인 실행 제한 시간 (초) - 이력이 없으면 default
+
+        PID 실행 이력은 PID 하나당 시간으로 환산하고, 여러 PID 일괄 실행은 PID 수만큼 늘린다
+        (default/maximum도 PID 수만큼 - 일괄 실행 한 번이 개별 실행 여러 번을 대신함).
+        """
+        batch = max(_pid_count(pid), 1)
+        default, maximum = default * batch, maximum * batch
+        try:
+            dump_size = os.path.getsize(dump_path)
+            with self._connect() as conn:
+                rows = conn.execute("""
+                    SELECT duration / MAX(COALESCE(pid_count, 1), 1), dump_size FROM runs
+                    WHERE plugin = ? AND pid_scoped = ? AND status = 'success' AND dump_size > 0
+                    ORDER BY finished_at DESC LIMIT ?
+                """, (plugin, 1 if pid else 0, HISTORY_WINDOW)).fetchall()
+        except Exception as e:
+            print(f"Run history lookup failed: {e}")
+            return default
+
+        if not rows:
+            return default
+
+        scaled = sorted(duration * batch * dump_size / size for duration, size in rows)
+        percentile = scaled[min(len(scaled) - 1, int(len(scaled) * TIMEOUT_PERCENTILE))]
+        timeout = max(percentile * TIMEOUT_MARGIN, MIN_TIMEOUT)
+        if len(rows) < MIN_TIMEOUT_SAMPLES:
+            timeout = max(timeout, default)
+        return min(timeout, maximum)
+
+    def consecutive_failures(self, dump_path: str, plugin: str, pid=None) -> int:
+        """같은 덤프에서 최근 연속 실패 횟수"""
+        try:
+            with self._connect() as conn:
+                statuses = [row[0] for row in conn.execute("""
+                    SELECT status FROM runs
+                    WHERE plugin = ? AND pid_scoped = ? AND dump_fingerprint = ?
+                    ORDER BY finished_at DESC LIMIT ?
+                """, (plugin, 1 if pid else 0, simple_cache._get_dump_key(dump_path), HISTORY_WINDOW))]
+        except Exception as e:
+            print(f"Run history lookup failed: {e}")
+            return 0
+
+        count = 0
+        for status in statuses:
+            if status == 'success':
+                break
+            count += 1
+        return count
+
+    def _peak_memory(self, conn, plugin: str, dump_fingerprint: str, dump_size: int) -> Optional[float]:
+        """플러그인 최대 메모리 추정 (같은 덤프 → 비슷한 크기(×2 이내) 덤프 → 전체 이력 순)"""
+        same_dump = conn.execute("""
+            SELECT MAX(peak_rss_mb) FROM runs
+            WHERE plugin = ? AND dump_fingerprint = ? AND peak_rss_mb IS NOT NULL
+        """, (plugin, dump_fingerprint)).fetchone()[0]
+        if same_dump is not None:
+            return same_dump
+
+        rows = conn.execute("""
+            SELECT peak_rss_mb, dump_size FROM runs
+            WHERE plugin = ? AND peak_rss_mb IS NOT NULL
+            ORDER BY finished_at DESC LIMIT ?
+        """, (plugin, HISTORY_WINDOW)).fetchall()
+        if not rows:
+            return None
+
+        similar = [peak for peak, size in rows if dump_size / 2 <= size <= dump_size * 2]
+        return statistics.median(similar or [peak for peak, _ in rows])
+
+    def estimate_memory(self, dump_path: str, plugins: Iterable[str]) -> Dict[str, float]:
+        """덤프에 대한 플러그인별 예상 최대 메모리 (MB, vol 자식 프로세스 RSS 기준)"""
+        plugins = list(plugins)
+        try:
+            dump_size = os.path.getsize(dump_path)
+            dump_fingerprint = simple_cache._get_dump_key(dump_path)
+            with self._connect() as conn:
+                peaks = {plugin: self._peak_memory(conn, plugin, dump_fingerprint, dump_size) for plugin in plugins}
+        except Exception as e:
+            print(f"Run history lookup failed: {e}")
+            peaks = {}
+
+        return {plugin: peaks.get(plugin) or DEFAULT_MEMORY_MB for plugin in plugins}
+
+
+# 전역 실행 이력 인스턴스
+run_history = RunHistory(simple_cache.cache_dir / "index" / "run_history.db")
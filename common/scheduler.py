@@ -0,0 +1,384 @@
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+from UI.config import env_config
+from .volatility import (run_volatility_process, run_volatility_with_cache, resume_volatility_process,
+                         run_pid_batch, ingest_dump, log_with_time)
+from .cache_manager import simple_cache
+from .process_registry import process_registry, CANCELLED_MESSAGE
+from .job_store import job_store, RUNNING, DONE, FAILED, CANCELLED
+from .result_transport import is_handle
+from .run_history import run_history
+
+# 만료된 실패 캐시 항목 확인 간격 (초)
+FAILURE_REFRESH_INTERVAL = 60
+
+
+def _plugin_fields(plugin_data):
+    """플러그인 설정 항목을 (emoji, title, command)로 변환"""
+    if isinstance(plugin_data, dict):
+        # 새로운 딕셔너리 구조
+        return plugin_data['emoji'], plugin_data['label'], plugin_data['command']
+    # 기존 튜플 구조
+    return plugin_data
+
+
+def deduplicate_plugins(categories: Dict[str, list]):
+    """여러 카테고리의 플러그인을 명령어 기준으로 합침
+
+    반환: (중복 없는 플러그인 목록, 명령어 -> 해당 명령어를 포함한 카테고리 목록)
+    """
+    plugins, targets = [], {}
+    for category, category_plugins in categories.items():
+        for plugin_data in category_plugins:
+            command = _plugin_fields(plugin_data)[2]
+            if command not in targets:
+                targets[command] = []
+                plugins.append(plugin_data)
+            targets[command].append(category)
+    return plugins, targets
+
+
+def estimate_remaining(estimates: Dict[str, float], running: Dict[str, float], finished: set,
+                       workers: int, now: Optional[float] = None) -> float:
+    """남은 실행 시간 추정 (초)
+
+    실행 중인 작업은 예상 시간에서 경과 시간을 뺀 만큼 워커를 점유하고,
+    대기 작업은 긴 것부터 가장 먼저 비는 워커에 배치한다 (스케줄러와 같은 순서).
+    """
+    now = now or time.time()
+    lanes = [max(estimates.get(plugin, 0.0) - (now - started), 0.0) for plugin, started in running.items()]
+    lanes += [0.0] * max(workers - len(lanes), 0)
+    heapq.heapify(lanes)
+
+    pending = sorted((estimate for plugin, estimate in estimates.items()
+                      if plugin not in running and plugin not in finished), reverse=True)
+    for estimate in pending:
+        heapq.heappush(lanes, heapq.heappop(lanes) + estimate)
+
+    return max(lanes) if lanes else 0.0
+
+
+class AdmissionController:
+    """작업 입장 제어 - 동시 실행 수와 예상 메모리 합계가 한도 안일 때만 새 작업 시작
+
+    대기 작업은 도착 순서(긴 작업 우선으로 제출된 순서)대로 입장하며, 실행 중인 작업이 없으면
+    한도보다 큰 작업도 단독으로 입장한다.
+    """
+
+    def __init__(self, max_jobs: int, memory_budget_mb: float):
+        self.max_jobs = max(1, max_jobs)
+        self.memory_budget_mb = memory_budget_mb
+        self._cond = threading.Condition()
+        self._tickets = itertools.count()
+        self._waiting = deque()
+        self.running = 0
+        self.reserved_mb = 0.0
+
+    def _fits(self, need_mb: float) -> bool:
+        if self.running >= self.max_jobs:
+            return False
+        if self.running == 0 or self.memory_budget_mb <= 0:
+            return True
+        return self.reserved_mb + need_mb <= self.memory_budget_mb
+
+    def acquire(self, need_mb: float, stop_event: Optional[threading.Event] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """입장 대기 (중단 요청 또는 작업 취소 시 False)"""
+        with self._cond:
+            ticket = next(self._tickets)
+            self._waiting.append(ticket)
+            try:
+                while self._waiting[0] != ticket or not self._fits(need_mb):
+                    if (stop_event is not None and stop_event.is_set()) or (is_cancelled and is_cancelled()):
+                        return False
+                    self._cond.wait(timeout=0.5)
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+
+            self.running += 1
+            self.reserved_mb += need_mb
+            return True
+
+    def release(self, need_mb: float):
+        """작업 종료"""
+        with self._cond:
+            self.running -= 1
+            self.reserved_mb = max(self.reserved_mb - need_mb, 0.0)
+            self._cond.notify_all()
+
+    @contextmanager
+    def admit(self, need_mb: float, stop_event: Optional[threading.Event] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None):
+        """입장 구간 (중단 요청으로 입장하지 못하면 False)"""
+        admitted = self.acquire(need_mb, stop_event, is_cancelled)
+        try:
+            yield admitted
+        finally:
+            if admitted:
+                self.release(need_mb)
+
+
+class JobScheduler:
+    """Volatility 작업 스케줄러 - UI 프로세스의 스레드에서 vol 자식 프로세스를 직접 관리
+
+    카테고리 실행마다 별도 프로세스/프로세스 풀을 만들지 않고, 작업 스레드가 vol.py 자식
+    프로세스(또는 워커 풀 요청)를 기다리기만 한다. 전체 동시 실행 수는 max_concurrency로,
+    동시에 실행 중인 작업의 예상 최대 메모리 합계는 memory_budget_mb로 제한.
+    """
+
+    def __init__(self, max_concurrency: int, memory_budget_mb: float = 0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.admission = AdmissionController(self.max_concurrency, memory_budget_mb)
+        self._refresher = None
+        self._refresher_lock = threading.Lock()
+
+    def _job_backend(self) -> str:
+        """작업 실행 백엔드 (in-process 실행은 UI 프로세스 GIL을 점유하므로 워밍 워커 풀로 전달)"""
+        backend = env_config.get('vol_backend')
+        return 'pool' if backend == 'inprocess' else backend
+
+    def start_category(self, dump_path: str, category: str, plugins: list, max_workers: int,
+                       result_queue: queue.Queue, progress_queue: queue.Queue,
+                       stop_event: Optional[threading.Event] = None, run_id: Optional[int] = None,
+                       reattach: Optional[Dict[str, dict]] = None, completed_offset: int = 0) -> threading.Thread:
+        """카테고리 분석 시작 (진행/결과 이벤트는 큐로 전달)
+
+        run_id: 작업 상태를 기록할 작업 기록 실행 id
+        reattach: 이어서 실행할 때 다시 연결할 vol 프로세스 (플러그인 -> 작업 기록)
+        completed_offset: 이어서 실행할 때 이미 끝난 작업 수
+        """
+        # 이전 실행에 대해 남은 대기 중 중단 요청은 새 실행에 적용하지 않음
+        process_registry.clear_pending(category)
+        thread = threading.Thread(
+            target=self._run_category,
+            args=(dump_path, category, plugins, max_workers, result_queue, progress_queue, stop_event,
+                  run_id, reattach or {}, completed_offset),
+            name=f"analysis-{category}",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def start_failure_refresher(self):
+        """만료된 실패 항목을 주기적으로 다시 실행하는 백그라운드 스레드 시작 (한 번만)"""
+        with self._refresher_lock:
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher = threading.Thread(target=self._refresh_failures_loop,
+                                                   name="failure-refresher", daemon=True)
+                self._refresher.start()
+
+    def _refresh_failures_loop(self):
+        while True:
+            time.sleep(FAILURE_REFRESH_INTERVAL)
+            try:
+                self.refresh_expired_failures()
+            except Exception as e:
+                log_with_time(f"💥 Failure refresh error: {e}")
+
+    def refresh_expired_failures(self) -> int:
+        """만료된 실패 항목 다시 실행 (분석 작업과 같은 입장 제어 적용) - 다시 실행한 항목 수 반환"""
+        refreshed = 0
+        for cache_key, dump_path, plugin, pid in simple_cache.manifest.expired_failures():
+            # 덤프가 사라졌거나 바뀐 항목은 건너뜀 (캐시 정리 대상)
+            if not dump_path or not os.path.exists(dump_path) \
+                    or simple_cache._get_cache_key(dump_path, plugin, pid) != cache_key:
+                continue
+
+            with process_registry.job("refresh", plugin), \
+                    self.admission.admit(run_history.estimate_memory(dump_path, [plugin])[plugin]):
+                log_with_time(f"🔁 Retrying expired failure: {plugin}" + (f" (PID {pid})" if pid else ""))
+                run_volatility_with_cache(dump_path, plugin, pid, load_frame=False, backend=self._job_backend())
+            refreshed += 1
+        return refreshed
+
+    def run_pid_batch(self, dump_path: str, commands: list, pids: list, max_workers: int) -> Dict[str, dict]:
+        """PID 분석: 플러그인마다 모든 PID를 한 번에 실행 (플러그인 간 병렬, 전역 실행 한도 적용)
+
+        반환: 명령어 -> {pid: (df, error)}
+        """
+
+        memory = run_history.estimate_memory(dump_path, commands)
+
+        def job(command: str):
+            with process_registry.job("pid", command), self.admission.admit(memory[command]):
+                return run_pid_batch(command, dump_path, pids, backend=self._job_backend())
+
+        workers = max(1, min(max_workers, self.max_concurrency, len(commands)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pid-batch") as executor:
+            return dict(zip(commands, executor.map(job, commands)))
+
+    def cancel(self, run_key: Optional[str] = None, plugin: Optional[str] = None) -> int:
+        """실행 중/대기 중인 작업 중단 (실행 전체, 플러그인 하나 또는 모든 작업)
+
+        작업의 vol 프로세스 그룹에 SIGTERM을 보내고 KILL_GRACE_SECONDS 안에 끝나지 않으면 SIGKILL.
+        """
+        return process_registry.cancel(run_key, plugin)
+
+    def _run_job(self, plugin: str, title: str, dump_path: str, category: str, need_mb: float,
+                 result_queue: queue.Queue, progress_queue: queue.Queue, stop_event: Optional[threading.Event],
+                 run_id: Optional[int] = None, attached: Optional[dict] = None):
+        """작업 하나 실행 - 입장(실행 수/메모리 한도) 후 행 배치를 부분 결과로 전달"""
+
+        def on_batch(batch_df, total_rows: int):
+            result_queue.put({
+                'type': 'partial',
+                'category': category,
+                'plugin_name': plugin,
+                'plugin': plugin,
+                'title': title,
+                'df': batch_df,
+                'rows': total_rows
+            })
+
+        # 작업 구간 안에서 시작한 vol 프로세스 그룹은 cancel()로 한 번에 종료하고, 작업 기록에 남김
+        with process_registry.job(category, plugin), job_store.job(run_id, plugin), \
+                self.admission.admit(need_mb, stop_event, process_registry.is_cancelled) as admitted:
+            if not admitted or process_registry.is_cancelled():
+                job_store.set_state(run_id, plugin, CANCELLED)
+                return plugin, None, CANCELLED_MESSAGE
+
+            job_store.set_state(run_id, plugin, RUNNING)
+            progress_queue.put({
+                'type': 'job_start',
+                'category': category,
+                'plugin': plugin,
+                'title': title,
+                'started_at': time.time()
+            })
+
+            if attached:
+                # 서버 재시작 전에 시작된 vol 프로세스에 다시 연결
+                result = resume_volatility_process(plugin, dump_path, attached, on_batch=on_batch)
+            else:
+                result = run_volatility_process(plugin, dump_path, on_batch=on_batch, backend=self._job_backend())
+
+            error = result[2]
+            job_store.set_state(run_id, plugin, CANCELLED if error == CANCELLED_MESSAGE else FAILED if error else DONE,
+                                error)
+            return result
+
+    def _run_category(self, dump_path: str, category: str, plugins: list, max_workers: int,
+                      result_queue: queue.Queue, progress_queue: queue.Queue,
+                      stop_event: Optional[threading.Event], run_id: Optional[int] = None,
+                      reattach: Optional[Dict[str, dict]] = None, completed_offset: int = 0):
+        """카테고리의 모든 플러그인 실행 (이벤트 구조는 AsyncAnalysisManager와 동일)"""
+        reattach = reattach or {}
+        try:
+            started = time.time()
+            completed_count = completed_offset
+            total_count = len(plugins) + completed_offset
+            workers = max(1, min(max_workers, self.max_concurrency))
+
+            # 덤프 인제스트 (automagic 1회 실행 후 모든 플러그인이 설정 재사용)
+            with process_registry.job(category):
+                ingest_dump(dump_path, backend=self._job_backend())
+
+            # 실행 이력 기반 예상 시간으로 긴 작업부터 제출 (전체 소요 시간 단축)
+            jobs = [_plugin_fields(plugin_data) for plugin_data in plugins]
+            estimates = run_history.estimate(dump_path, [plugin for _, _, plugin in jobs])
+            jobs.sort(key=lambda job: estimates[job[2]], reverse=True)
+
+            # 캐시된 플러그인은 메모리를 쓰지 않으므로 입장 제어에서 제외
+            memory = run_history.estimate_memory(dump_path, [plugin for _, _, plugin in jobs])
+            memory = {plugin: memory[plugin] if estimates[plugin] > 0 else 0.0 for plugin in memory}
+
+            # 시작 알림 (ETA 계산용 예상 시간 포함)
+            progress_queue.put({
+                'type': 'start',
+                'category': category,
+                'total': total_count,
+                'estimates': estimates,
+                'workers': workers
+            })
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"job-{category}") as executor:
+                # 모든 작업 제출
+                future_to_plugin = {}
+                for emoji, title, plugin in jobs:
+                    future = executor.submit(self._run_job, plugin, title, dump_path, category, memory[plugin],
+                                             result_queue, progress_queue, stop_event, run_id, reattach.get(plugin))
+                    future_to_plugin[future] = (emoji, title, plugin)
+
+                # 완료된 작업 처리
+                for future in as_completed(future_to_plugin):
+                    if stop_event is not None and stop_event.is_set():
+                        # 중단 요청: 아직 시작되지 않은 작업 취소
+                        for pending in future_to_plugin:
+                            pending.cancel()
+                        break
+
+                    emoji, title, plugin = future_to_plugin[future]
+                    completed_count += 1
+
+                    try:
+                        plugin_name, df, error = future.result()
+
+                        # 컬럼형 결과는 DataFrame 대신 결과 파일 핸들만 전송 (UI에서 메모리 매핑)
+                        handle = df if is_handle(df) else None
+
+                        result_queue.put({
+                            'type': 'result',
+                            'category': category,
+                            'plugin_name': plugin_name,
+                            'plugin': plugin,
+                            'title': title,
+                            'df': None if handle else df,
+                            'handle': handle,
+                            'error': error,
+                            'cancelled': error == CANCELLED_MESSAGE,
+                            'from_cache': False
+                        })
+                    except Exception as e:
+                        result_queue.put({
+                            'type': 'result',
+                            'category': category,
+                            'plugin_name': plugin,
+                            'plugin': plugin,
+                            'title': title,
+                            'df': None,
+                            'error': str(e)
+                        })
+
+                    # 진행 상황 업데이트
+                    progress_queue.put({
+                        'type': 'progress',
+                        'category': category,
+                        'plugin': plugin,
+                        'completed': completed_count,
+                        'total': total_count,
+                        'current_plugin': title,
+                        'last_completed': title
+                    })
+
+            # 완료 알림
+            if run_id is not None:
+                job_store.finish_run(run_id, "stopped" if stop_event is not None and stop_event.is_set()
+                                     else "completed")
+            progress_queue.put({
+                'type': 'completed',
+                'category': category,
+                'total_time': time.time() - started
+            })
+
+        except Exception as e:
+            log_with_time(f"💥 Scheduler error ({category}): {e}")
+            if run_id is not None:
+                job_store.finish_run(run_id, "error")
+            progress_queue.put({
+                'type': 'error',
+                'category': category,
+                'error': str(e)
+            })
+
+
+# 전역 스케줄러 인스턴스
+job_scheduler = JobScheduler(env_config.get('max_concurrent_jobs', 1), env_config.get('memory_budget_mb', 0))
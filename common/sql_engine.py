@@ -0,0 +1,253 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+import pandas as pd
+from .cache_manager import pa, read_table_file, simple_cache, table_to_frame
+
+# 분석 엔진 (선택적 의존성, 없으면 SQLite 사용)
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+SAVED_QUERIES_PATH = Path("resources/saved_queries.json")
+
+# SQLite로 적재할 때 한 번에 기록하는 행 수
+LOAD_CHUNK_ROWS = 50000
+INT64_MAX = 2 ** 63 - 1
+OS_PREFIXES = ("windows", "linux", "mac")
+
+
+def plugin_table_name(plugin: str) -> str:
+    """플러그인 명령어를 테이블 이름으로 변환 (windows.registry.userassist -> registry_userassist)"""
+    parts = plugin.split(".")
+    if len(parts) > 1 and parts[0] in OS_PREFIXES:
+        parts = parts[1:]
+    # 'shimcachemem.ShimcacheMem'처럼 클래스 이름까지 지정한 경우 중복 제거
+    if len(parts) > 1 and parts[-1].lower() == parts[-2].lower():
+        parts = parts[:-1]
+    return re.sub(r"\W", "_", "_".join(parts).lower())
+
+
+def _is_index_column(name: str) -> bool:
+    """인덱스를 만들 컬럼 (PID/오프셋/경로 - 플러그인 간 조인 키)"""
+    lower = name.lower()
+    return lower.endswith("pid") or lower.startswith("offset") or "path" in lower
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _frame_for_sqlite(df: pd.DataFrame) -> pd.DataFrame:
+    """SQLite에 넣을 수 없는 값 변환 (int64 범위를 넘는 주소는 16진수 문자열, 기타 객체는 문자열)"""
+    df = df.copy()
+    for name in df.columns:
+        column = df[name]
+        if isinstance(column.dtype, pd.UInt64Dtype) and column.max(skipna=True) is not pd.NA \
+                and column.max(skipna=True) > INT64_MAX:
+            df[name] = column.map(lambda value: hex(value) if pd.notna(value) else None).astype(object)
+        elif column.dtype == object:
+            df[name] = column.map(lambda value: value if value is None or isinstance(value, (str, int, float, bool))
+                                  else str(value))
+    return df
+
+
+class ResultDatabase:
+    """덤프 하나의 플러그인 결과를 테이블로 적재한 질의용 데이터베이스
+
+    DuckDB가 설치되어 있으면 Arrow 결과 파일을 그대로 적재하고, 없으면 SQLite를 사용한다.
+    적재 상태는 _sources 테이블에 (캐시 키, 결과 파일 수정 시각)으로 기록해 바뀐 결과만 다시 적재한다.
+    """
+
+    def __init__(self, dump_path: str, database_dir: Path):
+        self.dump_path = dump_path
+        self.dump_fingerprint = simple_cache._get_dump_key(dump_path)
+        self.engine = "duckdb" if duckdb is not None else "sqlite"
+        database_dir.mkdir(parents=True, exist_ok=True)
+        self.database_path = database_dir / f"{self.dump_fingerprint}.{self.engine}"
+        self._lock = threading.Lock()
+
+        if self.engine == "duckdb":
+            self.conn = duckdb.connect(str(self.database_path))
+        else:
+            self.conn = sqlite3.connect(str(self.database_path), check_same_thread=False)
+
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS _sources (
+                table_name TEXT PRIMARY KEY,
+                plugin TEXT,
+                cache_key TEXT,
+                mtime_ns BIGINT,
+                row_count BIGINT
+            )
+        """)
+        self._commit()
+
+    def _execute(self, sql: str, params: tuple = ()):
+        return self.conn.execute(sql, params)
+
+    def _commit(self):
+        if self.engine == "sqlite":
+            self.conn.commit()
+
+    def sync(self) -> dict:
+        """캐시의 결과와 테이블 동기화 (새/바뀐 결과 적재, 사라진 결과 삭제)"""
+        wanted = {}
+        for cache_key, plugin in simple_cache.manifest.list_entries(self.dump_fingerprint):
+            table_path = simple_cache._get_table_file(cache_key)
+            try:
+                mtime_ns = table_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # 표 형태가 아닌 결과 (트리/텍스트)
+
+            table_name = plugin_table_name(plugin)
+            if table_name in wanted:
+                table_name = re.sub(r"\W", "_", plugin.lower())
+            wanted[table_name] = (plugin, cache_key, mtime_ns, table_path)
+
+        changes = {"loaded": [], "dropped": []}
+        with self._lock:
+            loaded = {row[0]: (row[1], row[2]) for row in
+                      self._execute("SELECT table_name, cache_key, mtime_ns FROM _sources").fetchall()}
+
+            for table_name, (cache_key, mtime_ns) in loaded.items():
+                if wanted.get(table_name, (None, None, None))[1:3] != (cache_key, mtime_ns):
+                    self._drop_table(table_name)
+                    if table_name not in wanted:
+                        changes["dropped"].append(table_name)
+
+            for table_name, (plugin, cache_key, mtime_ns, table_path) in wanted.items():
+                if loaded.get(table_name) == (cache_key, mtime_ns):
+                    continue
+                try:
+                    row_count = self._load_table(table_name, table_path)
+                    self._execute("INSERT INTO _sources VALUES (?, ?, ?, ?, ?)",
+                                  (table_name, plugin, cache_key, mtime_ns, row_count))
+                    changes["loaded"].append(table_name)
+                except Exception as e:
+                    print(f"SQL load failed for {plugin}: {e}")
+
+            self._commit()
+
+        return changes
+
+    def _drop_table(self, table_name: str):
+        """테이블과 적재 기록 삭제 (lock 보유 상태에서 호출)"""
+        self._execute(f"DROP TABLE IF EXISTS {_quote(table_name)}")
+        self._execute("DELETE FROM _sources WHERE table_name = ?", (table_name,))
+
+    def _load_table(self, table_name: str, table_path: Path) -> int:
+        """Arrow 결과 파일을 테이블로 적재하고 조인 키 컬럼에 인덱스 생성 (lock 보유 상태에서 호출)"""
+        table = read_table_file(table_path)
+        quoted = _quote(table_name)
+
+        if self.engine == "duckdb":
+            self.conn.register("_arrow_source", table)
+            try:
+                self._execute(f"CREATE TABLE {quoted} AS SELECT * FROM _arrow_source")
+            finally:
+                self.conn.unregister("_arrow_source")
+        else:
+            for i, batch in enumerate(table.to_batches(max_chunksize=LOAD_CHUNK_ROWS)):
+                _frame_for_sqlite(table_to_frame(pa.Table.from_batches([batch]))).to_sql(
+                    table_name, self.conn, if_exists="replace" if i == 0 else "append", index=False)
+            if table.num_rows == 0:
+                self._execute(f"CREATE TABLE IF NOT EXISTS {quoted} "
+                              f"({', '.join(_quote(name) for name in table.column_names)})")
+
+        for column in table.column_names:
+            if _is_index_column(column):
+                index_name = _quote(f"idx_{table_name}_{re.sub(r'[^0-9A-Za-z]', '_', column)}")
+                self._execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {quoted} ({_quote(column)})")
+
+        return table.num_rows
+
+    def list_tables(self) -> list:
+        """적재된 테이블 목록 (테이블, 플러그인, 행 수, 컬럼 목록)"""
+        with self._lock:
+            rows = self._execute("SELECT table_name, plugin, row_count FROM _sources ORDER BY table_name").fetchall()
+            tables = []
+            for table_name, plugin, row_count in rows:
+                cursor = self._execute(f"SELECT * FROM {_quote(table_name)} LIMIT 0")
+                tables.append((table_name, plugin, row_count, [column[0] for column in cursor.description]))
+            return tables
+
+    def query(self, sql: str) -> Tuple[pd.DataFrame, float]:
+        """SQL 실행 후 (결과 DataFrame, 소요 시간 초) 반환"""
+        started = time.perf_counter()
+        with self._lock:
+            if self.engine == "duckdb":
+                df = table_to_frame(self._execute(sql).fetch_arrow_table())
+            else:
+                df = pd.read_sql_query(sql, self.conn)
+        return df, time.perf_counter() - started
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class SqlEngine:
+    """덤프별 질의 데이터베이스 관리 (가장 최근 덤프 하나만 연결 유지)"""
+
+    def __init__(self, database_dir: Path):
+        self.database_dir = Path(database_dir)
+        self._database: Optional[ResultDatabase] = None
+        self._lock = threading.Lock()
+
+    @property
+    def engine_name(self) -> str:
+        return "DuckDB" if duckdb is not None else "SQLite"
+
+    def get_database(self, dump_path: str) -> ResultDatabase:
+        """덤프의 데이터베이스 반환 (캐시된 결과와 동기화 후)"""
+        with self._lock:
+            if self._database is None or self._database.dump_path != dump_path:
+                if self._database is not None:
+                    self._database.close()
+                self._database = ResultDatabase(dump_path, self.database_dir)
+            database = self._database
+
+        database.sync()
+        return database
+
+
+def load_saved_queries() -> list:
+    """저장된 질의 목록 [{'name', 'sql'}]"""
+    try:
+        with open(SAVED_QUERIES_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f).get("queries", [])
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"Saved queries load failed: {e}")
+        return []
+
+
+def _write_saved_queries(queries: list):
+    SAVED_QUERIES_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = SAVED_QUERIES_PATH.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"queries": queries}, f, ensure_ascii=False, indent=2)
+    tmp_path.replace(SAVED_QUERIES_PATH)
+
+
+def save_query(name: str, sql: str):
+    """질의 저장 (같은 이름은 덮어씀)"""
+    queries = [query for query in load_saved_queries() if query["name"] != name]
+    queries.append({"name": name, "sql": sql})
+    _write_saved_queries(queries)
+
+
+def delete_query(name: str):
+    """저장된 질의 삭제"""
+    _write_saved_queries([query for query in load_saved_queries() if query["name"] != name])
+
+
+# 전역 SQL 엔진 인스턴스
+sql_engine = SqlEngine(simple_cache.cache_dir / "sql")
@@ -40,8 +40,8 @@ def clean_dump_files():
         return False
 
 
-def save_csv_file(data: str, plugin_name: str, pid: str = None) -> str:
-    """CSV 파일 저장 함수"""
+def save_csv_file(data, plugin_name: str, pid: str = None) -> str:
+    """CSV 파일 저장 함수 (DataFrame은 조각 단위로 스트리밍 기록)"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     if pid:
@@ -52,8 +52,12 @@ def save_csv_file(data: str, plugin_name: str, pid: str = None) -> str:
     output_file_path = os.path.join(env_config['output_path'], filename)
 
     try:
-        with open(output_file_path, 'w', encoding='utf-8', newline='') as f:
-            f.write(data)
+        if isinstance(data, str):
+            with open(output_file_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(data)
+        else:
+            from common.exporter import export_result
+            shutil.copyfile(export_result(data, "csv"), output_file_path)
         return output_file_path
     except Exception as e:
         raise Exception(f"파일 저장 실패: {str(e)}")
@@ -0,0 +1,211 @@
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from UI.config import env_config
+from .cache_manager import simple_cache
+
+# 프레임워크 로드 상태 (프로세스당 한 번만 import)
+_framework_lock = threading.Lock()
+_plugin_list = None
+
+
+def _load_framework() -> dict:
+    """volatility3 프레임워크를 라이브러리로 로드하고 플러그인 목록 반환"""
+    global _plugin_list
+
+    with _framework_lock:
+        if _plugin_list is None:
+            # ./volatility3/vol.py 옆의 volatility3 패키지를 import 경로에 추가
+            vol_root = str(Path(env_config['vol_path']).resolve().parent)
+            if vol_root not in sys.path:
+                sys.path.insert(0, vol_root)
+
+            import volatility3.plugins
+            from volatility3 import framework
+
+            framework.require_interface_version(2, 0, 0)
+            framework.import_files(volatility3.plugins, True)
+            _plugin_list = framework.list_plugins()
+
+    return _plugin_list
+
+
+def is_available() -> bool:
+    """in-process 백엔드 사용 가능 여부"""
+    try:
+        _load_framework()
+        return True
+    except Exception:
+        return False
+
+
+def _resolve_plugin(plugin_list: dict, command: str):
+    """'windows.pslist' 같은 명령어를 플러그인 클래스로 변환 (vol.py와 동일한 규칙)"""
+    if command in plugin_list:
+        return plugin_list[command]
+
+    prefix = f"{command.lower()}."
+    matches = [name for name in plugin_list if name.lower().startswith(prefix)]
+    if len(matches) == 1:
+        return plugin_list[matches[0]]
+
+    raise ValueError(f"플러그인을 찾을 수 없습니다: {command}")
+
+
+def _make_file_handler(output_dir: str):
+    """플러그인이 생성하는 파일(dumpfiles 등)을 output_dir에 저장하는 핸들러 클래스"""
+    from volatility3.framework import interfaces
+
+    class OutputFileHandler(io.BytesIO, interfaces.plugins.FileHandlerInterface):
+        def __init__(self, filename: str):
+            io.BytesIO.__init__(self)
+            interfaces.plugins.FileHandlerInterface.__init__(self, filename)
+
+        def close(self):
+            if self.closed:
+                return
+            output_path = Path(output_dir) / self.preferred_filename
+            with open(output_path, 'wb') as f:
+                f.write(self.getvalue())
+            super().close()
+
+    return OutputFileHandler
+
+
+def _render_rows(grid) -> list:
+    """TreeGrid를 vol.py의 JSON 렌더러와 같은 구조의 리스트로 변환"""
+    from volatility3.cli import text_renderer
+
+    class CaptureRenderer(text_renderer.JsonRenderer):
+        def output_result(self, outfd, result):
+            self.rows = result
+
+    renderer = CaptureRenderer()
+    renderer.render(grid)
+    return renderer.rows
+
+
+class VolatilitySession:
+    """덤프 하나에 바인딩된 워밍 세션 (레이어 스택/커널 심볼을 한 번만 구성)"""
+
+    def __init__(self, dump_path: str, shared_config: Optional[Dict[str, Any]] = None):
+        self.dump_path = dump_path
+        # automagic이 해석한 레이어/심볼/모듈 설정 (요구사항 이름 기준 상대 경로)
+        # 지정하지 않으면 인제스트 단계에서 저장한 설정을 사용
+        if shared_config is None:
+            shared_config = simple_cache.load_dump_config(dump_path)
+        self.shared_config = dict(shared_config or {})
+        self.context = None
+        self.run_count = 0
+        self.last_used = time.time()
+        self._lock = threading.Lock()
+
+    def seed(self, shared_config: Dict[str, Any]):
+        """다른 워커가 해석한 설정으로 세션 초기화 (automagic 스캔 생략)"""
+        with self._lock:
+            if not self.shared_config and shared_config:
+                self.shared_config = dict(shared_config)
+
+    def _shared_requirement_names(self, plugin) -> set:
+        """플러그인 간에 공유 가능한 요구사항 (레이어/심볼 테이블/커널 모듈) 이름"""
+        from volatility3.framework.configuration import requirements
+
+        shared_types = (
+            requirements.TranslationLayerRequirement,
+            requirements.SymbolTableRequirement,
+            requirements.ModuleRequirement
+        )
+        return {req.name for req in plugin.get_requirements() if isinstance(req, shared_types)}
+
+    def run(self, command: str, pid: Optional[int] = None) -> dict:
+        """플러그인 실행 (이미 구성된 레이어/심볼은 재사용)"""
+        from volatility3.framework import automagic, contexts, exceptions, interfaces, plugins
+
+        with self._lock:
+            plugin = _resolve_plugin(_load_framework(), command)
+
+            if self.context is None:
+                self.context = contexts.Context()
+                self.context.config['automagic.LayerStacker.single_location'] = \
+                    Path(self.dump_path).resolve().as_uri()
+
+            ctx = self.context
+            self.run_count += 1
+            self.last_used = time.time()
+
+            # 실행마다 별도의 설정 경로 사용 (이전 실행의 pid 등이 남지 않도록)
+            base_config_path = f"plugins_{self.run_count}"
+            plugin_config_path = interfaces.configuration.path_join(base_config_path, plugin.__name__)
+
+            shared_names = self._shared_requirement_names(plugin)
+            for key, value in self.shared_config.items():
+                if key.split('.')[0] in shared_names:
+                    ctx.config[interfaces.configuration.path_join(plugin_config_path, key)] = value
+
+            if pid:
+                pids = list(pid) if isinstance(pid, (list, tuple)) else [pid]
+                ctx.config[interfaces.configuration.path_join(plugin_config_path, "pid")] = pids
+
+            automagics = automagic.choose_automagic(automagic.available(ctx), plugin)
+
+            try:
+                constructed = plugins.construct_plugin(
+                    ctx, automagics, plugin, base_config_path, None,
+                    _make_file_handler(env_config['output_path'])
+                )
+            except exceptions.UnsatisfiedException as e:
+                unsatisfied = ", ".join(getattr(e, 'unsatisfied', {}).keys())
+                raise RuntimeError(f"Unsatisfied requirement: {unsatisfied or e}")
+
+            # 해석된 설정을 저장해 다음 플러그인에서 automagic 스캔을 건너뜀
+            resolved = constructed.build_configuration()
+            for key in resolved:
+                if key.split('.')[0] in shared_names:
+                    self.shared_config.setdefault(key, resolved[key])
+
+            return _render_rows(constructed.run())
+
+
+# 프로세스 내 세션 (가장 최근 덤프 하나만 유지)
+_sessions: Dict[str, VolatilitySession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(dump_path: str) -> VolatilitySession:
+    """덤프 경로에 바인딩된 세션 반환 (없으면 생성)"""
+    with _sessions_lock:
+        session = _sessions.get(dump_path)
+        if session is None:
+            _sessions.clear()
+            session = VolatilitySession(dump_path)
+            _sessions[dump_path] = session
+        return session
+
+
+def run_volatility_inprocess(file_path: str, command: str, pid: Optional[int] = None,
+                             session: Optional[VolatilitySession] = None) -> dict:
+    """volatility3 API로 플러그인을 직접 실행 (run_volatility_with_cache와 같은 결과 구조)"""
+    try:
+        if session is None:
+            session = get_session(file_path)
+
+        rows = session.run(command, pid)
+
+        return {
+            "status": "success",
+            "command": command,
+            "pid": pid,
+            "result": rows,
+            "from_cache": False
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "command": command,
+            "from_cache": False
+        }
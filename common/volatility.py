@@ -9,10 +9,66 @@ import json
 import subprocess
 import multiprocessing
 import pandas as pd
-from typing import Optional
+from typing import Optional, Tuple
+import os
+import tempfile
+import threading
+import time
+import uuid
+import psutil
 from datetime import datetime
 from pathlib import Path
-from .cache_manager import simple_cache
+from .cache_manager import simple_cache, ResultWriter, pa, read_table_file
+from .result_transport import make_handle
+from .run_history import run_history
+from .pid_index import pid_index, SUPERSET_PLUGINS, PID_COLUMNS
+from .ioc_index import ioc_index  # 캐시 저장 시 검색 인덱스 갱신 (리스너 등록)
+from .process_registry import process_registry, kill_tree, CANCELLED_MESSAGE
+from .job_store import job_store
+from UI.config import env_config
+
+# 인제스트에 사용하는 플러그인 (automagic 결과를 설정 파일로 남김)
+INGEST_PLUGIN = "windows.info"
+
+# 플러그인 실행 제한 시간 (실행 이력이 부족할 때의 기본값과 상한)과 스트리밍 배치 크기 (행 단위)
+VOL_TIMEOUT = env_config.get('vol_timeout', 600)
+VOL_TIMEOUT_MAX = env_config.get('vol_timeout_max', 7200)
+STREAM_BATCH_ROWS = 2000
+
+# 실패 유형별 캐시 유지 시간 (초) - 만료되면 캐시 미스로 취급하고 백그라운드에서 다시 실행
+# None: 만료 없음 (덤프/심볼과 맞지 않는 플러그인은 다시 실행해도 같은 결과)
+FAILURE_TTL = {
+    "timeout": 3600,
+    "oom": 1800,
+    "transient": 600,
+    "unsatisfied": None,
+    "error": 6 * 3600
+}
+# 같은 플러그인이 연속으로 실패하면 유지 시간을 두 배씩 늘림 (상한)
+MAX_FAILURE_TTL = 7 * 24 * 3600
+
+# 실패 유형 판별용 오류 메시지 패턴
+OOM_MARKERS = ("MemoryError", "Cannot allocate memory", "out of memory", "Killed")
+TRANSIENT_MARKERS = ("terminated unexpectedly", "Broken pipe", "Resource temporarily unavailable",
+                     "database is locked")
+
+# vol 자식 프로세스 메모리 측정 간격 (초)
+MEMORY_SAMPLE_INTERVAL = 0.5
+
+# vol 출력 파일을 다시 확인하는 간격 (초)
+SPOOL_POLL_INTERVAL = 0.2
+
+# vol.py를 감싸 종료 코드를 파일로 남기는 셸 스크립트 (UI 서버 재시작 후 다시 연결했을 때 결과 판정용)
+# POSIX에서만 사용 - 추가 파이썬 인터프리터 없이 sh 하나로 처리. $0은 종료 코드 파일, "$@"는 vol 명령
+EXIT_CODE_WRAPPER = '"$@"; rc=$?; echo $rc > "$0"; exit $rc'
+
+# 여러 PID를 한 번의 --pid 실행으로 처리할 수 있는 플러그인 (PID 목록 인자 + 결과에 PID 컬럼)
+MULTI_PID_PLUGINS = SUPERSET_PLUGINS
+
+# 일괄 실행 결과에 PID 컬럼이 없어 PID별로 나눌 수 없었던 플러그인 (다시 일괄 실행하지 않음)
+_unsplittable_plugins = set()
+
+_ingest_lock = threading.Lock()
 
 
 def log_with_time(message: str):
@@ -21,11 +77,53 @@ def log_with_time(message: str):
     print(f"[{timestamp}] {message}")
 
 
-def run_volatility_with_cache(file_path: str, command: str, pid: Optional[int] = None) -> dict:
-    """캐시를 사용한 Volatility 실행"""
+def classify_error(result_data: dict) -> str:
+    """실패 유형 분류 (timeout / oom / transient / unsatisfied / error)"""
+    error = result_data.get("error") or ""
+    if error.startswith("Analysis timeout"):
+        return "timeout"
+    # OOM killer는 SIGKILL로 종료시키므로 stderr가 비어 있을 수 있음
+    if result_data.get("returncode") in (-9, 137) or any(marker in error for marker in OOM_MARKERS):
+        return "oom"
+    if "Unsatisfied requirement" in error:
+        return "unsatisfied"
+    if any(marker in error for marker in TRANSIENT_MARKERS):
+        return "transient"
+    return "error"
+
+
+def _mark_failure(file_path: str, command: str, pid, result_data: dict):
+    """실패 결과에 유형과 만료 시각 기록 (연속 실패 횟수만큼 유지 시간 증가)"""
+    error_type = classify_error(result_data)
+    result_data["error_type"] = error_type
+
+    ttl = FAILURE_TTL.get(error_type)
+    if ttl is not None:
+        failures = max(run_history.consecutive_failures(file_path, command, pid), 1)
+        ttl = min(ttl * 2 ** min(failures - 1, 10), MAX_FAILURE_TTL)
+        result_data["expires_at"] = time.time() + ttl
+
+
+def _cached_error_message(result: dict) -> str:
+    """캐시된 실패 메시지 (만료되는 실패는 다시 실행 예정 시각 표시)"""
+    message = f"[CACHED] {result['error']}"
+    if result.get("expires_at"):
+        retry_at = datetime.fromtimestamp(result["expires_at"]).strftime("%m-%d %H:%M")
+        message += f"\n\n({result.get('error_type')} 실패 - {retry_at} 이후 자동으로 다시 실행)"
+    return message
+
+
+def run_volatility_with_cache(file_path: str, command: str, pid: Optional[int] = None, on_batch=None,
+                              load_frame: bool = True, backend: Optional[str] = None) -> dict:
+    """캐시를 사용한 Volatility 실행
+
+    on_batch: 실행 중 도착한 행 배치 콜백
+    load_frame: False면 컬럼형 결과를 DataFrame으로 읽지 않고 'table_path'만 반환
+    backend: 실행 백엔드 지정 (없으면 VOL_BACKEND 설정)
+    """
 
     # 1. 캐시 확인
-    cached = simple_cache.get(file_path, command, pid)
+    cached = simple_cache.get(file_path, command, pid, load_frame=load_frame)
     if cached:
         log_with_time(f"📄 Cache hit: {command}")
         cached['from_cache'] = True
@@ -33,63 +131,424 @@ def run_volatility_with_cache(file_path: str, command: str, pid: Optional[int] =
 
     log_with_time(f"⚡ Executing: {command}")
 
-    # 2. 실제 실행
+    # 2. 덤프 인제스트 (automagic 결과가 없으면 한 번만 실행)
+    ingest_dump(file_path, backend=backend)
+
+    # 3. 실제 실행 (subprocess 백엔드는 출력을 배치 단위로 캐시 저장소에 바로 기록)
+    #    제한 시간은 실행 이력과 덤프 크기로 계산
+    timeout = run_history.timeout_for(file_path, command, pid, default=VOL_TIMEOUT, maximum=VOL_TIMEOUT_MAX)
+    writer = simple_cache.open_writer(file_path, command, pid, on_batch=on_batch)
+    started = time.time()
     try:
-        cmd = ["python3", "./volatility3/vol.py", "-f", file_path, command, "--output", "json"]
-        if pid:
-            cmd.extend(["--pid", str(pid)])
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-
-        if result.returncode != 0:
-            log_with_time(f"❌ FAILED {command}: {result.stderr[:100]}...")
-            result_data = {
-                "status": "error",
-                "error": result.stderr,
-                "command": command,
-                "from_cache": False
-            }
+        result_data = _execute_volatility(file_path, command, pid, writer=writer, backend=backend,
+                                          timeout=timeout)
+    except Exception:
+        writer.abort()
+        raise
+
+    return _finish_execution(file_path, command, pid, writer, result_data, started, load_frame)
+
+
+def _finish_execution(file_path: str, command: str, pid, writer: ResultWriter, result_data: dict,
+                      started: float, load_frame: bool = True) -> dict:
+    """실행 결과를 이력과 캐시에 기록 (저장된 항목 반환)"""
+    # 중단된 실행은 캐시/이력에 남기지 않음 (이미 전달된 부분 결과는 UI에 유지)
+    if result_data.get("cancelled"):
+        writer.abort()
+        log_with_time(f"⏹️ CANCELLED {command}")
+        return result_data
+
+    # 실행 시간/최대 메모리 이력 기록 (스케줄링 순서/ETA/메모리 입장 제어/제한 시간용)
+    run_history.record(file_path, command, pid, time.time() - started, result_data.get("status"),
+                       result_data.pop("peak_rss_mb", None))
+    if result_data["status"] == "error":
+        _mark_failure(file_path, command, pid, result_data)
+
+    # 4. 캐시에 저장 (표 형태 결과는 컬럼형으로 저장된 DataFrame을 그대로 반환)
+    if "result" in result_data:
+        writer.abort()
+        saved = simple_cache.save(file_path, command, result_data, pid, load_frame=load_frame)
+    else:
+        saved = writer.commit(result_data, load_frame=load_frame)
+
+    return saved or result_data
+
+
+def resume_volatility_process(plugin: str, dump_path: str, job: dict, on_batch=None):
+    """서버 재시작 전에 시작된 vol 프로세스에 다시 연결해 남은 출력을 읽고 캐시에 기록
+
+    출력 파일이 없으면 처음부터 다시 실행한다. 반환 형식은 run_volatility_process와 같다.
+    """
+    out_path, _, _ = _spool_paths(job["spool_id"]) if job.get("spool_id") else (None, None, None)
+    if job.get("command") != plugin or out_path is None or not out_path.exists():
+        return run_volatility_process(plugin, dump_path, on_batch=on_batch)
+
+    log_with_time(f"🔗 Reattaching: {plugin} (PID {job['os_pid']})")
+    process = process_registry.reattach(job["os_pid"], job["create_time"])
+    job_store.attach_process(plugin, job["os_pid"], job["spool_id"], job["timeout"])
+
+    # 이전 서버에서 이미 받은 행도 출력 파일 처음부터 다시 읽어 기록
+    writer = simple_cache.open_writer(dump_path, plugin, on_batch=on_batch)
+    started = job.get("started_at") or time.time()
+    remaining = (job.get("timeout") or VOL_TIMEOUT) - (time.time() - started)
+    try:
+        result_data = _collect_subprocess(process, job["spool_id"], plugin, None, writer, remaining)
+    except Exception:
+        writer.abort()
+        raise
+
+    # 저장된 설정으로 실행할 수 없는 플러그인은 automagic으로 다시 실행 (_execute_volatility와 동일)
+    # 종료 코드를 알 수 없으면 (종료 코드 파일이 없는 플랫폼) 결과를 믿을 수 없으므로 다시 실행
+    if result_data["status"] == "error" and ("Unsatisfied requirement" in result_data["error"]
+                                             or result_data.get("returncode") == -1):
+        writer.abort()
+        return run_volatility_process(plugin, dump_path, on_batch=on_batch)
+
+    result = _finish_execution(dump_path, plugin, None, writer, result_data, started, load_frame=False)
+    return _to_process_result(plugin, result)
+
+
+def ingest_dump(file_path: str, backend: Optional[str] = None) -> Optional[Path]:
+    """덤프 인제스트: automagic을 한 번 실행하고 해석된 설정을 캐시 옆에 저장"""
+    config_path = simple_cache.get_config_path(file_path)
+    if config_path.exists():
+        return config_path
+
+    with _ingest_lock:
+        if config_path.exists():
+            return config_path
+
+        log_with_time(f"🧭 Ingest: {Path(file_path).name}")
+        backend = backend or env_config.get('vol_backend')
+
+        if backend == 'pool':
+            from .worker_pool import worker_pool
+
+            result_data = _run_in_pool(file_path, INGEST_PLUGIN)
+            config = worker_pool.get_shared_config(file_path)
+        elif backend == 'inprocess' and _inprocess_available():
+            from .vol_engine import VolatilitySession, run_volatility_inprocess
+
+            session = VolatilitySession(file_path, shared_config={})
+            result_data = run_volatility_inprocess(file_path, INGEST_PLUGIN, session=session)
+            config = session.shared_config
+        else:
+            result_data, config = _ingest_subprocess(file_path)
+
+        # 중단된 인제스트는 설정을 남기지 않음 (다음 실행에서 다시 인제스트)
+        if result_data.get("cancelled"):
+            return None
+
+        # 인제스트 플러그인 결과도 캐시에 저장 (중복 실행 방지)
+        result_data.pop("peak_rss_mb", None)
+        if result_data["status"] == "success":
+            simple_cache.save(file_path, INGEST_PLUGIN, result_data)
         else:
+            log_with_time(f"⚠️ Ingest failed, plugins will run full automagic: {result_data['error'][:100]}")
+
+        # 실패한 경우에도 빈 설정을 남겨 매 실행마다 재시도하지 않음
+        simple_cache.save_dump_config(file_path, config or {})
+        return config_path
+
+
+def _ingest_subprocess(file_path: str):
+    """vol.py --write-config 로 automagic 결과 설정 파일 생성"""
+    with tempfile.TemporaryDirectory(dir=simple_cache.cache_dir) as work_dir:
+        result_data = _run_volatility_subprocess(
+            file_path, INGEST_PLUGIN, extra_args=["--write-config"], cwd=work_dir
+        )
+
+        config = None
+        written_config = Path(work_dir) / "config.json"
+        if result_data["status"] == "success" and written_config.exists():
             try:
-                output = json.loads(result.stdout)
-                log_with_time(f"✅ SUCCESS {command}")
-            except json.JSONDecodeError as e:
-                log_with_time(f"⚠️ JSON parse failed for {command}")
-                output = {"text_output": result.stdout}
+                with open(written_config, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            except Exception as e:
+                log_with_time(f"⚠️ Config parse failed: {e}")
+
+    return result_data, config
+
+
+def _inprocess_available() -> bool:
+    """in-process 프레임워크 로드 가능 여부"""
+    from .vol_engine import is_available
+    return is_available()
 
-            result_data = {
-                "status": "success",
-                "command": command,
-                "pid": pid,
-                "result": output,
-                "from_cache": False
-            }
 
-        # 3. 캐시에 저장
-        simple_cache.save(file_path, command, result_data, pid)
+def _execute_volatility(file_path: str, command: str, pid: Optional[int] = None,
+                        writer: Optional[ResultWriter] = None, backend: Optional[str] = None,
+                        timeout: float = VOL_TIMEOUT) -> dict:
+    """설정된 백엔드(subprocess / inprocess / pool)로 플러그인 실행 (제한 시간은 subprocess 백엔드에 적용)"""
+    backend = backend or env_config.get('vol_backend')
 
+    if backend == 'pool':
+        result_data = _run_in_pool(file_path, command, pid)
+        if result_data["status"] == "error":
+            log_with_time(f"❌ FAILED {command}: {result_data['error'][:100]}...")
+        else:
+            log_with_time(f"✅ SUCCESS {command}")
         return result_data
 
-    except subprocess.TimeoutExpired:
-        log_with_time(f"⏱️ TIMEOUT: {command}")
-        result_data = {
+    if backend == 'inprocess':
+        from .vol_engine import run_volatility_inprocess
+
+        if _inprocess_available():
+            result_data = run_volatility_inprocess(file_path, command, pid)
+            if result_data["status"] == "error":
+                log_with_time(f"❌ FAILED {command}: {result_data['error'][:100]}...")
+            else:
+                log_with_time(f"✅ SUCCESS {command}")
+            return result_data
+
+        log_with_time("⚠️ volatility3 프레임워크 로드 실패, subprocess 백엔드로 실행")
+
+    # 인제스트된 설정이 있으면 automagic 스캔 없이 실행
+    config_path = simple_cache.get_config_path(file_path)
+    if simple_cache.load_dump_config(file_path):
+        result_data = _run_volatility_subprocess(file_path, command, pid, config_path=config_path, writer=writer,
+                                                 timeout=timeout)
+        if result_data["status"] == "success" or "Unsatisfied requirement" not in result_data["error"]:
+            return result_data
+        log_with_time(f"🔁 Saved config not applicable to {command}, retrying with automagic")
+        if writer is not None:
+            writer.reset()
+
+    return _run_volatility_subprocess(file_path, command, pid, writer=writer, timeout=timeout)
+
+
+def _cancelled_result(command: str) -> dict:
+    return {
+        "status": "error",
+        "error": CANCELLED_MESSAGE,
+        "command": command,
+        "from_cache": False,
+        "cancelled": True
+    }
+
+
+def _run_in_pool(file_path: str, command: str, pid: Optional[int] = None) -> dict:
+    """워커 풀에서 실행 (작업이 중단되면 요청을 처리 중인 워커 프로세스 종료)"""
+    from .worker_pool import worker_pool
+
+    future = worker_pool.submit(file_path, command, pid)
+    with process_registry.on_cancel(lambda: worker_pool.cancel(future)):
+        result_data = future.result()
+    return _cancelled_result(command) if process_registry.is_cancelled() else result_data
+
+
+def _spool_paths(spool_id: str) -> Tuple[Path, Path, Path]:
+    """vol 출력 파일 (stdout, stderr, 종료 코드)"""
+    spool_dir = (simple_cache.cache_dir / "jobs").resolve()
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    return (spool_dir / f"{spool_id}.out", spool_dir / f"{spool_id}.err", spool_dir / f"{spool_id}.rc")
+
+
+def _read_tail(path: Path, limit: int = 64 * 1024) -> str:
+    """파일의 마지막 limit 바이트 (stderr)"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(max(f.seek(0, os.SEEK_END) - limit, 0))
+            return f.read().decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        return ""
+
+
+def _read_exit_code(rc_path: Path) -> Optional[int]:
+    try:
+        return int(rc_path.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _follow_spool(out_path: Path, process, on_line):
+    """출력 파일을 따라 읽음 (프로세스가 끝나고 남은 내용을 모두 읽을 때까지)"""
+    with open(out_path, 'r', encoding='utf-8', errors='replace') as f:
+        pending = ''
+        while True:
+            chunk = f.readline()
+            if chunk:
+                pending += chunk
+                if pending.endswith('\n'):
+                    on_line(pending)
+                    pending = ''
+                continue
+
+            if process.poll() is not None:
+                for line in (pending + f.read()).splitlines():
+                    on_line(line)
+                return
+            time.sleep(SPOOL_POLL_INTERVAL)
+
+
+def _sample_peak_rss(process, peak: list):
+    """자식 프로세스(및 그 하위 프로세스)의 최대 RSS 측정 (종료될 때까지)"""
+    try:
+        proc = psutil.Process(process.pid)
+    except psutil.Error:
+        return
+
+    while process.poll() is None:
+        try:
+            rss = proc.memory_info().rss + sum(child.memory_info().rss for child in proc.children(recursive=True))
+            peak[0] = max(peak[0], rss)
+        except psutil.Error:
+            pass
+        time.sleep(MEMORY_SAMPLE_INTERVAL)
+
+
+def _run_volatility_subprocess(file_path: str, command: str, pid: Optional[int] = None,
+                               config_path: Optional[Path] = None, extra_args: Optional[list] = None,
+                               cwd: Optional[str] = None, writer: Optional[ResultWriter] = None,
+                               timeout: float = VOL_TIMEOUT) -> dict:
+    """vol.py를 별도 인터프리터로 실행 (JSONL 출력을 줄 단위로 읽어 배치 처리)
+
+    출력은 파이프 대신 cache/jobs의 파일로 받아 따라 읽는다. UI 서버가 재시작돼도 vol 프로세스는
+    계속 실행되고, 작업 기록에 남은 출력 파일로 다시 연결할 수 있다.
+    writer가 있으면 배치마다 캐시 저장소로 흘려보내고 결과 dict에는 행을 담지 않는다.
+    """
+    try:
+        cmd = ["python3", os.path.abspath(env_config['vol_path']), "-f", os.path.abspath(file_path)]
+        if config_path:
+            cmd.extend(["-c", str(config_path)])
+        if extra_args:
+            cmd.extend(extra_args)
+        cmd.extend(["-r", "jsonl", command])
+        if pid:
+            # --pid는 여러 값을 받음 (PID 일괄 분석)
+            cmd.extend(["--pid", *(str(p) for p in (pid if isinstance(pid, (list, tuple)) else [pid]))])
+
+        spool_id = uuid.uuid4().hex
+        out_path, err_path, rc_path = _spool_paths(spool_id)
+        if os.name == 'posix':
+            cmd = ["sh", "-c", EXIT_CODE_WRAPPER, str(rc_path), *cmd]
+        with open(out_path, 'wb') as stdout, open(err_path, 'wb') as stderr:
+            # 별도 프로세스 그룹으로 실행 (중단/시간 초과 시 하위 프로세스까지 한 번에 종료)
+            process = process_registry.spawn(cmd, stdout=stdout, stderr=stderr, cwd=cwd)
+        job_store.attach_process(command, process.pid, spool_id, timeout)
+
+        return _collect_subprocess(process, spool_id, command, pid, writer, timeout)
+
+    except Exception as e:
+        log_with_time(f"💥 EXCEPTION {command}: {e}")
+        return {
             "status": "error",
-            "error": "Analysis timeout (10 minutes)",
+            "error": str(e),
             "command": command,
             "from_cache": False
         }
-        simple_cache.save(file_path, command, result_data, pid)
-        return result_data
-    except Exception as e:
-        log_with_time(f"💥 EXCEPTION {command}: {e}")
-        result_data = {
+
+
+def _collect_subprocess(process, spool_id: str, command: str, pid, writer: Optional[ResultWriter],
+                        timeout: float) -> dict:
+    """실행 중인 vol 프로세스의 출력 파일을 끝까지 읽어 결과 dict 생성 (출력 파일은 삭제)"""
+    out_path, err_path, rc_path = _spool_paths(spool_id)
+    rows, text_lines, batch = [], [], []
+
+    def flush():
+        if batch:
+            if writer is not None:
+                writer.write_rows(batch)
+            else:
+                rows.extend(batch)
+            batch.clear()
+
+    def on_line(line: str):
+        line = line.strip()
+        if not line:
+            return
+
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            if writer is not None:
+                writer.write_text(line)
+            else:
+                text_lines.append(line)
+            return
+
+        batch.extend(row if isinstance(row, list) else [row])
+        if len(batch) >= STREAM_BATCH_ROWS:
+            flush()
+
+    try:
+        peak_rss = [0]
+        memory_sampler = threading.Thread(target=_sample_peak_rss, args=(process, peak_rss), daemon=True)
+        memory_sampler.start()
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            kill_tree(process)
+
+        watchdog = threading.Timer(max(timeout, 0), kill_on_timeout)
+        watchdog.start()
+
+        try:
+            _follow_spool(out_path, process, on_line)
+            flush()
+            returncode = process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                kill_tree(process)
+            process_registry.release(process)
+
+        memory_sampler.join(timeout=MEMORY_SAMPLE_INTERVAL * 2)
+        # vol의 종료 코드 (다시 연결한 프로세스는 종료 코드 파일로만 알 수 있음, 강제 종료되면 파일이 없음)
+        exit_code = _read_exit_code(rc_path)
+        returncode = returncode if exit_code is None else exit_code
+        stderr = _read_tail(err_path)
+        peak_rss_mb = peak_rss[0] / (1024 * 1024) or None
+    finally:
+        for path in (out_path, err_path, rc_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    if process_registry.is_cancelled():
+        return _cancelled_result(command)
+
+    if timed_out.is_set():
+        log_with_time(f"⏱️ TIMEOUT: {command}")
+        return {
             "status": "error",
-            "error": str(e),
+            "error": f"Analysis timeout ({timeout / 60:.1f} minutes)",
             "command": command,
             "from_cache": False
         }
-        simple_cache.save(file_path, command, result_data, pid)
-        return result_data
+
+    if returncode != 0:
+        log_with_time(f"❌ FAILED {command}: {stderr[:100]}...")
+        return {
+            "status": "error",
+            "error": stderr,
+            "returncode": returncode,
+            "command": command,
+            "from_cache": False,
+            "peak_rss_mb": peak_rss_mb
+        }
+
+    result_data = {
+        "status": "success",
+        "command": command,
+        "pid": pid,
+        "from_cache": False,
+        "peak_rss_mb": peak_rss_mb
+    }
+
+    if writer is not None:
+        log_with_time(f"✅ SUCCESS {command} ({writer.row_count} rows streamed)")
+    else:
+        if not rows and text_lines:
+            log_with_time(f"⚠️ JSON parse failed for {command}")
+        else:
+            log_with_time(f"✅ SUCCESS {command}")
+        result_data["result"] = rows if rows or not text_lines else {"text_output": "\n".join(text_lines)}
+
+    return result_data
 
 
 def volatility_worker(file_path: str, command: str, pid: Optional[int], result_queue: multiprocessing.Queue):
@@ -103,19 +562,36 @@ def run_volatility_analysis(file_path: str, command: str, pid: Optional[int] = N
     return run_volatility_with_cache(file_path, command, pid)
 
 
-def run_volatility_process(plugin: str, dump_path: str):
-    """멀티프로세싱용 함수"""
-    result = run_volatility_with_cache(dump_path, plugin)
+def run_volatility_process(plugin: str, dump_path: str, on_batch=None, backend: Optional[str] = None):
+    """스케줄러용 함수 (컬럼형 결과는 DataFrame 대신 결과 파일 핸들 반환)"""
+    result = run_volatility_with_cache(dump_path, plugin, on_batch=on_batch, load_frame=False, backend=backend)
+    return _to_process_result(plugin, result)
+
+
+def load_cached_process_result(plugin: str, dump_path: str):
+    """캐시된 결과만 조회 (run_volatility_process와 같은 형식, 캐시에 없으면 None)"""
+    cached = simple_cache.get(dump_path, plugin, load_frame=False)
+    if not cached:
+        return None
+    cached['from_cache'] = True
+    return _to_process_result(plugin, cached)
+
 
+def _to_process_result(plugin: str, result: dict):
+    """실행 결과 dict를 (플러그인, DataFrame 또는 결과 파일 핸들, 오류)로 변환"""
     # 기존 인터페이스 호환성을 위한 변환
     if result["status"] == "error":
-        error_msg = result["error"]
-        if result.get("from_cache"):
-            error_msg = f"[CACHED] {error_msg}"
+        error_msg = _cached_error_message(result) if result.get("from_cache") else result["error"]
         return plugin, None, error_msg
     else:
         df = None
-        if "result" in result and isinstance(result["result"], list) and len(result["result"]) > 0:
+        handle = make_handle(result)
+        if handle is not None:
+            # 결과는 캐시에 이미 기록됨 - 큐에는 파일 핸들만 전달 (UI에서 메모리 매핑)
+            return plugin, handle, None
+        elif result.get("frame") is not None:
+            df = result["frame"]
+        elif "result" in result and isinstance(result["result"], list) and len(result["result"]) > 0:
             try:
                 df = pd.DataFrame(result["result"])
             except Exception as e:
@@ -127,17 +603,100 @@ def run_volatility_process(plugin: str, dump_path: str):
         return plugin, df, None
 
 
-def run_pid_plugin(plugin_name: str, dump_path: str, pid: str, _mtime=None):
-    """PID 기반 분석"""
-    result = run_volatility_with_cache(dump_path, plugin_name, int(pid))
+def run_pid_batch(plugin_name: str, dump_path: str, pids: list, backend: Optional[str] = None) -> dict:
+    """여러 PID에 대한 PID 분석 - 한 번 실행 후 결과를 PID별로 나눠 캐시 (pid -> (df, error))"""
+    pids = list(dict.fromkeys(int(pid) for pid in pids))
+
+    # PID 인덱스나 PID별 캐시로 답할 수 없는 PID만 실행
+    missing = [pid for pid in pids
+               if not simple_cache.has_entry(dump_path, plugin_name, pid)
+               and pid_index.lookup(dump_path, plugin_name, pid) is None]
+
+    if len(missing) > 1 and _can_split_by_pid(plugin_name, dump_path):
+        _run_multi_pid(plugin_name, dump_path, missing, backend)
+
+    # 나눠 저장된 캐시에서 읽음 (일괄 실행이 불가능했던 PID는 개별 실행)
+    results = {}
+    for pid in pids:
+        if process_registry.is_cancelled():
+            results[pid] = (None, CANCELLED_MESSAGE)
+            continue
+        try:
+            results[pid] = (run_pid_plugin(plugin_name, dump_path, pid, backend=backend), None)
+        except Exception as e:
+            results[pid] = (None, str(e))
+    return results
+
+
+def _can_split_by_pid(plugin_name: str, dump_path: str) -> bool:
+    """일괄 실행 결과를 PID별로 나눌 수 있는지 실행 전에 확인 (결과에 PID 컬럼이 있는지)
+
+    이 덤프의 캐시된 결과(전체 또는 PID별)가 있으면 그 컬럼으로 판단하고, 없으면 플러그인 목록 기준.
+    """
+    if plugin_name not in MULTI_PID_PLUGINS or plugin_name in _unsplittable_plugins:
+        return False
+
+    if pa is not None:
+        for cache_key in simple_cache.manifest.find_keys(simple_cache._get_dump_key(dump_path), plugin_name):
+            table_path = simple_cache._get_table_file(cache_key)
+            if table_path.exists():
+                try:
+                    columns = read_table_file(table_path).column_names
+                except Exception:
+                    continue
+                return any(name in columns for name in PID_COLUMNS)
+    return True
+
+
+def _run_multi_pid(plugin_name: str, dump_path: str, pids: list, backend: Optional[str] = None) -> bool:
+    """--pid a b c 로 한 번 실행하고 PID 컬럼 기준으로 나눠 PID별 캐시에 저장"""
+    log_with_time(f"⚡ Executing: {plugin_name} (PID {len(pids)}개 일괄)")
+    ingest_dump(dump_path, backend=backend)
+
+    started = time.time()
+    timeout = run_history.timeout_for(dump_path, plugin_name, pids, default=VOL_TIMEOUT, maximum=VOL_TIMEOUT_MAX)
+    result_data = _execute_volatility(dump_path, plugin_name, pids, backend=backend, timeout=timeout)
+    run_history.record(dump_path, plugin_name, pids, time.time() - started, result_data.get("status"),
+                       result_data.pop("peak_rss_mb", None))
+
+    rows = result_data.get("result")
+    if result_data["status"] != "success" or not isinstance(rows, list):
+        return False  # PID별 개별 실행으로 처리
+
+    pid_column = next((name for name in PID_COLUMNS if rows and name in rows[0]), None)
+    if rows and pid_column is None:
+        _unsplittable_plugins.add(plugin_name)
+        return False  # 결과를 PID별로 나눌 수 없음
+
+    rows_by_pid = {pid: [] for pid in pids}
+    for row in rows:
+        if row.get(pid_column) in rows_by_pid:
+            rows_by_pid[row[pid_column]].append(row)
+
+    for pid, pid_rows in rows_by_pid.items():
+        simple_cache.save(dump_path, plugin_name, dict(result_data, pid=pid, result=pid_rows), pid, load_frame=False)
+    return True
+
+
+def run_pid_plugin(plugin_name: str, dump_path: str, pid: str, _mtime=None, backend: Optional[str] = None):
+    """PID 기반 분석 (캐시된 전체 실행 결과가 있으면 PID 인덱스로 바로 응답)"""
+    indexed = pid_index.lookup(dump_path, plugin_name, int(pid))
+    if indexed is not None:
+        log_with_time(f"🗂️ PID index hit: {plugin_name} (PID {pid}, {len(indexed)} rows)")
+        if indexed.empty:
+            return pd.DataFrame({"Info": [f"PID {pid}에 대한 결과가 없습니다."]})
+        return indexed
+
+    result = run_volatility_with_cache(dump_path, plugin_name, int(pid), backend=backend)
 
     if result["status"] == "error":
-        error_msg = result["error"]
-        if result.get("from_cache"):
-            error_msg = f"[CACHED] {error_msg}"
+        error_msg = _cached_error_message(result) if result.get("from_cache") else result["error"]
         raise RuntimeError(error_msg)
 
     # DataFrame 변환
+    if result.get("frame") is not None:
+        return result["frame"]
+
     if "result" in result and isinstance(result["result"], list):
         try:
             return pd.DataFrame(result["result"])
@@ -0,0 +1,376 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+import psutil
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, Optional
+from UI.config import env_config
+from .cache_manager import simple_cache
+from .process_registry import CANCELLED_MESSAGE, KILL_GRACE_SECONDS
+
+# 대기 중인 워커가 중단 요청을 확인하는 간격 (초)
+CANCEL_POLL_INTERVAL = 1.0
+
+
+class _CancelRequested(BaseException):
+    """실행 중인 플러그인 중단 요청 (워커의 SIGTERM 처리기에서 발생)"""
+
+
+def _pool_worker_main(dump_path: str, request_queue: multiprocessing.Queue,
+                      response_queue: multiprocessing.Queue, idle_timeout: float, memory_threshold: float):
+    """덤프 하나에 바인딩된 워커 프로세스 (세션을 유지하며 요청 처리)
+
+    SIGTERM은 중단 요청으로 처리한다. 플러그인 실행 중이면 실행만 끊고, 큐를 읽거나 쓰는 중이면
+    표시만 해 두었다가 응답을 보낸 뒤 스스로 종료한다 (큐 사용 중 종료되면 공유 큐가 손상됨).
+    """
+    from .vol_engine import VolatilitySession, run_volatility_inprocess
+
+    state = {'busy': False, 'cancel': False}
+
+    def on_terminate(signum, frame):
+        state['cancel'] = True
+        if state['busy']:
+            raise _CancelRequested()
+
+    if os.name == 'posix':
+        signal.signal(signal.SIGTERM, on_terminate)
+
+    session = VolatilitySession(dump_path)
+    worker_pid = os.getpid()
+    idle_since = time.time()
+
+    while not state['cancel']:
+        try:
+            request = request_queue.get(timeout=CANCEL_POLL_INTERVAL)
+        except queue.Empty:
+            if time.time() - idle_since > idle_timeout:
+                break  # 유휴 타임아웃
+            continue
+
+        if request is None:
+            break  # 종료 요청
+
+        request_id, command, pid, shared_config = request
+        if shared_config:
+            session.seed(shared_config)
+
+        response_queue.put(('start', worker_pid, request_id))
+        try:
+            state['busy'] = True
+            if state['cancel']:
+                raise _CancelRequested()
+            result = run_volatility_inprocess(dump_path, command, pid, session=session)
+        except _CancelRequested:
+            result = {"status": "error", "error": CANCELLED_MESSAGE, "from_cache": False, "cancelled": True}
+        finally:
+            state['busy'] = False
+        response_queue.put(('result', worker_pid, request_id, result, session.shared_config))
+        idle_since = time.time()
+
+        # 메모리가 부족하면 워밍 상태를 반납하고 종료
+        if psutil.virtual_memory().percent > memory_threshold:
+            break
+
+    response_queue.put(('exit', worker_pid, None))
+
+
+class _DumpWorkers:
+    """덤프 하나에 대한 워커 프로세스 묶음"""
+
+    def __init__(self, dump_path: str):
+        self.dump_path = dump_path
+        self.request_queue = multiprocessing.Queue()
+        self.response_queue = multiprocessing.Queue()
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.pending: Dict[int, Future] = {}
+        self.requests: Dict[int, tuple] = {}  # request id -> (command, pid)
+        # 요청은 놀고 있는 워커가 있을 때만 큐에 넣음 (대기 중 취소는 큐에 넣기 전에 빼기만 하면 됨)
+        self.backlog = deque()  # 아직 큐에 넣지 않은 request id
+        self.dispatched = set()  # 큐에 넣었고 결과를 받지 않은 request id
+        self.running: Dict[int, int] = {}  # worker pid -> request id
+        self.cancelled = set()  # 큐에 넣은 뒤 시작 전에 취소된 요청 id (워커가 시작하면 그 워커에 중단 요청)
+        # 인제스트된 설정이 있으면 처음부터 모든 워커가 automagic 없이 시작
+        self.shared_config = simple_cache.load_dump_config(dump_path) or {}
+        self.last_used = time.time()
+        self.reader = None
+
+    def alive_count(self) -> int:
+        return sum(1 for p in self.processes.values() if p.is_alive())
+
+
+class VolatilityWorkerPool:
+    """덤프별 워밍 워커 풀 - automagic/심볼 로드 비용을 덤프당 한 번만 지불"""
+
+    def __init__(self, workers_per_dump: Optional[int] = None, idle_timeout: float = 600,
+                 memory_threshold: float = 90, max_dumps: int = 2):
+        self.workers_per_dump = workers_per_dump or os.cpu_count() or 1
+        self.idle_timeout = idle_timeout
+        self.memory_threshold = memory_threshold
+        self.max_dumps = max_dumps
+        self._dumps: Dict[str, _DumpWorkers] = {}
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+
+    def submit(self, dump_path: str, command: str, pid: Optional[int] = None) -> Future:
+        """플러그인 실행 요청 (결과 dict를 담은 Future 반환)"""
+        future = Future()
+
+        with self._lock:
+            workers = self._get_dump_workers(dump_path)
+            request_id = next(self._request_ids)
+            workers.pending[request_id] = future
+            workers.requests[request_id] = (command, pid)
+            workers.backlog.append(request_id)
+            workers.last_used = time.time()
+            self._scale_up(workers)
+            self._dispatch(workers)
+
+        return future
+
+    def run(self, dump_path: str, command: str, pid: Optional[int] = None) -> dict:
+        """플러그인 실행 후 결과 대기"""
+        return self.submit(dump_path, command, pid).result()
+
+    def cancel(self, future: Future) -> bool:
+        """요청 취소 - 대기 중이면 목록에서만 빼고, 실행 중이면 담당 워커를 중단해 코어/메모리 반환"""
+        with self._lock:
+            for workers in self._dumps.values():
+                request_id = next((rid for rid, pending in workers.pending.items() if pending is future), None)
+                if request_id is None:
+                    continue
+
+                dispatched = request_id in workers.dispatched
+                self._pop_request(workers, request_id)
+                worker_pid = next((wpid for wpid, rid in workers.running.items() if rid == request_id), None)
+                if worker_pid is not None:
+                    self._stop_worker(workers, worker_pid)
+                elif dispatched:
+                    workers.cancelled.add(request_id)
+                future.set_result({"status": "error", "error": CANCELLED_MESSAGE, "from_cache": False,
+                                   "cancelled": True})
+                return True
+        return False
+
+    def _pop_request(self, workers: _DumpWorkers, request_id: int) -> Optional[Future]:
+        """요청 기록 삭제 후 Future 반환 (lock 보유 상태에서 호출)"""
+        workers.requests.pop(request_id, None)
+        workers.dispatched.discard(request_id)
+        try:
+            workers.backlog.remove(request_id)
+        except ValueError:
+            pass
+        return workers.pending.pop(request_id, None)
+
+    def _dispatch(self, workers: _DumpWorkers):
+        """놀고 있는 워커 수만큼 대기 요청을 큐에 넣음 (lock 보유 상태에서 호출)"""
+        free = workers.alive_count() - len(workers.dispatched)
+        while free > 0 and workers.backlog:
+            request_id = workers.backlog.popleft()
+            command, pid = workers.requests[request_id]
+            workers.dispatched.add(request_id)
+            workers.request_queue.put((request_id, command, pid, workers.shared_config))
+            free -= 1
+
+    def _stop_worker(self, workers: _DumpWorkers, worker_pid: int):
+        """워커에 중단 요청 (lock 보유 상태에서 호출, 정리는 응답 스레드가 담당)
+
+        워커는 실행 중인 플러그인을 끊고 응답을 보낸 뒤 스스로 종료한다. KILL_GRACE_SECONDS 안에
+        끝나지 않으면 강제 종료하고, 종료 시점에 사용 중이었을 수 있는 공유 큐를 새로 만든다.
+        """
+        workers.running.pop(worker_pid, None)
+        process = workers.processes.get(worker_pid)
+        if process is None or not process.is_alive():
+            return
+
+        if os.name != 'posix':
+            # 정상 종료 요청 수단이 없음 (terminate()도 즉시 종료)
+            self._force_kill(workers, process)
+            return
+
+        process.terminate()
+        timer = threading.Timer(KILL_GRACE_SECONDS, self._kill_if_alive, args=(workers, process))
+        timer.daemon = True
+        timer.start()
+
+    def _kill_if_alive(self, workers: _DumpWorkers, process: multiprocessing.Process):
+        with self._lock:
+            if process.is_alive():
+                self._force_kill(workers, process)
+
+    def _force_kill(self, workers: _DumpWorkers, process: multiprocessing.Process):
+        """워커 강제 종료 후 큐 재생성 (lock 보유 상태에서 호출)"""
+        process.kill()
+        print(f"Volatility worker {process.pid} killed after cancel, rebuilding worker queues")
+        self._rebuild_queues(workers)
+
+    def _rebuild_queues(self, workers: _DumpWorkers):
+        """손상됐을 수 있는 큐를 버리고 새 큐로 워커를 다시 시작 (lock 보유 상태에서 호출)
+
+        기존 큐를 쓰는 다른 워커도 종료하고, 아직 끝나지 않은 요청은 실행 중이던 것까지 새 큐로 다시 보낸다.
+        """
+        for process in workers.processes.values():
+            if process.is_alive():
+                process.kill()
+        workers.processes.clear()
+        workers.running.clear()
+        workers.cancelled.clear()
+
+        workers.request_queue = multiprocessing.Queue()
+        workers.response_queue = multiprocessing.Queue()
+        workers.backlog = deque(sorted(workers.dispatched) + list(workers.backlog))
+        workers.dispatched.clear()
+
+        # 이전 응답 스레드는 큐가 바뀐 것을 보고 종료
+        workers.reader = threading.Thread(target=self._read_responses, args=(workers, workers.response_queue),
+                                          daemon=True)
+        workers.reader.start()
+        if workers.pending and self._dumps.get(workers.dump_path) is workers:
+            self._scale_up(workers)
+            self._dispatch(workers)
+
+    def get_shared_config(self, dump_path: str) -> dict:
+        """워커가 해석한 덤프 설정 반환"""
+        with self._lock:
+            workers = self._dumps.get(dump_path)
+            return dict(workers.shared_config) if workers else {}
+
+    def evict(self, dump_path: str):
+        """덤프에 바인딩된 워커들 종료"""
+        with self._lock:
+            workers = self._dumps.pop(dump_path, None)
+        if workers:
+            for _ in range(len(workers.processes)):
+                workers.request_queue.put(None)
+
+    def shutdown(self):
+        """모든 워커 종료"""
+        for dump_path in list(self._dumps.keys()):
+            self.evict(dump_path)
+
+    def _get_dump_workers(self, dump_path: str) -> _DumpWorkers:
+        """덤프별 워커 묶음 반환 (없으면 생성, 오래된 덤프는 정리)"""
+        workers = self._dumps.get(dump_path)
+        if workers is None:
+            self._evict_idle_dumps(keep=self.max_dumps - 1)
+            workers = _DumpWorkers(dump_path)
+            workers.reader = threading.Thread(target=self._read_responses, args=(workers, workers.response_queue),
+                                              daemon=True)
+            workers.reader.start()
+            self._dumps[dump_path] = workers
+        return workers
+
+    def _evict_idle_dumps(self, keep: int):
+        """대기 작업이 없는 덤프를 오래된 순서로 정리 (lock 보유 상태에서 호출)"""
+        idle = sorted((w for w in self._dumps.values() if not w.pending), key=lambda w: w.last_used)
+        while len(self._dumps) > keep and idle:
+            workers = idle.pop(0)
+            del self._dumps[workers.dump_path]
+            for _ in range(len(workers.processes)):
+                workers.request_queue.put(None)
+
+    def _scale_up(self, workers: _DumpWorkers):
+        """대기 작업 수에 맞춰 워커 추가 (lock 보유 상태에서 호출)"""
+        alive = workers.alive_count()
+
+        # 첫 automagic 결과가 나오기 전에는 워커 하나만 사용 (스캔 중복 방지)
+        limit = self.workers_per_dump if workers.shared_config else 1
+
+        if alive < min(len(workers.pending), limit):
+            process = multiprocessing.Process(
+                target=_pool_worker_main,
+                args=(workers.dump_path, workers.request_queue, workers.response_queue,
+                      self.idle_timeout, self.memory_threshold),
+                daemon=True
+            )
+            process.start()
+            workers.processes[process.pid] = process
+
+    def _read_responses(self, workers: _DumpWorkers, response_queue: multiprocessing.Queue):
+        """워커 응답을 Future에 반영하고 죽은 워커 감지 (큐가 다시 만들어지면 종료)"""
+        while True:
+            try:
+                message = response_queue.get(timeout=1)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                if workers.response_queue is not response_queue:
+                    break
+
+                if message is not None:
+                    kind, worker_pid, request_id = message[:3]
+
+                    if kind == 'start':
+                        workers.running[worker_pid] = request_id
+                        if request_id in workers.cancelled:
+                            workers.cancelled.discard(request_id)
+                            self._stop_worker(workers, worker_pid)
+                    elif kind == 'result':
+                        workers.running.pop(worker_pid, None)
+                        future = self._pop_request(workers, request_id)
+                        if message[4] and not workers.shared_config:
+                            workers.shared_config = message[4]
+                        if future is not None:
+                            future.set_result(message[3])
+                    elif kind == 'exit':
+                        workers.running.pop(worker_pid, None)
+                        workers.processes.pop(worker_pid, None)
+
+                else:
+                    # 큐가 비었을 때만 확인 (종료 직전에 보낸 결과를 놓치지 않도록)
+                    self._reap_dead_workers(workers)
+
+                evicted = self._dumps.get(workers.dump_path) is not workers
+                if evicted:
+                    if not workers.processes:
+                        self._fail_pending(workers, "Volatility worker pool evicted")
+                        break
+                elif workers.pending:
+                    self._scale_up(workers)
+                    self._dispatch(workers)
+                elif not workers.processes and time.time() - workers.last_used > self.idle_timeout:
+                    del self._dumps[workers.dump_path]  # 모든 워커가 유휴 종료됨
+                    break
+
+                # 메모리 부족 시 대기 작업이 없는 다른 덤프의 워커부터 반납
+                if psutil.virtual_memory().percent > self.memory_threshold:
+                    self._evict_idle_dumps(keep=1)
+
+    def _fail_pending(self, workers: _DumpWorkers, error: str):
+        """남은 요청을 오류로 완료 (lock 보유 상태에서 호출)"""
+        for future in workers.pending.values():
+            future.set_result({"status": "error", "error": error, "from_cache": False})
+        workers.pending.clear()
+        workers.requests.clear()
+        workers.backlog.clear()
+        workers.dispatched.clear()
+
+    def _reap_dead_workers(self, workers: _DumpWorkers):
+        """응답 없이 죽은 워커(OOM 등)가 처리하던 요청을 실패 처리 (lock 보유 상태에서 호출)"""
+        for worker_pid, process in list(workers.processes.items()):
+            if process.is_alive():
+                continue
+
+            del workers.processes[worker_pid]
+            request_id = workers.running.pop(worker_pid, None)
+            future = self._pop_request(workers, request_id) if request_id else None
+            if future is not None:
+                future.set_result({
+                    "status": "error",
+                    "error": f"Volatility worker terminated unexpectedly (exit code {process.exitcode})",
+                    "from_cache": False
+                })
+
+
+# 전역 워커 풀 인스턴스
+worker_pool = VolatilityWorkerPool(
+    idle_timeout=env_config.get('pool_idle_timeout', 600),
+    memory_threshold=env_config.get('pool_memory_threshold', 90)
+)
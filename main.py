@@ -1,11 +1,14 @@
 import streamlit as st
 import multiprocessing
-import time
 import os
+import time
 from UI.navbar import setup_sidebar
 from UI.mainSection import show_main_content
 from UI.components import show_resource_monitoring
+from UI.result_viewer import show_result_table
 from common.async_manager import analysis_manager
+from common.resource_sampler import resource_sampler
+from UI.config import env_config
 
 
 def main():
@@ -33,9 +36,15 @@ def main():
     dump_path, analysis_mode, selected_category = setup_sidebar()
 
     # 메인 컨텐츠 영역
-    if not dump_path:
+    if st.session_state.get("ioc_query", "").strip():
+        from UI.searchSection import show_search_results
+        show_search_results(st.session_state["ioc_query"])
+    elif not dump_path:
         show_welcome_content()
     else:
+        # 작업 기록에서 끝나지 않은 분석 복원 (새로고침/서버 재시작)
+        analysis_manager.restore_runs(dump_path)
+
         # 실행 중인 분석이 있는지 확인
         check_running_analysis(selected_category if analysis_mode == "🔍 일반 분석" else None)
 
@@ -89,7 +98,8 @@ def show_welcome_content():
 
         with col1:
             st.metric("CPU 코어 수", os.cpu_count())
-            st.metric("현재 CPU 사용률", f"{psutil.cpu_percent(interval=1):.1f}%")
+            cpu_percent, _ = resource_sampler.latest()
+            st.metric("현재 CPU 사용률", f"{cpu_percent:.1f}%")
 
         with col2:
             memory = psutil.virtual_memory()
@@ -118,15 +128,12 @@ def check_running_analysis(selected_category):
         # 분석이 실제로 실행 중
         st.session_state.analysis_running = True
 
-        # 리소스 모니터링 표시
-        show_resource_monitoring(analysis_manager, selected_category)
-
-        # 진행 상황 표시
-        show_analysis_progress(selected_category)
+        # 지금까지 반영된 결과 이벤트 수 기록 (이후 새 결과가 올 때만 페이지 전체 갱신)
+        counts = analysis_manager.get_event_counts(selected_category)
+        st.session_state[f"rendered_results_{selected_category}"] = counts['results']
 
-        # 자동 새로고침
-        time.sleep(2)
-        st.rerun()
+        # 진행 상황 영역만 주기적으로 갱신
+        show_live_progress(selected_category)
     elif ui_running and not actual_running:
         # UI는 실행 중이라고 하는데 실제로는 끝남 - 상태 복원 필요
         print(f"DEBUG: Restoring UI state for {selected_category}")
@@ -148,6 +155,43 @@ def check_running_analysis(selected_category):
         st.rerun()
 
 
+@st.fragment(run_every=env_config['ui_refresh_interval'])
+def show_live_progress(category):
+    """분석 중 진행 상황 영역 (이 영역만 다시 그리고, 플러그인이 끝났을 때만 페이지 전체 갱신)"""
+    counts = analysis_manager.get_event_counts(category)
+    rendered_results = st.session_state.get(f"rendered_results_{category}", 0)
+
+    # 플러그인 결과가 완료됐거나 분석이 끝났으면 결과 탭을 다시 그리도록 전체 갱신
+    # (부분 결과 배치는 아래 실시간 미리보기에서만 갱신)
+    if counts['results'] != rendered_results or not analysis_manager.is_running(category):
+        st.rerun(scope="app")
+
+    # 리소스 모니터링 표시
+    show_resource_monitoring(analysis_manager, category)
+
+    # 진행 상황 표시
+    show_analysis_progress(category)
+
+    # 실행 중인 플러그인의 수신 중인 행
+    show_streaming_previews(category)
+
+
+def show_streaming_previews(category):
+    """실행 중인 플러그인의 부분 결과 미리보기 (진행 상황 영역 안에서 갱신)"""
+    running_jobs = analysis_manager.get_progress(category).get('running_jobs', {})
+    previews = []
+    for plugin in list(running_jobs):
+        partial_df, received_rows, _ = analysis_manager.get_partial_result(category, plugin)
+        if partial_df is not None:
+            previews.append((plugin, partial_df, received_rows))
+
+    for plugin, partial_df, received_rows in previews:
+        with st.expander(f"⏳ `{plugin}` 실행 중: {received_rows:,}개 항목 수신"):
+            if received_rows > len(partial_df):
+                st.caption(f"처음 {len(partial_df):,}개 항목만 미리보기로 표시합니다.")
+            show_result_table(partial_df, key=f"view_stream_{category}_{plugin}")
+
+
 def show_analysis_progress(category):
     """분석 진행 상황 표시"""
     progress_data = analysis_manager.get_progress(category)
@@ -184,8 +228,13 @@ def show_analysis_progress(category):
             with col4:
                 st.metric("총 코어", f"{os.cpu_count()}개")
 
-        # 프로그레스 바
-        st.progress(progress_value, text=f"분석 진행: {completed}/{total}")
+        # 프로그레스 바 (실행 이력 기반 남은 시간 추정)
+        progress_text = f"분석 진행: {completed}/{total}"
+        eta = analysis_manager.get_eta(category)
+        if eta is not None:
+            minutes, seconds = divmod(int(eta), 60)
+            progress_text += f" · 남은 예상 시간 {minutes}분 {seconds:02d}초" if minutes else f" · 남은 예상 시간 {seconds}초"
+        st.progress(progress_value, text=progress_text)
 
         # 현재 상태
         col1, col2 = st.columns([3, 1])
@@ -199,14 +248,26 @@ def show_analysis_progress(category):
                 if last_completed:
                     st.success(f"✅ 최근 완료: **{last_completed}**")
 
+            # 실행 중인 플러그인별 중단 (해당 작업의 프로세스 그룹만 종료)
+            running_jobs = progress_data.get('running_jobs', {})
+            if running_jobs:
+                with st.expander(f"⚙️ 실행 중인 작업 ({len(running_jobs)}개)"):
+                    for plugin, started_at in list(running_jobs.items()):
+                        job_col1, job_col2 = st.columns([4, 1])
+                        with job_col1:
+                            st.caption(f"`{plugin}` · {time.time() - started_at:.0f}초 경과")
+                        with job_col2:
+                            if st.button("⏹️", key=f"cancel_{category}_{plugin}", help="이 플러그인만 중단"):
+                                analysis_manager.cancel_plugin(category, plugin)
+
         with col2:
             # 중단 버튼
             if st.button("⏹️ 분석 중단", key="stop_analysis", type="secondary"):
                 analysis_manager.stop_analysis(category)
                 st.session_state.analysis_running = False
                 st.warning("⚠️ 분석이 중단되었습니다.")
-                # 즉시 새로고침하여 UI 상태 복원
-                st.rerun()
+                # 즉시 페이지 전체를 새로고침하여 UI 상태 복원
+                st.rerun(scope="app")
 
         st.markdown("---")
 
@@ -0,0 +1 @@
+"""헤드리스 실행 도구 (Streamlit 없이 카테고리 분석 실행) - python -m memtool"""
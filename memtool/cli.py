@@ -0,0 +1,248 @@
+import argparse
+import json
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 헤드리스 실행의 실행 키 (스케줄러 이벤트/중단 단위)
+RUN_KEY = "cli"
+EXPORT_FORMATS = ("csv", "parquet", "jsonl")
+BACKENDS = ("subprocess", "inprocess", "pool")
+POLL_INTERVAL = 0.2
+
+# 상대 경로 설정(resources/, cache/, volatility3/)은 저장소 루트 기준
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m memtool",
+                                     description="Streamlit 없이 plugins.json 카테고리 분석 실행")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="카테고리 분석 실행 (결과는 캐시에 저장)")
+    run.add_argument("--dump", required=True, help="메모리 덤프 파일 경로")
+    run.add_argument("--categories", default="all",
+                     help="all 또는 쉼표로 구분한 카테고리 ID/제목 (예: process_analysis,network_analysis)")
+    run.add_argument("--workers", type=int, default=None,
+                     help="동시 실행 작업 수 (기본: MAX_CONCURRENT_JOBS)")
+    run.add_argument("--output", default=None, help="플러그인별 결과 파일과 report.json을 기록할 디렉토리")
+    run.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="결과 파일 형식 (기본: csv)")
+    run.add_argument("--backend", choices=BACKENDS, default=None, help="Volatility 실행 백엔드 (기본: VOL_BACKEND)")
+
+    subparsers.add_parser("list", help="카테고리와 플러그인 목록 출력")
+    return parser
+
+
+def _resolve_categories(spec: str) -> dict:
+    """카테고리 지정을 {제목: 플러그인 목록}으로 변환 (ID, 제목 또는 그 일부 허용)"""
+    from UI.config import plugin_categories, plugin_category_ids
+
+    if spec.strip().lower() == "all":
+        return dict(plugin_categories)
+
+    ids = {title: category_id for category_id, title in plugin_category_ids.items()}
+    selected = {}
+    for name in filter(None, (part.strip() for part in spec.split(","))):
+        title = plugin_category_ids.get(name)
+        if title is None:
+            matches = [candidate for candidate in plugin_categories
+                       if name.lower() in candidate.lower() or name.lower() in ids.get(candidate, "")]
+            if len(matches) != 1:
+                raise ValueError(f"카테고리를 찾을 수 없습니다: {name}" if not matches
+                                 else f"카테고리 지정이 모호합니다: {name} ({', '.join(matches)})")
+            title = matches[0]
+        selected[title] = plugin_categories[title]
+    return selected
+
+
+def _list_categories() -> int:
+    from UI.config import plugin_categories, plugin_category_ids
+    from common.scheduler import _plugin_fields
+
+    ids = {title: category_id for category_id, title in plugin_category_ids.items()}
+    for title, plugins in plugin_categories.items():
+        print(f"{ids.get(title, '-')}  {title} ({len(plugins)}개)")
+        for plugin_data in plugins:
+            _, label, command = _plugin_fields(plugin_data)
+            print(f"    {command:<45} {label}")
+    return 0
+
+
+def _export(df, handle, plugin: str, output_dir: Path, export_format: str):
+    """결과를 출력 디렉토리에 복사 (내보내기 파일은 캐시의 exports에서 재사용)"""
+    from common.exporter import export_result, EXPORT_FORMATS as FORMATS
+
+    if df is None and handle is None:
+        return None
+    exported = export_result(df, export_format, source=handle)
+    target = output_dir / f"{plugin}{FORMATS[export_format][0]}"
+    shutil.copyfile(exported, target)
+    return target
+
+
+def _format_seconds(seconds: float) -> str:
+    return f"{seconds:.1f}s" if seconds < 60 else f"{int(seconds // 60)}m {seconds % 60:.0f}s"
+
+
+def _run(args) -> int:
+    from common.scheduler import job_scheduler, deduplicate_plugins, _plugin_fields
+    from common.cache_manager import simple_cache
+
+    dump_path = str(Path(args.dump).resolve())
+    if not Path(dump_path).is_file():
+        print(f"❌ 덤프 파일을 찾을 수 없습니다: {args.dump}", file=sys.stderr)
+        return 2
+    try:
+        categories = _resolve_categories(args.categories)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    plugins, _ = deduplicate_plugins(categories)
+    if not plugins:
+        print("❌ 실행할 플러그인이 없습니다.", file=sys.stderr)
+        return 2
+
+    output_dir = None
+    if args.output:
+        output_dir = Path(args.output).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    titles = {_plugin_fields(plugin_data)[2]: _plugin_fields(plugin_data)[1] for plugin_data in plugins}
+    cached = {plugin for plugin in titles if simple_cache.has_entry(dump_path, plugin)}
+    workers = job_scheduler.max_concurrency
+    print(f"🧠 {Path(dump_path).name} · {len(categories)}개 카테고리 · {len(plugins)}개 플러그인 "
+          f"(캐시 {len(cached)}개) · 워커 {workers}개")
+
+    result_queue, progress_queue = queue.Queue(), queue.Queue()
+    stop_event = threading.Event()
+    started = time.time()
+    thread = job_scheduler.start_category(dump_path, RUN_KEY, plugins, workers, result_queue, progress_queue,
+                                          stop_event)
+
+    job_started, timings, scheduler_error = {}, {}, None
+    try:
+        while True:
+            while True:
+                try:
+                    event = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event['type'] == 'job_start':
+                    job_started[event['plugin']] = event['started_at']
+                elif event['type'] == 'error':
+                    scheduler_error = event['error']
+
+            try:
+                message = result_queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not thread.is_alive() and result_queue.empty() and progress_queue.empty():
+                    break
+                continue
+            if message['type'] != 'result':
+                continue
+
+            plugin = message['plugin']
+            now = time.time()
+            handle, df, error = message.get('handle'), message.get('df'), message.get('error')
+            rows = (handle or {}).get('rows') or (len(df) if df is not None else 0)
+            status = "cancelled" if message.get('cancelled') else "failed" if error else "ok"
+            timing = {
+                "plugin": plugin,
+                "title": message['title'],
+                "status": status,
+                "cached": plugin in cached,
+                "rows": rows,
+                "seconds": round(now - job_started.get(plugin, now), 3),
+                "error": error
+            }
+
+            if output_dir is not None and status == "ok":
+                try:
+                    target = _export(df, handle, plugin, output_dir, args.format)
+                    timing["output"] = str(target) if target else None
+                except Exception as e:
+                    timing["export_error"] = str(e)
+
+            timings[plugin] = timing
+            mark = {"ok": "✅", "failed": "❌", "cancelled": "⏹️"}[status]
+            detail = f"{rows:,}행" if status == "ok" else (error or "").splitlines()[0][:100] if error else ""
+            print(f"[{len(timings)}/{len(plugins)}] {mark} {plugin} {_format_seconds(timing['seconds'])}"
+                  f"{' (캐시)' if timing['cached'] else ''} {detail}")
+    except KeyboardInterrupt:
+        print("⏹️ 중단 요청 - 실행 중인 vol 프로세스를 종료합니다.", file=sys.stderr)
+        stop_event.set()
+        job_scheduler.cancel(RUN_KEY)
+        thread.join()
+        return 130
+
+    thread.join()
+    elapsed = time.time() - started
+
+    # 처리량 요약 (캐시 적중은 실행 시간에서 제외)
+    executed = [timing for timing in timings.values() if not timing["cached"]]
+    total_rows = sum(timing["rows"] for timing in timings.values())
+    failed = [timing for timing in timings.values() if timing["status"] != "ok"]
+    dump_mb = os.path.getsize(dump_path) / (1024 * 1024)
+    summary = {
+        "dump": dump_path,
+        "categories": list(categories),
+        "workers": workers,
+        "plugins": len(plugins),
+        "completed": len(timings),
+        "executed": len(executed),
+        "cached": len(timings) - len(executed),
+        "failed": len(failed),
+        "elapsed_seconds": round(elapsed, 3),
+        "plugins_per_minute": round(len(timings) / elapsed * 60, 2) if elapsed else 0.0,
+        "rows_per_second": round(total_rows / elapsed, 1) if elapsed else 0.0,
+        "busy_seconds": round(sum(timing["seconds"] for timing in executed), 3),
+        "dump_mb": round(dump_mb, 1)
+    }
+
+    print()
+    print(f"{'플러그인':<45} {'상태':<10} {'행':>10} {'시간':>9}")
+    for timing in sorted(timings.values(), key=lambda timing: timing["seconds"], reverse=True):
+        status = timing["status"] + (" (캐시)" if timing["cached"] else "")
+        print(f"{timing['plugin']:<45} {status:<10} {timing['rows']:>10,} {_format_seconds(timing['seconds']):>9}")
+    print()
+    print(f"⏱️ 총 {_format_seconds(elapsed)} · {summary['plugins_per_minute']} 플러그인/분 · "
+          f"{summary['rows_per_second']:,} 행/초 · 실행 {summary['executed']}개 / 캐시 {summary['cached']}개 / "
+          f"실패 {summary['failed']}개")
+    if summary["executed"] and elapsed:
+        # 작업 시간 합 / (경과 시간 × 워커 수) - 워커가 쉬지 않고 일한 비율
+        print(f"⚙️ 워커 활용률 {summary['busy_seconds'] / (elapsed * workers) * 100:.0f}%")
+    if scheduler_error:
+        print(f"💥 스케줄러 오류: {scheduler_error}", file=sys.stderr)
+
+    if output_dir is not None:
+        report_path = output_dir / "report.json"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "plugins": list(timings.values())}, f, ensure_ascii=False, indent=2)
+        print(f"📄 {report_path}")
+
+    return 1 if failed or scheduler_error or len(timings) < len(plugins) else 0
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    # 설정은 모듈 로드 시 환경 변수에서 읽으므로 import 전에 옵션 반영
+    if getattr(args, "workers", None):
+        os.environ["MAX_CONCURRENT_JOBS"] = str(max(1, args.workers))
+    if getattr(args, "backend", None):
+        os.environ["VOL_BACKEND"] = args.backend
+    if getattr(args, "dump", None):
+        args.dump = str(Path(args.dump).resolve())
+    if getattr(args, "output", None):
+        args.output = str(Path(args.output).resolve())
+    os.chdir(REPO_ROOT)
+    sys.path.insert(0, str(REPO_ROOT))
+
+    if args.command == "list":
+        return _list_categories()
+    return _run(args)
@@ -0,0 +1,8 @@
+import os
+import sys
+from pathlib import Path
+
+# 설정/캐시 경로(resources/, cache/)는 저장소 루트 기준 상대 경로
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.chdir(REPO_ROOT)
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+from common import exporter
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "get_export_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _tree_frame():
+    """windows.pstree 같은 트리/JSON 결과 (리스트/딕셔너리 컬럼)"""
+    return pd.DataFrame([
+        {"PID": 4, "ImageFileName": "System", "__children": [{"PID": 88}], "Info": {"a": 1}},
+        {"PID": 88, "ImageFileName": "smss.exe", "__children": [], "Info": {"a": "x"}},
+    ])
+
+
+@pytest.mark.parametrize("export_format", ["csv", "jsonl", "parquet"])
+def test_export_list_and_dict_columns(export_dir, export_format):
+    path = exporter.export_result(_tree_frame(), export_format)
+    assert path.exists() and path.stat().st_size > 0
+
+
+def test_identity_stable_for_unhashable_values():
+    assert exporter._result_identity(_tree_frame(), None) == exporter._result_identity(_tree_frame(), None)
+    changed = _tree_frame()
+    changed.at[1, "__children"] = [{"PID": 1}]
+    assert exporter._result_identity(changed, None) != exporter._result_identity(_tree_frame(), None)
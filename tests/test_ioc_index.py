@@ -0,0 +1,38 @@
+import pytest
+from common import ioc_index as ioc_module
+from common.cache_manager import SimpleCache
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    cache = SimpleCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(ioc_module, "simple_cache", cache)
+    index = ioc_module.IocIndex(tmp_path / "ioc.db")
+    if not index.available:
+        pytest.skip("SQLite FTS5 not available")
+    dump_path = tmp_path / "memory.raw"
+    dump_path.write_bytes(b"\0" * 4096)
+    return cache, index, str(dump_path)
+
+
+def _index(cache, index, dump_path, plugin, result):
+    cache.save(dump_path, plugin, {"status": "success", "command": plugin, "result": result}, load_frame=False)
+    index._index_entry(cache._get_cache_key(dump_path, plugin), cache._get_dump_key(dump_path), "memory.raw",
+                       plugin, None, "success")
+
+
+def test_text_result_is_indexed(setup):
+    cache, index, dump_path = setup
+    _index(cache, index, dump_path, "windows.mutantscan", {"text_output": "Mutant\nEVILMUTEX held by 1234"})
+
+    hits = index.search("EVILMUTEX")
+    assert [hit["plugin"] for hit in hits] == ["windows.mutantscan"]
+    assert hits[0]["row"] == 1
+
+
+def test_table_result_is_indexed(setup):
+    cache, index, dump_path = setup
+    _index(cache, index, dump_path, "windows.pslist", [{"PID": 1234, "ImageFileName": "evil.exe"}])
+
+    hits = index.search("evil.exe")
+    assert hits and hits[0]["pid"] == "1234"
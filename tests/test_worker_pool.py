@@ -0,0 +1,48 @@
+import multiprocessing
+import os
+import sys
+import time
+import types
+import pytest
+
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="가짜 실행 엔진을 워커에 물려주려면 fork 필요")
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """vol_engine을 PID만 돌려주는 가짜로 바꾼 워커 풀 (덤프당 워커 1개)"""
+    fake = types.ModuleType("common.vol_engine")
+
+    class VolatilitySession:
+        def __init__(self, dump_path, shared_config=None):
+            self.shared_config = {"ready": True}
+
+        def seed(self, config):
+            pass
+
+    def run_volatility_inprocess(dump_path, command, pid=None, session=None):
+        time.sleep(1)
+        return {"status": "success", "result": [{"worker": os.getpid()}], "from_cache": False}
+
+    fake.VolatilitySession = VolatilitySession
+    fake.run_volatility_inprocess = run_volatility_inprocess
+    monkeypatch.setitem(sys.modules, "common.vol_engine", fake)
+
+    from common.worker_pool import VolatilityWorkerPool
+    pool = VolatilityWorkerPool(workers_per_dump=1)
+    dump_path = tmp_path / "memory.raw"
+    dump_path.write_bytes(b"\0" * 4096)
+    yield pool, str(dump_path)
+    pool.shutdown()
+
+
+def test_cancel_queued_request_keeps_warm_worker(pool):
+    pool, dump_path = pool
+    first, queued, last = (pool.submit(dump_path, command) for command in ("a", "b", "c"))
+    time.sleep(0.3)
+
+    assert pool.cancel(queued)
+    assert queued.result(timeout=5).get("cancelled")
+    worker = first.result(timeout=30)["result"][0]["worker"]
+    assert last.result(timeout=30)["result"][0]["worker"] == worker